@@ -0,0 +1,196 @@
+"""
+Alarm helper functions shared by the GUI front-ends.
+Precomputed lookup tables for formatting alarm schedules and next-fire
+time calculation for the alarm monitor.
+"""
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Read-only stand-in for alarms that have never fired
+_NO_TRIGGERS: Mapping[str, bool] = MappingProxyType({})
+
+# Weekday abbreviations, Monday first (matches datetime.weekday())
+DAY_ABBR: Tuple[str, ...] = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _build_days_text() -> List[str]:
+    """Build the display text for every possible weekday bitmask."""
+    table = [
+        ",".join(DAY_ABBR[i] for i in range(7) if mask >> i & 1)
+        for mask in range(128)
+    ]
+    table[0] = "No days"
+    table[127] = "Every day"
+    return table
+
+
+# Display text indexed by weekday bitmask (bit 0 = Monday)
+DAYS_TEXT: List[str] = _build_days_text()
+
+
+# Alarm action flags and their short labels, in display order
+ACTION_KEYS: Tuple[str, ...] = (
+    'play_recording', 'play_mp3', 'pause_autoclicker', 'start_autoclicker', 'click_image'
+)
+ACTION_NAMES: Tuple[str, ...] = ("Rec", "MP3", "Pause", "Start", "Img")
+
+# Display text indexed by action bitmask (bit N = ACTION_KEYS[N])
+ACTIONS_TEXT: Tuple[str, ...] = tuple(
+    "+".join(ACTION_NAMES[i] for i in range(len(ACTION_NAMES)) if mask >> i & 1) or "None"
+    for mask in range(1 << len(ACTION_NAMES))
+)
+
+
+def actions_mask(alarm: Dict[str, Any]) -> int:
+    """
+    Encode an alarm's enabled actions as a bitmask.
+
+    Args:
+        alarm: Alarm dictionary
+
+    Returns:
+        Bitmask with bit N set when ACTION_KEYS[N] is enabled
+    """
+    mask = 0
+    for bit, key in enumerate(ACTION_KEYS):
+        if alarm.get(key, False):
+            mask |= 1 << bit
+    return mask
+
+
+def days_mask(days: Iterable[int]) -> int:
+    """
+    Convert a list of weekday numbers into a bitmask.
+
+    Args:
+        days: Weekday numbers (0 = Monday, 6 = Sunday)
+
+    Returns:
+        Bitmask with bit N set for each selected weekday N
+    """
+    mask = 0
+    for day in days:
+        mask |= 1 << day
+    return mask
+
+
+def alarm_hour_24(alarm: Dict[str, Any]) -> int:
+    """
+    Convert an alarm's 12-hour time to a 24-hour hour.
+
+    Args:
+        alarm: Alarm dictionary with 'hour' and 'am_pm'
+
+    Returns:
+        Hour in 24-hour format (0-23)
+    """
+    hour = alarm['hour']
+    am_pm = alarm['am_pm'] if 'am_pm' in alarm else 'AM'
+    if am_pm == 'PM' and hour != 12:
+        return hour + 12
+    if am_pm == 'AM' and hour == 12:
+        return 0
+    return hour
+
+
+def derive_alarm_fields(alarm: Dict[str, Any]) -> None:
+    """
+    Cache the alarm's time in canonical 24-hour form.
+
+    Stores '_hour24' and '_mod' (minute of day) so the scheduler does not
+    redo the AM/PM conversion, and '_days_mask' so weekday checks are a bit
+    test instead of a list scan. Call after creating or editing an alarm.
+
+    Args:
+        alarm: Alarm dictionary, modified in place
+    """
+    hour24 = alarm_hour_24(alarm)
+    alarm['_hour24'] = hour24
+    alarm['_mod'] = hour24 * 60 + alarm['minute']
+    alarm['_days_mask'] = days_mask(alarm.get('days', ()))
+
+
+def trigger_key(day: date) -> int:
+    """
+    Build the key used in an alarm's 'triggered_today' dictionary.
+
+    Args:
+        day: Date the alarm fired on
+
+    Returns:
+        The date's proleptic ordinal (json writes it as a string key)
+    """
+    return day.toordinal()
+
+
+def prune_trigger_keys(alarm: Dict[str, Any], today: date) -> None:
+    """
+    Normalize an alarm's trigger keys and drop those older than yesterday.
+
+    Keys read back from JSON are strings; they are converted to integer
+    ordinals, including legacy "Y-M-D" keys, so alarms that already fired
+    today under an older format do not fire again.
+
+    Args:
+        alarm: Alarm dictionary, modified in place
+        today: Current date
+    """
+    triggered = alarm.get('triggered_today')
+    if not triggered:
+        return
+
+    today_ord = today.toordinal()
+    for key in list(triggered):
+        if isinstance(key, int):
+            continue
+        value = triggered.pop(key)
+        try:
+            if key.isdigit():
+                key_ord = int(key)
+            else:
+                year, month, day = map(int, key.split('-'))
+                key_ord = date(year, month, day).toordinal()
+        except ValueError:
+            continue
+        triggered[key_ord] = value
+
+    for key_ord in [k for k in triggered if today_ord - k > 1]:
+        del triggered[key_ord]
+
+
+def next_fire_time(alarm: Dict[str, Any], now: datetime) -> Optional[datetime]:
+    """
+    Find the next time an alarm should fire.
+
+    The current minute still counts if the alarm has not fired today yet,
+    so an alarm edited during its own minute triggers immediately.
+
+    Args:
+        alarm: Alarm dictionary
+        now: Current time
+
+    Returns:
+        Datetime of the next trigger, or None if the alarm never fires
+    """
+    if not alarm['enabled'] or 'days' not in alarm or not alarm['days']:
+        return None
+
+    # Bind everything the loop needs once; older alarm entries may lack keys
+    weekdays = alarm['_days_mask'] if '_days_mask' in alarm else days_mask(alarm['days'])
+    triggered = alarm['triggered_today'] if 'triggered_today' in alarm else _NO_TRIGGERS
+    if '_mod' in alarm:
+        hour, minute = divmod(alarm['_mod'], 60)
+    else:
+        hour, minute = alarm_hour_24(alarm), alarm['minute']
+    start = now.replace(second=0, microsecond=0)
+
+    # Eight days covers today's weekday again next week
+    for offset in range(8):
+        fire_at = (start + timedelta(days=offset)).replace(hour=hour, minute=minute)
+        if fire_at < start or not weekdays >> fire_at.weekday() & 1:
+            continue
+        if triggered and triggered.get(trigger_key(fire_at)):
+            continue
+        return fire_at
+    return None
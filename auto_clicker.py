@@ -2,6 +2,7 @@
 Auto clicker playback functionality
 Plays back recorded mouse movements and clicks, with AI-based target detection
 """
+import threading
 import time
 from typing import List, Dict, Any, Optional, Callable
 
@@ -53,18 +54,22 @@ class AutoClicker:
         original_pause = pyautogui.PAUSE
         pyautogui.PAUSE = 0
 
-        last_timestamp: float = 0
         events_executed: int = 0
+        # Events are timed against absolute deadlines from the start, so time spent
+        # executing one event does not push every later event back
+        clock = time.perf_counter
+        start_time = clock()
 
         for i, event in enumerate(events):
             # Skip move events if requested
             if skip_moves and event['type'] == 'move':
                 continue
 
-            # Calculate delay (only if not in instant mode)
-            if not instant and event['timestamp'] > last_timestamp:
-                delay = (event['timestamp'] - last_timestamp) / speed
-                time.sleep(delay)
+            # Wait for the event's deadline (only if not in instant mode)
+            if not instant:
+                delay = start_time + event['timestamp'] / speed - clock()
+                if delay > 0:
+                    time.sleep(delay)
 
             # Execute event
             if event['type'] == 'move':
@@ -84,8 +89,6 @@ class AutoClicker:
                 self.mouse.scroll(event['dx'], event['dy'])
                 events_executed += 1
 
-            last_timestamp = event['timestamp']
-
             # Progress update
             if events_executed > 0 and events_executed % 100 == 0:
                 logger.info(f"Progress: {events_executed} events executed")
@@ -125,7 +128,9 @@ class AutoClicker:
         unlimited: bool = False,
         retry_on_not_found: bool = False,
         stop_flag: Optional[Callable[[], bool]] = None,
-        log_callback: Optional[Callable[[str], None]] = None
+        log_callback: Optional[Callable[[str], None]] = None,
+        stop_event: Optional[threading.Event] = None,
+        auto_confidence: bool = False
     ) -> bool:
         """
         Find and click on a template image using OpenCV matching.
@@ -142,6 +147,10 @@ class AutoClicker:
             retry_on_not_found: If True, keeps retrying when image not found
             stop_flag: A callable that returns True when the process should stop
             log_callback: Optional callback function to log messages to GUI
+            stop_event: Event that is set when the process should stop; waits
+                between searches wake up immediately when it is set
+            auto_confidence: Accept a match that clearly stands out from the
+                runner-up instead of applying the confidence threshold
 
         Returns:
             True if found and action performed, False otherwise
@@ -150,116 +159,130 @@ class AutoClicker:
         successful_iterations: int = 0
         max_iterations: float = float('inf') if unlimited else repeat_count
 
-        while successful_iterations < max_iterations:
-            # Check if we should stop
-            if stop_flag and stop_flag():
-                logger.info("Stopping image click - stop flag set")
-                return False
-            iteration += 1
-
-            logger.info(f"Searching for image: {template_image_path} (iteration {iteration}{'...' if unlimited else f'/{repeat_count}'})")
-
-            # Add small delay before screenshot to prevent rapid capture errors
-            if iteration > 1:
-                time.sleep(0.1)
-
-            # Try to find image with retry on error
-            result: Optional[tuple] = None
-            for retry in range(3):
-                try:
-                    result = self.analyzer.find_image_on_screen(template_image_path, confidence, monitor=monitor)
-                    break  # Success, exit retry loop
-                except Exception as e:
-                    if retry < 2:
-                        logger.warning(f"Error searching for image (attempt {retry + 1}/3): {e}. Retrying...")
-                        time.sleep(0.5)
-                    else:
-                        logger.error(f"Failed to search for image after 3 attempts: {e}")
-                        raise
-
-            if result:
-                x, y, match_confidence = result
-                msg = f"Image found at ({x}, {y}) with confidence {match_confidence:.2f}"
-                logger.info(msg)
-                if log_callback:
-                    log_callback(msg)
-
-                # Adjust coordinates if monitor was specified
-                if monitor is not None:
-                    monitors = self.analyzer.get_monitors()
-                    if monitor > 0 and monitor <= len(monitors):
-                        mon = monitors[monitor - 1]
-                        x += mon['left']
-                        y += mon['top']
-
-                time.sleep(0.5)
-
-                # Perform action based on mode
-                if playback_events:
-                    # Playback recorded mouse movements
-                    msg = "Playing back recorded actions..."
+        # One capture handle serves every search of this run
+        with self.analyzer.capture_session() as sct:
+            while successful_iterations < max_iterations:
+                # Check if we should stop
+                if (stop_flag and stop_flag()) or (stop_event and stop_event.is_set()):
+                    logger.info("Stopping image click - stop flag set")
+                    return False
+                iteration += 1
+
+                logger.info(f"Searching for image: {template_image_path} (iteration {iteration}{'...' if unlimited else f'/{repeat_count}'})")
+
+                # Add small delay before screenshot to prevent rapid capture errors
+                if iteration > 1:
+                    time.sleep(0.1)
+
+                # Try to find image with retry on error
+                result: Optional[tuple] = None
+                for retry in range(3):
+                    try:
+                        result = self.analyzer.find_image_on_screen(
+                            template_image_path, confidence, monitor=monitor, sct=sct,
+                            auto_confidence=auto_confidence
+                        )
+                        break  # Success, exit retry loop
+                    except Exception as e:
+                        if retry < 2:
+                            logger.warning(f"Error searching for image (attempt {retry + 1}/3): {e}. Retrying...")
+                            time.sleep(0.5)
+                        else:
+                            logger.error(f"Failed to search for image after 3 attempts: {e}")
+                            raise
+
+                if result:
+                    x, y, match_confidence = result
+                    msg = f"Image found at ({x}, {y}) with confidence {match_confidence:.2f}"
                     logger.info(msg)
                     if log_callback:
                         log_callback(msg)
-                    # Use normal playback with timing to match original recording duration
-                    self.play_recording(playback_events, speed=playback_speed, skip_moves=False, skip_delay=True, instant=False)
-                else:
-                    # Simple click
-                    self.click_at_position(x, y)
-                    if log_callback and successful_iterations == 0:
-                        log_callback("Clicked on image")
-
-                # Increment successful iterations counter
-                successful_iterations += 1
-
-                # If more iterations to go, wait the interval before searching again
-                if successful_iterations < max_iterations:
-                    if interval > 0:
-                        logger.debug(f"Waiting {interval} seconds before next search...")
-                        time.sleep(interval)
-                    else:
-                        # Add minimum delay to prevent errors from rapid successive searches
-                        time.sleep(0.1)
-                elif successful_iterations >= max_iterations:
-                    logger.info(f"Completed {successful_iterations} successful iterations")
-                    break
-            else:
-                logger.debug(f"Image not found with confidence >= {confidence}")
-
-                # Check if retry mode is enabled
-                if retry_on_not_found:
-                    # Keep retrying - don't increment iteration, just wait and try again
-                    retry_delay = interval if interval > 0 else 2.0
-                    if successful_iterations == 0:
-                        msg = f"Retry mode: Image not found, waiting {retry_delay}s before retrying..."
+
+                    # Adjust coordinates if monitor was specified
+                    if monitor is not None:
+                        monitors = self.analyzer.get_monitors()
+                        if monitor > 0 and monitor <= len(monitors):
+                            mon = monitors[monitor - 1]
+                            x += mon['left']
+                            y += mon['top']
+
+                    time.sleep(0.5)
+
+                    # Perform action based on mode
+                    if playback_events:
+                        # Playback recorded mouse movements
+                        msg = "Playing back recorded actions..."
                         logger.info(msg)
                         if log_callback:
                             log_callback(msg)
+                        # Use normal playback with timing to match original recording duration
+                        self.play_recording(playback_events, speed=playback_speed, skip_moves=False, skip_delay=True, instant=False)
                     else:
-                        msg = f"Image disappeared after {successful_iterations} successful clicks. Waiting {retry_delay}s to search again..."
-                        logger.info(msg)
-                        if log_callback:
-                            log_callback(msg)
-
-                    # Sleep in small chunks to allow stopping
-                    for _ in range(int(retry_delay * 10)):
-                        if stop_flag and stop_flag():
-                            logger.info("Stopping retry - stop flag set")
-                            return False
-                        time.sleep(0.1)
-
-                    # Don't increment iteration counter, keep trying
-                    iteration = 0
-                    continue
+                        # Simple click
+                        self.click_at_position(x, y)
+                        if log_callback and successful_iterations == 0:
+                            log_callback("Clicked on image")
+
+                    # Increment successful iterations counter
+                    successful_iterations += 1
+
+                    # If more iterations to go, wait the interval before searching again
+                    if successful_iterations < max_iterations:
+                        if interval > 0:
+                            logger.debug(f"Waiting {interval} seconds before next search...")
+                            if stop_event is not None:
+                                # Returns early when stopped; the loop head handles it
+                                stop_event.wait(interval)
+                            else:
+                                time.sleep(interval)
+                        else:
+                            # Add minimum delay to prevent errors from rapid successive searches
+                            time.sleep(0.1)
+                    elif successful_iterations >= max_iterations:
+                        logger.info(f"Completed {successful_iterations} successful iterations")
+                        break
                 else:
-                    # Retry not enabled
-                    if iteration == 1:
-                        # First attempt failed and no retry mode
-                        return False
+                    logger.debug(f"Image not found with confidence >= {confidence}")
+
+                    # Check if retry mode is enabled
+                    if retry_on_not_found:
+                        # Keep retrying - don't increment iteration, just wait and try again
+                        retry_delay = interval if interval > 0 else 2.0
+                        if successful_iterations == 0:
+                            msg = f"Retry mode: Image not found, waiting {retry_delay}s before retrying..."
+                            logger.info(msg)
+                            if log_callback:
+                                log_callback(msg)
+                        else:
+                            msg = f"Image disappeared after {successful_iterations} successful clicks. Waiting {retry_delay}s to search again..."
+                            logger.info(msg)
+                            if log_callback:
+                                log_callback(msg)
+
+                        if stop_event is not None:
+                            if stop_event.wait(retry_delay):
+                                logger.info("Stopping retry - stop event set")
+                                return False
+                        else:
+                            # Sleep in small chunks to allow stopping
+                            for _ in range(int(retry_delay * 10)):
+                                if stop_flag and stop_flag():
+                                    logger.info("Stopping retry - stop flag set")
+                                    return False
+                                time.sleep(0.1)
+
+                        # Don't increment iteration counter, keep trying
+                        iteration = 0
+                        continue
                     else:
-                        # Image disappeared during repeats, stop gracefully
-                        logger.info(f"Image no longer found after {successful_iterations} successful iterations")
-                        break
+                        # Retry not enabled
+                        if iteration == 1:
+                            # First attempt failed and no retry mode
+                            return False
+                        else:
+                            # Image disappeared during repeats, stop gracefully
+                            logger.info(f"Image no longer found after {successful_iterations} successful iterations")
+                            break
 
         return successful_iterations > 0
 
@@ -3,17 +3,98 @@ GUI Application for Auto Clicker with Image Template Matching
 """
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import tkinter.font as tkfont
 import threading
+import queue
 import os
 import json
 import time
-from datetime import datetime
-from PIL import Image, ImageTk
-import keyboard
-import pyautogui
-from mouse_recorder import MouseRecorder
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import date, datetime
+from PIL import Image
+from mouse_recorder import RECORDING_FILETYPES, MouseRecorder, read_recording_file
 from auto_clicker import AutoClicker
-from screenshot_analyzer import ScreenshotAnalyzer
+from logging_config import flush_file_logs, get_logger, setup_logging
+from alarm_utils import (
+    ACTIONS_TEXT, DAYS_TEXT, actions_mask, days_mask, derive_alarm_fields,
+    next_fire_time, prune_trigger_keys, trigger_key
+)
+
+# Default screenshot filename, stamped at capture time
+SCREENSHOT_FILENAME_FORMAT = "screenshot_%Y%m%d_%H%M%S.png"
+
+# Module logger; writes autoclicker_log.txt off the Tk thread
+logger = get_logger("gui")
+
+# How often buffered log records are written to the log file
+LOG_FILE_FLUSH_INTERVAL_MS = 1000
+
+# Quiet period before a requested settings save is written to disk
+SETTINGS_SAVE_DELAY_MS = 200
+
+# Widgets that scroll themselves on the mouse wheel; a canvas behind them is left alone
+SELF_SCROLLING_CLASSES = frozenset({"Text", "Listbox", "Treeview"})
+
+# Lines kept in the log widget; older lines are trimmed
+LOG_MAX_LINES = 5000
+
+# How often queued GUI work from worker threads is run on the Tk thread
+GUI_DRAIN_INTERVAL_MS = 50
+
+
+# pygame is imported on first use (or by the startup pre-warm) and kept here
+_pygame = None
+
+
+def _get_pygame():
+    """Import pygame once and return the module"""
+    global _pygame
+    if _pygame is None:
+        import pygame
+        _pygame = pygame
+    return _pygame
+
+
+# Reused encoders: settings are machine-written only, alarms stay readable
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Parsed JSON files by path: (st_mtime_ns, st_size, data)
+_SETTINGS_CACHE = {}
+
+
+def _load_json_cached(path):
+    """Load a JSON file, reusing the parsed copy while the file is unchanged"""
+    st = os.stat(path)
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _cached_json(path):
+    """Return the cached data for path if the file still matches it, else None"""
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    return None
+
+
+def _remember_json(path, data):
+    """Record data as the parsed contents of a file that was just written"""
+    st = os.stat(path)
+    _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
 
 
 class AutoClickerGUI:
@@ -27,23 +108,74 @@ class AutoClickerGUI:
         self.root.minsize(800, 600)
 
         # Initialize components
-        self.recorder = MouseRecorder()
+        # Count updates come from the recorder's thread; see post_event_count
+        self.recorder = MouseRecorder(count_callback=self.post_event_count)
+        self._event_count_pending = False
         self.clicker = AutoClicker()
-        self.analyzer = ScreenshotAnalyzer()
+        # Share the clicker's analyzer so its monitor and template caches serve both
+        self.analyzer = self.clicker.analyzer
 
         # State variables
         self.is_recording = False
         self.current_recording_file = None
         self.loaded_events = []
         self.img_click_running = False  # Flag for stopping image click
+        self._img_stop_event = threading.Event()  # Wakes the image click worker on stop
+        self._img_playback_panel = None  # Playback-mode controls, built on first use
         self.alarms = []  # List of alarm dictionaries
-        self.alarm_monitor_running = False  # Flag for alarm monitoring thread
-        self.alarm_monitor_thread = None  # Thread for monitoring all alarms
+        self.alarm_monitor_running = False  # True while alarms are being monitored
+        self._alarm_after_id = None  # Pending root.after id of the next monitor tick
+        self._alarm_heap = None  # (fire time, alarm index) schedule; None means rebuild
+        self._alarm_cleanup_day = None  # Date trigger keys were last pruned
+        self._alarm_stop_event = threading.Event()  # Set on stop; cuts short image search waits
+        self._alarms_dirty = False  # Trigger state changed but not yet written to disk
+        self._io_queue = queue.Queue()  # (path, payload) snapshots for the file writer thread
+        self._alarm_action_queue = queue.Queue()  # Fired alarms whose actions still have to run
+        self._save_pending_id = None  # after() id of a scheduled settings save
+        self.settings_vars = {}  # Settings key -> Tk variable, registered as widgets are built
+        self.global_hotkeys = True  # Install the system-wide F11/F12 hook; False keeps hotkeys to this window
+        self._global_hotkeys_installed = False
+        self._alarm_dialog = None  # Alarm dialog Toplevel, built on first use and then reused
+        self._populate_alarm_dialog = None  # Loads an alarm into the reused dialog
+        self._recording_cache = {}  # Recording path -> ((mtime_ns, size), events)
+        self._photo_pool = []  # One PhotoImage per monitor, reused across preview refreshes
+        self._photo_keys = []  # Pixel hash of the thumbnail currently in each pooled PhotoImage
+        self._preview_executor = ThreadPoolExecutor(max_workers=1)  # Captures preview thumbnails
+        self._sound_cache = {}  # MP3 path -> ((mtime_ns, size), decoded pygame Sound)
+        self._sound_lock = threading.Lock()
+        # Log lines waiting to be shown in the log widget; bounded because the
+        # widget keeps only LOG_MAX_LINES anyway
+        self._log_buf = deque(maxlen=LOG_MAX_LINES)
+        self._gui_queue = queue.SimpleQueue()  # Callables posted by worker threads for the Tk thread
+        self._last_ts_sec = 0  # Second the cached log timestamp was formatted for
+        self._last_ts_str = ""
         self.alarms_file = "alarms.json"  # Separate file for alarms
 
+        # Shared fonts for the monitor preview, so Tk resolves each font once
+        self._font_title = tkfont.Font(family="Arial", size=14, weight="bold")
+        self._font_frame = tkfont.Font(family="Arial", size=11, weight="bold")
+        self._font_info = tkfont.Font(family="Arial", size=9)
+
+        # One mouse wheel binding for the app, dispatched to the canvas under the pointer
+        self._scroll_canvases = set()
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+
         # Setup GUI
         self.setup_gui()
 
+        # Run queued GUI work and flush the log widget on the Tk thread
+        self.root.after(GUI_DRAIN_INTERVAL_MS, self._drain_gui_queue)
+        self.root.after(LOG_FILE_FLUSH_INTERVAL_MS, self._flush_log_file)
+
+        # Warm optional imports once the window is up, off the Tk thread
+        self.root.after_idle(lambda: threading.Thread(target=self._prewarm_imports, daemon=True).start())
+
+        # Alarm saves are written by a single background thread
+        threading.Thread(target=self._io_worker, daemon=True).start()
+
+        # Alarm actions (audio, playback, image search) run off the Tk thread
+        threading.Thread(target=self._alarm_worker, daemon=True).start()
+
     def setup_gui(self):
         """Setup the GUI layout"""
         # Title - more compact
@@ -139,22 +271,33 @@ class AutoClickerGUI:
         # Apply saved settings after all UI elements are created
         self.apply_saved_settings()
 
-        # Auto-start alarm monitoring if there are enabled alarms
-        self.auto_start_alarm_monitoring()
-
-        # Setup global hotkeys
-        self.setup_hotkeys()
+        # Auto-start alarm monitoring and install global hotkeys once the
+        # window has been drawn, so neither delays the first paint
+        self.root.after_idle(self.auto_start_alarm_monitoring)
+        self.root.after_idle(self.setup_hotkeys)
 
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def setup_hotkeys(self):
-        """Setup global keyboard shortcuts"""
+        """Setup keyboard shortcuts"""
+        if not self.global_hotkeys:
+            # Tk bindings only fire while this window has focus, but need no
+            # system-wide keyboard hook
+            self.root.bind_all("<F11>", lambda event: self.hotkey_start_image_click())
+            self.root.bind_all("<F12>", lambda event: self.hotkey_stop_image_click())
+            self.log("Hotkeys enabled (app window only): F11=Start Image Click, F12=Stop Image Click")
+            return
+
+        # The keyboard module installs a low-level hook so F12 can stop image
+        # click while another window has focus
         try:
+            import keyboard
             # F11 to start image click
             keyboard.add_hotkey('f11', self.hotkey_start_image_click, suppress=False)
             # F12 to stop image click
             keyboard.add_hotkey('f12', self.hotkey_stop_image_click, suppress=False)
+            self._global_hotkeys_installed = True
             self.log("Hotkeys enabled: F11=Start Image Click, F12=Stop Image Click")
         except Exception as e:
             self.log(f"Warning: Could not setup hotkeys: {e}")
@@ -162,26 +305,26 @@ class AutoClickerGUI:
     def hotkey_start_recording(self):
         """Hotkey handler for starting recording"""
         if not self.is_recording:
-            self.root.after(0, self.start_recording)
+            self.post_gui(self.start_recording)
 
     def hotkey_stop_recording(self):
         """Hotkey handler for stopping recording"""
         if self.is_recording:
-            self.root.after(0, self.stop_recording)
+            self.post_gui(self.stop_recording)
 
     def hotkey_start_image_click(self):
         """Hotkey handler for starting image click"""
         if not self.img_click_running:
-            self.root.after(0, self.start_image_click)
+            self.post_gui(self.start_image_click)
 
     def hotkey_stop_image_click(self):
         """Hotkey handler for stopping image click"""
         if self.img_click_running:
-            self.root.after(0, self.stop_image_click)
+            self.post_gui(self.stop_image_click)
 
     def manual_save_settings(self):
         """Manually save settings with user feedback"""
-        self.save_settings()
+        self._save_settings_now()
         self.log("Settings saved successfully!")
         self.update_status("Settings saved")
         # Brief visual feedback
@@ -197,42 +340,34 @@ class AutoClickerGUI:
         self.root.after(2000, lambda: self.update_status("Ready"))
 
     def save_settings(self):
+        """Schedule a settings save, coalescing bursts of requests into one write"""
+        if self._save_pending_id is not None:
+            self.root.after_cancel(self._save_pending_id)
+        self._save_pending_id = self.root.after(SETTINGS_SAVE_DELAY_MS, self._save_settings_now)
+
+    def _save_settings_now(self):
         """Save current settings to file"""
-        settings = {
-            # Playback settings
-            "last_playback_file": self.playback_filename_var.get() if hasattr(self, 'playback_filename_var') else "",
-            "playback_speed": self.speed_var.get() if hasattr(self, 'speed_var') else 1.0,
-            "playback_unlimited": self.playback_unlimited_var.get() if hasattr(self, 'playback_unlimited_var') else False,
-            "playback_repeat": self.playback_repeat_var.get() if hasattr(self, 'playback_repeat_var') else 1,
-            "playback_interval": self.playback_interval_combo.current() if hasattr(self, 'playback_interval_combo') else 0,
-
-            # Image Click settings
-            "template_image": self.template_image_var.get() if hasattr(self, 'template_image_var') else "",
-            "confidence": self.confidence_var.get() if hasattr(self, 'confidence_var') else 0.8,
-            "img_monitor": self.img_monitor_var.get() if hasattr(self, 'img_monitor_var') else 0,
-            "img_action_mode": self.img_action_mode_var.get() if hasattr(self, 'img_action_mode_var') else "click",
-            "img_repeat": self.img_repeat_var.get() if hasattr(self, 'img_repeat_var') else 1,
-            "img_interval": self.img_interval_var.get() if hasattr(self, 'img_interval_var') else 0.0,
-            "img_unlimited": self.img_unlimited_var.get() if hasattr(self, 'img_unlimited_var') else False,
-            "img_retry_on_not_found": self.img_retry_on_not_found_var.get() if hasattr(self, 'img_retry_on_not_found_var') else False,
-            "img_playback_file": self.img_playback_file_var.get() if hasattr(self, 'img_playback_file_var') else "",
-            "img_playback_speed": self.img_playback_speed_var.get() if hasattr(self, 'img_playback_speed_var') else 1.0,
-
-            # Recording settings
-            "record_filename": self.record_filename_var.get() if hasattr(self, 'record_filename_var') else "recording.json",
-
-            # Screenshot settings
-            "screenshot_mode": self.screenshot_mode_var.get() if hasattr(self, 'screenshot_mode_var') else "full",
-            "ss_region_x": self.ss_region_x_var.get() if hasattr(self, 'ss_region_x_var') else "",
-            "ss_region_y": self.ss_region_y_var.get() if hasattr(self, 'ss_region_y_var') else "",
-            "ss_region_w": self.ss_region_w_var.get() if hasattr(self, 'ss_region_w_var') else "",
-            "ss_region_h": self.ss_region_h_var.get() if hasattr(self, 'ss_region_h_var') else "",
-            "screenshot_filename": self.screenshot_filename_var.get() if hasattr(self, 'screenshot_filename_var') else ""
-        }
+        if self._save_pending_id is not None:
+            self.root.after_cancel(self._save_pending_id)
+            self._save_pending_id = None
+
+        settings = {key: var.get() for key, var in self.settings_vars.items()}
+        settings["playback_interval"] = (
+            self.playback_interval_combo.current() if hasattr(self, 'playback_interval_combo') else 0
+        )
+        settings["global_hotkeys"] = self.global_hotkeys
+
+        # Nothing changed since the last load or save; skip the rewrite
+        if settings == _cached_json(self.settings_file):
+            return
 
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Write a temp file and swap it in so a crash never leaves partial JSON
+            tmp_path = self.settings_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(_COMPACT_ENCODER.encode(settings))
+            os.replace(tmp_path, self.settings_file)
+            _remember_json(self.settings_file, settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
 
@@ -242,11 +377,11 @@ class AutoClickerGUI:
             return
 
         try:
-            with open(self.settings_file, 'r') as f:
-                settings = json.load(f)
+            settings = _load_json_cached(self.settings_file)
 
             # Store settings to apply after UI is created
             self.saved_settings = settings
+            self.global_hotkeys = settings.get("global_hotkeys", True)
             # Don't log here - log widget doesn't exist yet
             print("Settings loaded from file")
         except Exception as e:
@@ -261,61 +396,25 @@ class AutoClickerGUI:
         settings = self.saved_settings
 
         try:
-            # Apply playback settings
-            if "last_playback_file" in settings and hasattr(self, 'playback_filename_var'):
-                self.playback_filename_var.set(settings["last_playback_file"])
-            if "playback_speed" in settings and hasattr(self, 'speed_var'):
-                self.speed_var.set(settings["playback_speed"])
-            if "playback_unlimited" in settings and hasattr(self, 'playback_unlimited_var'):
-                self.playback_unlimited_var.set(settings["playback_unlimited"])
-                if hasattr(self, 'toggle_playback_repeat'):
-                    self.toggle_playback_repeat()
-            if "playback_repeat" in settings and hasattr(self, 'playback_repeat_var'):
-                self.playback_repeat_var.set(settings["playback_repeat"])
+            for key, value in settings.items():
+                var = self.settings_vars.get(key)
+                if var is None:
+                    continue
+                # Only write values that differ so unchanged variables do not fire traces
+                try:
+                    unchanged = var.get() == value
+                except tk.TclError:
+                    unchanged = False  # Entry holds text the variable cannot parse
+                if not unchanged:
+                    var.set(value)
             if "playback_interval" in settings and hasattr(self, 'playback_interval_combo'):
                 self.playback_interval_combo.current(settings["playback_interval"])
 
-            # Apply Image Click settings
-            if "template_image" in settings and hasattr(self, 'template_image_var'):
-                self.template_image_var.set(settings["template_image"])
-            if "confidence" in settings and hasattr(self, 'confidence_var'):
-                self.confidence_var.set(settings["confidence"])
-            if "img_monitor" in settings and hasattr(self, 'img_monitor_var'):
-                self.img_monitor_var.set(settings["img_monitor"])
-            if "img_action_mode" in settings and hasattr(self, 'img_action_mode_var'):
-                self.img_action_mode_var.set(settings["img_action_mode"])
-            if "img_repeat" in settings and hasattr(self, 'img_repeat_var'):
-                self.img_repeat_var.set(settings["img_repeat"])
-            if "img_interval" in settings and hasattr(self, 'img_interval_var'):
-                self.img_interval_var.set(settings["img_interval"])
-            if "img_unlimited" in settings and hasattr(self, 'img_unlimited_var'):
-                self.img_unlimited_var.set(settings["img_unlimited"])
-                if hasattr(self, 'toggle_img_repeat_count'):
-                    self.toggle_img_repeat_count()
-            if "img_retry_on_not_found" in settings and hasattr(self, 'img_retry_on_not_found_var'):
-                self.img_retry_on_not_found_var.set(settings["img_retry_on_not_found"])
-            if "img_playback_file" in settings and hasattr(self, 'img_playback_file_var'):
-                self.img_playback_file_var.set(settings["img_playback_file"])
-            if "img_playback_speed" in settings and hasattr(self, 'img_playback_speed_var'):
-                self.img_playback_speed_var.set(settings["img_playback_speed"])
-
-            # Apply recording settings
-            if "record_filename" in settings and hasattr(self, 'record_filename_var'):
-                self.record_filename_var.set(settings["record_filename"])
-
-            # Apply screenshot settings
-            if "screenshot_mode" in settings and hasattr(self, 'screenshot_mode_var'):
-                self.screenshot_mode_var.set(settings["screenshot_mode"])
-            if "ss_region_x" in settings and hasattr(self, 'ss_region_x_var'):
-                self.ss_region_x_var.set(settings["ss_region_x"])
-            if "ss_region_y" in settings and hasattr(self, 'ss_region_y_var'):
-                self.ss_region_y_var.set(settings["ss_region_y"])
-            if "ss_region_w" in settings and hasattr(self, 'ss_region_w_var'):
-                self.ss_region_w_var.set(settings["ss_region_w"])
-            if "ss_region_h" in settings and hasattr(self, 'ss_region_h_var'):
-                self.ss_region_h_var.set(settings["ss_region_h"])
-            if "screenshot_filename" in settings and hasattr(self, 'screenshot_filename_var'):
-                self.screenshot_filename_var.set(settings["screenshot_filename"])
+            # Sync widgets that depend on the restored values
+            if "playback_unlimited" in settings and hasattr(self, 'toggle_playback_repeat'):
+                self.toggle_playback_repeat()
+            if "img_unlimited" in settings and hasattr(self, 'toggle_img_repeat_count'):
+                self.toggle_img_repeat_count()
 
             # Update UI based on loaded settings
             if hasattr(self, 'update_img_action_controls'):
@@ -337,8 +436,11 @@ class AutoClickerGUI:
             return
 
         try:
-            with open(self.alarms_file, 'r') as f:
-                self.alarms = json.load(f)
+            self.alarms = _load_json_cached(self.alarms_file)
+            today = date.today()
+            for alarm in self.alarms:
+                derive_alarm_fields(alarm)
+                prune_trigger_keys(alarm, today)
             print(f"Loaded {len(self.alarms)} alarms from {self.alarms_file}")
             # Refresh alarm list if widget exists
             if hasattr(self, 'alarm_listbox'):
@@ -348,23 +450,56 @@ class AutoClickerGUI:
             self.alarms = []
 
     def save_alarms(self):
-        """Save alarms to separate alarms.json file"""
-        try:
-            with open(self.alarms_file, 'w') as f:
-                json.dump(self.alarms, f, indent=2)
-            print(f"Saved {len(self.alarms)} alarms to {self.alarms_file}")
-        except Exception as e:
-            print(f"Error saving alarms: {e}")
+        """Queue alarms.json for writing and reschedule a running monitor"""
+        self._queue_alarms_write()
+        # Every alarm edit ends here, so rebuild the monitor's schedule
+        self._alarm_heap = None
+        if self.alarm_monitor_running:
+            self._schedule_alarm_tick(0)
+
+    def _queue_alarms_write(self):
+        """Queue a snapshot of the alarms for the writer thread"""
+        # Copy each alarm so later edits cannot change the snapshot mid-write;
+        # underscore keys are scheduler-only fields (derive_alarm_fields) and stay out of the file
+        snapshot = []
+        for alarm in self.alarms:
+            saved = {key: value for key, value in alarm.items() if not key.startswith('_')}
+            if 'triggered_today' in saved:
+                saved['triggered_today'] = dict(saved['triggered_today'])
+            snapshot.append(saved)
+        self._alarms_dirty = False
+        self._io_queue.put((self.alarms_file, snapshot))
+
+    def _io_worker(self):
+        """Write queued snapshots to disk, one at a time, until a None sentinel"""
+        while True:
+            item = self._io_queue.get()
+            try:
+                if item is None:
+                    return
+                path, payload = item
+                tmp_path = path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(_PRETTY_ENCODER.encode(payload))
+                os.replace(tmp_path, path)
+                _remember_json(path, payload)
+                print(f"Saved {len(payload)} alarms to {path}")
+            except Exception as e:
+                # Let the monitor or on_closing try again
+                self._alarms_dirty = True
+                print(f"Error saving alarms: {e}")
+            finally:
+                self._io_queue.task_done()
 
     def auto_start_alarm_monitoring(self):
         """Automatically start alarm monitoring if there are enabled alarms"""
         if not self.alarms:
             return
 
-        enabled_count = sum(1 for alarm in self.alarms if alarm['enabled'])
-        if enabled_count > 0:
+        if any(alarm['enabled'] for alarm in self.alarms):
             # Start monitoring without showing any messages
             self.start_alarm_monitor()
+            enabled_count = sum(1 for alarm in self.alarms if alarm['enabled'])
             print(f"Auto-started alarm monitoring with {enabled_count} enabled alarms")
 
     def find_and_click_image(self, image_path, confidence=0.8, monitor=None, max_retries=-1, retry_interval=2.0):
@@ -390,48 +525,48 @@ class AutoClickerGUI:
             image_name = os.path.basename(image_path)
             self.log(f"Searching for image: {image_name}")
 
-            while (max_retries == -1 or attempt < max_retries) and self.alarm_monitor_running:
-                try:
-                    # Find the image on screen
-                    result = self.analyzer.find_image_on_screen(image_path, confidence, monitor)
-
-                    if result:
-                        x, y, match_confidence = result
-
-                        # Adjust coordinates if monitor was specified
-                        if monitor is not None:
-                            monitors = self.analyzer.get_monitors()
-                            if monitor > 0 and monitor <= len(monitors):
-                                mon = monitors[monitor - 1]
-                                x += mon['left']
-                                y += mon['top']
-                                self.log(f"Adjusted coordinates for monitor {monitor}: ({x}, {y})")
-
-                        # Move mouse to the position and click
-                        pyautogui.moveTo(x, y, duration=0.2)
-                        pyautogui.click()
-                        self.log(f"Image found and clicked at ({x}, {y}) with confidence {match_confidence:.2f}")
-                        return True
-                    else:
-                        attempt += 1
-                        if attempt == 1:
-                            self.log(f"Image not found, retrying every {retry_interval}s until found...")
-                        elif attempt % 10 == 0:  # Log every 10 attempts to avoid spam
-                            self.log(f"Still searching for {image_name}... (attempt {attempt})")
-
-                        # Wait before retrying (check alarm_monitor_running during sleep)
-                        for _ in range(int(retry_interval * 10)):
-                            if not self.alarm_monitor_running:
+            # One capture handle serves every retry
+            with self.analyzer.capture_session() as sct:
+                while (max_retries == -1 or attempt < max_retries) and self.alarm_monitor_running:
+                    try:
+                        # Find the image on screen
+                        result = self.analyzer.find_image_on_screen(image_path, confidence, monitor, sct=sct)
+
+                        if result:
+                            x, y, match_confidence = result
+
+                            # Adjust coordinates if monitor was specified
+                            if monitor is not None:
+                                monitors = self.analyzer.get_monitors()
+                                if monitor > 0 and monitor <= len(monitors):
+                                    mon = monitors[monitor - 1]
+                                    x += mon['left']
+                                    y += mon['top']
+                                    self.log(f"Adjusted coordinates for monitor {monitor}: ({x}, {y})")
+
+                            # Jump straight to the target and click; no tweened move
+                            self.clicker.click_at_position(x, y)
+                            self.log(f"Image found and clicked at ({x}, {y}) with confidence {match_confidence:.2f}")
+                            return True
+                        else:
+                            attempt += 1
+                            if attempt == 1:
+                                self.log(f"Image not found, retrying every {retry_interval}s until found...")
+                            elif attempt % 10 == 0:  # Log every 10 attempts to avoid spam
+                                self.log(f"Still searching for {image_name}... (attempt {attempt})")
+
+                            # Wait before retrying; stopping the monitor ends the wait at once
+                            if self._alarm_stop_event.wait(retry_interval):
                                 self.log(f"Image search stopped for: {image_name}")
                                 return False
-                            time.sleep(0.1)
 
-                except Exception as search_error:
-                    self.log(f"Error during image search (attempt {attempt}): {search_error}")
-                    time.sleep(retry_interval)
-                    attempt += 1
+                    except Exception as search_error:
+                        self.log(f"Error during image search (attempt {attempt}): {search_error}")
+                        attempt += 1
+                        if self._alarm_stop_event.wait(retry_interval):
+                            return False
 
-            self.log(f"Max retries ({max_retries}) reached for image: {image_name}")
+                self.log(f"Max retries ({max_retries}) reached for image: {image_name}")
             return False
 
         except Exception as e:
@@ -441,13 +576,20 @@ class AutoClickerGUI:
     def on_closing(self):
         """Handle window closing"""
         # Save settings before closing
-        self.save_settings()
+        self._save_settings_now()
+        if self._alarms_dirty:
+            self.save_alarms()
+        # Let the writer finish queued saves before the process exits
+        self._io_queue.put(None)
+        self._io_queue.join()
 
-        try:
-            # Unhook all keyboard hotkeys
-            keyboard.unhook_all()
-        except:
-            pass
+        if self._global_hotkeys_installed:
+            try:
+                # Unhook all keyboard hotkeys
+                import keyboard
+                keyboard.unhook_all()
+            except:
+                pass
         self.root.destroy()
 
     def create_scrollable_tab(self, tab_name):
@@ -482,22 +624,8 @@ class AutoClickerGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        # Bind to enter/leave events to enable scrolling when mouse is over the tab
-        def _bind_to_mousewheel(event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        def _unbind_from_mousewheel(event):
-            canvas.unbind_all("<MouseWheel>")
-
-        # Bind when mouse enters the canvas area
-        canvas.bind('<Enter>', _bind_to_mousewheel)
-        canvas.bind('<Leave>', _unbind_from_mousewheel)
-        scrollable_frame.bind('<Enter>', _bind_to_mousewheel)
-        scrollable_frame.bind('<Leave>', _unbind_from_mousewheel)
+        # Enable mouse wheel scrolling when the pointer is over the tab
+        self.register_scroll_canvas(canvas)
 
         # Make scrollable frame expand to fill canvas width
         def _configure_canvas(event):
@@ -602,6 +730,7 @@ class AutoClickerGUI:
         filename_frame.pack(fill=tk.X, pady=3)
 
         self.record_filename_var = tk.StringVar(value="recording.json")
+        self.settings_vars["record_filename"] = self.record_filename_var
         filename_entry = tk.Entry(
             filename_frame,
             textvariable=self.record_filename_var,
@@ -656,6 +785,7 @@ class AutoClickerGUI:
         file_frame.pack(fill=tk.X, pady=3)
 
         self.playback_filename_var = tk.StringVar()
+        self.settings_vars["last_playback_file"] = self.playback_filename_var
         filename_entry = tk.Entry(
             file_frame,
             textvariable=self.playback_filename_var,
@@ -707,6 +837,7 @@ class AutoClickerGUI:
         tk.Label(speed_frame, text="Playback Speed:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
 
         self.speed_var = tk.DoubleVar(value=1.0)
+        self.settings_vars["playback_speed"] = self.speed_var
         speed_scale = tk.Scale(
             speed_frame,
             from_=0.1,
@@ -721,7 +852,7 @@ class AutoClickerGUI:
         self.speed_label = tk.Label(speed_frame, text="1.0x", font=("Segoe UI", 9, "bold"))
         self.speed_label.pack(side=tk.LEFT)
 
-        self.speed_var.trace('w', lambda *args: self.speed_label.config(text=f"{self.speed_var.get():.1f}x"))
+        self.speed_var.trace_add("write", self._on_speed_changed)
 
         # Repeat Settings
         repeat_frame = tk.LabelFrame(content, text="Repeat Settings", padx=8, pady=6, font=("Segoe UI", 9))
@@ -729,6 +860,7 @@ class AutoClickerGUI:
 
         # Unlimited repeats checkbox
         self.playback_unlimited_var = tk.BooleanVar(value=False)
+        self.settings_vars["playback_unlimited"] = self.playback_unlimited_var
         unlimited_cb = tk.Checkbutton(
             repeat_frame,
             text="∞ Repeat Continuously (until stopped)",
@@ -746,6 +878,7 @@ class AutoClickerGUI:
         tk.Label(count_frame, text="Repeat Count:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
         
         self.playback_repeat_var = tk.IntVar(value=1)
+        self.settings_vars["playback_repeat"] = self.playback_repeat_var
         self.playback_repeat_spinbox = tk.Spinbox(
             count_frame,
             from_=1,
@@ -923,6 +1056,7 @@ class AutoClickerGUI:
         file_frame.pack(fill=tk.X, pady=5)
 
         self.template_image_var = tk.StringVar()
+        self.settings_vars["template_image"] = self.template_image_var
         filename_entry = tk.Entry(
             file_frame,
             textvariable=self.template_image_var,
@@ -953,6 +1087,7 @@ class AutoClickerGUI:
         ).pack(side=tk.LEFT)
 
         self.confidence_var = tk.DoubleVar(value=0.8)
+        self.settings_vars["confidence"] = self.confidence_var
         confidence_scale = tk.Scale(
             conf_slider_frame,
             from_=0.5,
@@ -971,9 +1106,17 @@ class AutoClickerGUI:
         )
         self.confidence_label.pack(side=tk.LEFT)
 
-        self.confidence_var.trace('w', lambda *args: self.confidence_label.config(
-            text=f"{self.confidence_var.get():.2f}"
-        ))
+        self.confidence_var.trace_add("write", self._on_confidence_changed)
+
+        # Auto-tune: judge a match by how clearly it beats the runner-up
+        self.img_auto_confidence_var = tk.BooleanVar(value=False)
+        self.settings_vars["img_auto_confidence"] = self.img_auto_confidence_var
+        tk.Checkbutton(
+            confidence_frame,
+            text="Auto-tune (accept a match that clearly stands out, ignoring the threshold)",
+            variable=self.img_auto_confidence_var,
+            font=("Arial", 9)
+        ).pack(anchor=tk.W)
 
         tk.Label(
             confidence_frame,
@@ -993,17 +1136,11 @@ class AutoClickerGUI:
             font=("Arial", 9)
         ).pack(anchor=tk.W, pady=(0, 5))
 
-        # Get available monitors
-        try:
-            monitors = self.analyzer.get_monitors()
-            monitor_count = len(monitors)
-        except:
-            monitor_count = 1
-
         monitor_select_frame = tk.Frame(img_monitor_frame)
         monitor_select_frame.pack(fill=tk.X, pady=5)
 
         self.img_monitor_var = tk.IntVar(value=0)
+        self.settings_vars["img_monitor"] = self.img_monitor_var
 
         tk.Radiobutton(
             monitor_select_frame,
@@ -1013,39 +1150,24 @@ class AutoClickerGUI:
             font=("Arial", 9)
         ).pack(side=tk.LEFT, padx=5)
 
-        for i in range(monitor_count):
-            tk.Radiobutton(
-                monitor_select_frame,
-                text=f"Monitor {i + 1}",
-                variable=self.img_monitor_var,
-                value=i + 1,
-                font=("Arial", 9)
-            ).pack(side=tk.LEFT, padx=5)
-
-        # Preview button
-        if monitor_count > 1:
-            preview_btn = tk.Button(
-                monitor_select_frame,
-                text="👁 Preview Monitors",
-                command=self.show_monitor_preview,
-                bg="#16a085",
-                fg="white",
-                font=("Arial", 9, "bold"),
-                padx=10,
-                pady=5,
-                cursor="hand2"
-            )
-            preview_btn.pack(side=tk.LEFT, padx=10)
+        # Enumerate monitors off the Tk thread; their buttons are added when it finishes
+        future = self._preview_executor.submit(self.analyzer.get_monitors)
+        future.add_done_callback(
+            lambda f: self.post_gui(self._add_monitor_radios, monitor_select_frame, f)
+        )
 
         # Action Mode Selection
         action_mode_frame = tk.LabelFrame(content, text="Action When Found", padx=12, pady=12, font=("Segoe UI", 9))
         action_mode_frame.pack(fill=tk.X, padx=15, pady=8)
 
         self.img_action_mode_var = tk.StringVar(value="click")
+        self.settings_vars["img_action_mode"] = self.img_action_mode_var
 
         # Create playback variables here so they exist before update_img_action_controls is called
         self.img_playback_file_var = tk.StringVar()
+        self.settings_vars["img_playback_file"] = self.img_playback_file_var
         self.img_playback_speed_var = tk.DoubleVar(value=1.0)
+        self.settings_vars["img_playback_speed"] = self.img_playback_speed_var
 
         tk.Label(
             action_mode_frame,
@@ -1091,6 +1213,7 @@ class AutoClickerGUI:
 
         # Unlimited checkbox
         self.img_unlimited_var = tk.BooleanVar(value=False)
+        self.settings_vars["img_unlimited"] = self.img_unlimited_var
         unlimited_check = tk.Checkbutton(
             repeat_frame,
             text="♾️ Unlimited Repeats (runs until stopped or image not found)",
@@ -1103,6 +1226,7 @@ class AutoClickerGUI:
 
         # Keep retrying checkbox
         self.img_retry_on_not_found_var = tk.BooleanVar(value=False)
+        self.settings_vars["img_retry_on_not_found"] = self.img_retry_on_not_found_var
         retry_check = tk.Checkbutton(
             repeat_frame,
             text="🔄 Keep Retrying if Image Not Found (doesn't stop, waits and retries)",
@@ -1118,6 +1242,7 @@ class AutoClickerGUI:
         # Repeat count
         tk.Label(repeat_controls, text="Repeat Count:", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
         self.img_repeat_var = tk.IntVar(value=1)
+        self.settings_vars["img_repeat"] = self.img_repeat_var
         self.img_repeat_spinbox = tk.Spinbox(
             repeat_controls,
             from_=1,
@@ -1131,6 +1256,7 @@ class AutoClickerGUI:
         # Interval
         tk.Label(repeat_controls, text="Interval (seconds):", font=("Arial", 9)).pack(side=tk.LEFT, padx=(20, 5))
         self.img_interval_var = tk.DoubleVar(value=0.0)
+        self.settings_vars["img_interval"] = self.img_interval_var
         tk.Spinbox(
             repeat_controls,
             from_=0.0,
@@ -1171,6 +1297,7 @@ class AutoClickerGUI:
 
         # Full screen or region
         self.screenshot_mode_var = tk.StringVar(value="full")
+        self.settings_vars["screenshot_mode"] = self.screenshot_mode_var
 
         tk.Radiobutton(
             options_frame,
@@ -1193,9 +1320,13 @@ class AutoClickerGUI:
         region_frame.pack(fill=tk.X, pady=10)
 
         self.ss_region_x_var = tk.StringVar()
+        self.settings_vars["ss_region_x"] = self.ss_region_x_var
         self.ss_region_y_var = tk.StringVar()
+        self.settings_vars["ss_region_y"] = self.ss_region_y_var
         self.ss_region_w_var = tk.StringVar()
+        self.settings_vars["ss_region_w"] = self.ss_region_w_var
         self.ss_region_h_var = tk.StringVar()
+        self.settings_vars["ss_region_h"] = self.ss_region_h_var
 
         for label, var in [("X:", self.ss_region_x_var), ("Y:", self.ss_region_y_var),
                            ("Width:", self.ss_region_w_var), ("Height:", self.ss_region_h_var)]:
@@ -1211,9 +1342,8 @@ class AutoClickerGUI:
         file_frame = tk.Frame(save_frame)
         file_frame.pack(fill=tk.X, pady=5)
 
-        self.screenshot_filename_var = tk.StringVar(
-            value=f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        )
+        self.screenshot_filename_var = tk.StringVar(value="")
+        self.settings_vars["screenshot_filename"] = self.screenshot_filename_var
         filename_entry = tk.Entry(
             file_frame,
             textvariable=self.screenshot_filename_var,
@@ -1229,6 +1359,13 @@ class AutoClickerGUI:
         )
         browse_btn.pack(side=tk.LEFT)
 
+        tk.Label(
+            save_frame,
+            text="Leave blank to auto-generate a timestamped name at capture time",
+            font=("Arial", 8),
+            fg="gray"
+        ).pack(anchor=tk.W)
+
         # Capture button
         action_frame = tk.Frame(content)
         action_frame.pack(pady=20)
@@ -1259,7 +1396,7 @@ class AutoClickerGUI:
         self.log("Recording started")
         self.update_status("Recording in progress...")
 
-        # Update event count periodically
+        # The recorder pushes count updates through count_callback while recording
         self.update_event_count()
 
     def stop_recording(self):
@@ -1271,22 +1408,25 @@ class AutoClickerGUI:
         self.stop_record_btn.config(state=tk.DISABLED)
         self.record_status_label.config(text="⚫ Not Recording", fg="gray")
 
+        self.update_event_count()
         self.log(f"Recording stopped. Captured {len(events)} events")
         self.update_status("Recording stopped")
 
+    def post_event_count(self, count):
+        """Queue an event count label refresh from the recorder's thread, at most one at a time"""
+        if not self._event_count_pending:
+            self._event_count_pending = True
+            self.post_gui(self.update_event_count)
+
     def update_event_count(self):
         """Update the event count label"""
-        if self.is_recording:
-            count = len(self.recorder.events)
-            self.event_count_label.config(text=f"Events recorded: {count}")
-            self.root.after(100, self.update_event_count)
-        else:
-            count = len(self.recorder.events)
-            self.event_count_label.config(text=f"Events recorded: {count}")
+        self._event_count_pending = False
+        count = self.recorder.event_count
+        self.event_count_label.config(text=f"Events recorded: {count}")
 
     def save_recording(self):
         """Save the current recording"""
-        if not self.recorder.events:
+        if not self.recorder.event_count:
             messagebox.showwarning("No Recording", "No events to save. Please record something first.")
             return
 
@@ -1298,7 +1438,7 @@ class AutoClickerGUI:
         try:
             # Save with all events - no optimization needed since timing is preserved
             self.recorder.save_recording(filename, optimize=False)
-            self.log(f"Recording saved to {filename} ({len(self.recorder.events)} events)")
+            self.log(f"Recording saved to {filename} ({self.recorder.event_count} events)")
             messagebox.showinfo("Success", f"Recording saved to {filename}")
         except Exception as e:
             self.log(f"Error saving recording: {e}")
@@ -1308,7 +1448,7 @@ class AutoClickerGUI:
         """Browse for save location"""
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=RECORDING_FILETYPES
         )
         if filename:
             self.record_filename_var.set(filename)
@@ -1317,7 +1457,7 @@ class AutoClickerGUI:
     def browse_load_file(self):
         """Browse for recording file"""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=RECORDING_FILETYPES
         )
         if filename:
             self.playback_filename_var.set(filename)
@@ -1329,16 +1469,30 @@ class AutoClickerGUI:
             messagebox.showerror("Error", "Please select a file")
             return
 
-        try:
-            self.loaded_events = self.recorder.load_recording(filename)
-            self.loaded_info_label.config(
-                text=f"✅ Loaded {len(self.loaded_events)} events",
-                fg="#27ae60"
-            )
-            self.log(f"Loaded recording from {filename}")
-        except Exception as e:
-            self.log(f"Error loading recording: {e}")
-            messagebox.showerror("Error", f"Failed to load recording: {e}")
+        # Parse off the Tk thread so a large recording does not freeze the window
+        def load_thread():
+            try:
+                events = self.recorder.load_recording(filename)
+            except Exception as e:
+                self.log(f"Error loading recording: {e}")
+                self.post_gui(messagebox.showerror, "Error", f"Failed to load recording: {e}")
+                return
+            self.post_gui(self._show_loaded_recording, filename, events)
+
+        threading.Thread(target=load_thread, daemon=True).start()
+
+    def _show_loaded_recording(self, filename, events):
+        """Make a freshly parsed recording the loaded one (runs on the Tk thread)"""
+        self.loaded_events = events
+        self.loaded_info_label.config(
+            text=f"✅ Loaded {len(events)} events",
+            fg="#27ae60"
+        )
+        self.log(f"Loaded recording from {filename}")
+
+    def _on_speed_changed(self, *_):
+        """Show the playback speed next to its slider"""
+        self.speed_label.config(text=f"{self.speed_var.get():.1f}x")
 
     def toggle_playback_repeat(self):
         """Enable/disable repeat count spinbox based on unlimited checkbox"""
@@ -1385,9 +1539,9 @@ class AutoClickerGUI:
                     else:
                         status = f"Playing... ({play_count}/{repeat_count})"
                     
-                    self.root.after(0, lambda s=status: self.playback_status_label.config(text=s, fg="blue"))
-                    self.root.after(0, lambda: self.log(f"Playback #{play_count} at {speed}x speed..."))
-                    self.root.after(0, lambda: self.update_status(f"Playing back recording..."))
+                    self.post_gui(lambda s=status: self.playback_status_label.config(text=s, fg="blue"))
+                    self.log(f"Playback #{play_count} at {speed}x speed...")
+                    self.post_gui(lambda: self.update_status(f"Playing back recording..."))
                     
                     # Play the recording
                     self.clicker.play_recording(self.loaded_events, speed=speed)
@@ -1403,9 +1557,9 @@ class AutoClickerGUI:
                     # Wait for interval if there's another repeat coming
                     if self.playback_running and (unlimited or play_count < repeat_count):
                         if interval > 0:
-                            self.root.after(0, lambda: self.playback_status_label.config(
+                            self.post_gui(lambda: self.playback_status_label.config(
                                 text=f"Waiting {interval}s before next play...", fg="gray"))
-                            self.root.after(0, lambda i=interval: self.log(f"Waiting {i} seconds..."))
+                            self.log(f"Waiting {interval} seconds...")
                             
                             # Wait in small increments so we can stop
                             for _ in range(int(interval)):
@@ -1417,18 +1571,18 @@ class AutoClickerGUI:
                                 break
                 
                 # Done
-                self.root.after(0, lambda: self.log(f"Playback completed! Total plays: {play_count}"))
-                self.root.after(0, lambda: self.playback_status_label.config(
+                self.log(f"Playback completed! Total plays: {play_count}")
+                self.post_gui(lambda: self.playback_status_label.config(
                     text=f"Completed {play_count} play(s)", fg="green"))
-                self.root.after(0, lambda: self.update_status("Playback completed"))
+                self.post_gui(lambda: self.update_status("Playback completed"))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.log(f"Error during playback: {e}"))
-                self.root.after(0, lambda: self.playback_status_label.config(text="Error!", fg="red"))
+                self.log(f"Error during playback: {e}")
+                self.post_gui(lambda: self.playback_status_label.config(text="Error!", fg="red"))
             finally:
                 self.playback_running = False
-                self.root.after(0, lambda: self.playback_play_btn.config(state=tk.NORMAL))
-                self.root.after(0, lambda: self.playback_stop_btn.config(state=tk.DISABLED))
+                self.post_gui(lambda: self.playback_play_btn.config(state=tk.NORMAL))
+                self.post_gui(lambda: self.playback_stop_btn.config(state=tk.DISABLED))
 
         threading.Thread(target=playback_thread, daemon=True).start()
 
@@ -1444,63 +1598,103 @@ class AutoClickerGUI:
         if filename:
             self.template_image_var.set(filename)
 
-    def update_img_action_controls(self):
-        """Update the action controls based on selected mode"""
-        # Clear existing controls
-        for widget in self.img_action_controls_frame.winfo_children():
-            widget.destroy()
+    def _on_confidence_changed(self, *_):
+        """Show the confidence threshold next to its slider"""
+        self.confidence_label.config(text=f"{self.confidence_var.get():.2f}")
 
-        mode = self.img_action_mode_var.get()
+    def _add_monitor_radios(self, frame, future):
+        """Add a radio button per monitor, and the preview button if there are several"""
+        try:
+            monitor_count = len(future.result())
+        except Exception:
+            monitor_count = 1
 
-        if mode == "playback":
-            # Show recording file selection
-            tk.Label(
-                self.img_action_controls_frame,
-                text="Select recording to play when image is found:",
+        for i in range(monitor_count):
+            tk.Radiobutton(
+                frame,
+                text=f"Monitor {i + 1}",
+                variable=self.img_monitor_var,
+                value=i + 1,
                 font=("Arial", 9)
-            ).pack(anchor=tk.W, pady=(0, 5))
-
-            file_frame = tk.Frame(self.img_action_controls_frame)
-            file_frame.pack(fill=tk.X, pady=5)
-
-            # Use existing variable instead of creating new one
-            filename_entry = tk.Entry(
-                file_frame,
-                textvariable=self.img_playback_file_var,
-                font=("Arial", 9),
-                state='readonly'
-            )
-            filename_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+            ).pack(side=tk.LEFT, padx=5)
 
-            browse_btn = tk.Button(
-                file_frame,
-                text="Browse...",
-                command=self.browse_playback_file_for_image,
+        # Preview button
+        if monitor_count > 1:
+            preview_btn = tk.Button(
+                frame,
+                text="👁 Preview Monitors",
+                command=self.show_monitor_preview,
+                bg="#16a085",
+                fg="white",
+                font=("Arial", 9, "bold"),
+                padx=10,
+                pady=5,
                 cursor="hand2"
             )
-            browse_btn.pack(side=tk.LEFT)
-
-            # Playback speed
-            speed_frame = tk.Frame(self.img_action_controls_frame)
-            speed_frame.pack(fill=tk.X, pady=5)
-
-            tk.Label(speed_frame, text="Playback Speed:", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
-            # Use existing variable instead of creating new one
-            tk.Spinbox(
-                speed_frame,
-                from_=0.1,
-                to=5.0,
-                increment=0.1,
-                textvariable=self.img_playback_speed_var,
-                width=8,
-                font=("Arial", 9)
-            ).pack(side=tk.LEFT, padx=5)
-            tk.Label(speed_frame, text="x", font=("Arial", 9)).pack(side=tk.LEFT)
+            preview_btn.pack(side=tk.LEFT, padx=10)
+
+    def update_img_action_controls(self):
+        """Show the controls for the selected action mode"""
+        if self.img_action_mode_var.get() == "playback":
+            # Built on first use and kept; switching modes only packs or forgets it
+            if self._img_playback_panel is None:
+                self._img_playback_panel = self._build_img_playback_panel()
+            self._img_playback_panel.pack(fill=tk.X)
+        elif self._img_playback_panel is not None:
+            self._img_playback_panel.pack_forget()
+
+    def _build_img_playback_panel(self):
+        """Build the recording file and speed controls for playback mode"""
+        panel = tk.Frame(self.img_action_controls_frame)
+
+        tk.Label(
+            panel,
+            text="Select recording to play when image is found:",
+            font=("Arial", 9)
+        ).pack(anchor=tk.W, pady=(0, 5))
+
+        file_frame = tk.Frame(panel)
+        file_frame.pack(fill=tk.X, pady=5)
+
+        # Use existing variable instead of creating new one
+        filename_entry = tk.Entry(
+            file_frame,
+            textvariable=self.img_playback_file_var,
+            font=("Arial", 9),
+            state='readonly'
+        )
+        filename_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+
+        browse_btn = tk.Button(
+            file_frame,
+            text="Browse...",
+            command=self.browse_playback_file_for_image,
+            cursor="hand2"
+        )
+        browse_btn.pack(side=tk.LEFT)
+
+        # Playback speed
+        speed_frame = tk.Frame(panel)
+        speed_frame.pack(fill=tk.X, pady=5)
+
+        tk.Label(speed_frame, text="Playback Speed:", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        # Use existing variable instead of creating new one
+        tk.Spinbox(
+            speed_frame,
+            from_=0.1,
+            to=5.0,
+            increment=0.1,
+            textvariable=self.img_playback_speed_var,
+            width=8,
+            font=("Arial", 9)
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Label(speed_frame, text="x", font=("Arial", 9)).pack(side=tk.LEFT)
+        return panel
 
     def browse_playback_file_for_image(self):
         """Browse for recording file to play when image is found"""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=RECORDING_FILETYPES
         )
         if filename:
             self.img_playback_file_var.set(filename)
@@ -1523,8 +1717,10 @@ class AutoClickerGUI:
         self.start_img_click_btn.config(state=tk.DISABLED)
         self.stop_img_click_btn.config(state=tk.NORMAL)
         self.img_click_running = True
+        self._img_stop_event.clear()
 
         confidence = self.confidence_var.get()
+        auto_confidence = self.img_auto_confidence_var.get()
 
         # Get monitor selection
         monitor = self.img_monitor_var.get()
@@ -1539,28 +1735,32 @@ class AutoClickerGUI:
 
         # Get action mode
         action_mode = self.img_action_mode_var.get()
-        playback_events = None
+        playback_file = ""
         playback_speed = 1.0
 
         if action_mode == "playback":
-            # Load recording file
+            # Recording file is parsed on the worker thread
             playback_file = self.img_playback_file_var.get()
             if not playback_file:
                 messagebox.showwarning("Input Required", "Please select a recording file for playback mode")
+                self.start_img_click_btn.config(state=tk.NORMAL)
+                self.stop_img_click_btn.config(state=tk.DISABLED)
+                self.img_click_running = False
                 return
+            playback_speed = self.img_playback_speed_var.get()
 
+        def image_click_thread():
+            playback_events = None
             try:
-                with open(playback_file, 'r') as f:
-                    data = json.load(f)
-                    playback_events = data['events']
-                    playback_speed = self.img_playback_speed_var.get()
+                if action_mode == "playback":
+                    # Parse here so a large recording does not freeze the window
+                    try:
+                        playback_events = read_recording_file(playback_file)['events']
+                    except Exception as e:
+                        self.post_gui(messagebox.showerror, "Error", f"Failed to load recording: {e}")
+                        return
                     self.log(f"Loaded {len(playback_events)} events from {playback_file}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load recording: {e}")
-                return
 
-        def image_click_thread():
-            try:
                 self.log(f"Searching for image: {image_path}")
                 if monitor:
                     self.log(f"Using Monitor {monitor}")
@@ -1573,7 +1773,7 @@ class AutoClickerGUI:
                 if retry_on_not_found:
                     self.log(f"Retry mode: Will keep searching if image not found")
 
-                self.update_status("Searching for template image...")
+                self.post_gui(self.update_status, "Searching for template image...")
 
                 success = self.clicker.click_on_image(
                     image_path,
@@ -1586,38 +1786,41 @@ class AutoClickerGUI:
                     unlimited=unlimited,
                     retry_on_not_found=retry_on_not_found,
                     stop_flag=lambda: not self.img_click_running,
-                    log_callback=self.log
+                    log_callback=self.log,
+                    stop_event=self._img_stop_event,
+                    auto_confidence=auto_confidence
                 )
 
                 # Check if stopped by user before showing results
                 if not self.img_click_running:
                     # User stopped it, don't show any message
                     self.log("Image click stopped by user")
-                    self.update_status("Stopped")
+                    self.post_gui(self.update_status, "Stopped")
                 elif success:
                     if action_mode == "playback":
                         self.log("Image found and recording played!")
-                        self.update_status("Image found and recording played")
+                        self.post_gui(self.update_status, "Image found and recording played")
                     else:
                         self.log("Image found and clicked!")
-                        self.update_status("Image click successful")
+                        self.post_gui(self.update_status, "Image click successful")
                 else:
                     self.log("Image not found")
-                    self.update_status("Image not found")
+                    self.post_gui(self.update_status, "Image not found")
             except Exception as e:
                 self.log(f"Error during image click: {e}")
-                self.update_status("Error during image click")
+                self.post_gui(self.update_status, "Error during image click")
             finally:
                 # Re-enable buttons when done
                 self.img_click_running = False
-                self.start_img_click_btn.config(state=tk.NORMAL)
-                self.stop_img_click_btn.config(state=tk.DISABLED)
+                self.post_gui(lambda: self.start_img_click_btn.config(state=tk.NORMAL))
+                self.post_gui(lambda: self.stop_img_click_btn.config(state=tk.DISABLED))
 
         threading.Thread(target=image_click_thread, daemon=True).start()
 
     def stop_image_click(self):
         """Stop the image click process"""
         self.img_click_running = False
+        self._img_stop_event.set()
         self.log("Stopping image click...")
         self.update_status("Image click stopped by user")
 
@@ -1641,8 +1844,7 @@ class AutoClickerGUI:
         filename = self.screenshot_filename_var.get()
 
         if not filename:
-            messagebox.showerror("Error", "Please specify a filename")
-            return
+            filename = datetime.now().strftime(SCREENSHOT_FILENAME_FORMAT)
 
         region = None
         if mode == "region":
@@ -1664,7 +1866,7 @@ class AutoClickerGUI:
 
         try:
             self.log(f"Capturing screenshot...")
-            screenshot = self.analyzer.capture_screenshot(region)
+            screenshot = self.analyzer.capture_screenshot(region, raw=True)
             self.analyzer.save_screenshot(screenshot, filename)
             self.log(f"Screenshot saved to {filename}")
             messagebox.showinfo("Success", f"Screenshot saved to {filename}")
@@ -1741,8 +1943,11 @@ class AutoClickerGUI:
         alarm_scrollbar = tk.Scrollbar(listbox_frame)
         alarm_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        # Rows are backed by a Tcl list variable so a full refresh is a single set
+        self._alarm_listvar = tk.StringVar()
         self.alarm_listbox = tk.Listbox(
             listbox_frame,
+            listvariable=self._alarm_listvar,
             yscrollcommand=alarm_scrollbar.set,
             font=("Segoe UI", 9),
             height=6,
@@ -1807,44 +2012,38 @@ class AutoClickerGUI:
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=3)
 
+    def _format_alarm_line(self, alarm):
+        """Format a single alarm as a listbox row"""
+        # Weekday and action labels come from precomputed bitmask tables;
+        # the weekday mask is cached on the alarm by derive_alarm_fields
+        weekdays = alarm['_days_mask'] if '_days_mask' in alarm else days_mask(alarm.get('days', ()))
+        return (
+            f"{'✓ ON' if alarm['enabled'] else '✗ OFF'} | "
+            f"{alarm['hour']}:{alarm['minute']:02d} {alarm.get('am_pm', 'AM')} | "
+            f"{DAYS_TEXT[weekdays]} | {ACTIONS_TEXT[actions_mask(alarm)]}"
+        )
+
     def refresh_alarm_list(self):
         """Refresh the alarm list display"""
-        self.alarm_listbox.delete(0, tk.END)
-        for alarm in self.alarms:
-            status = "✓ ON" if alarm['enabled'] else "✗ OFF"
-
-            # Format time with AM/PM
-            hour = alarm['hour']
-            minute = alarm['minute']
-            am_pm = alarm.get('am_pm', 'AM')
-            time_str = f"{hour}:{minute:02d} {am_pm}"
-
-            # Get actions
-            actions = []
-            if alarm.get('play_recording', False):
-                actions.append("Rec")
-            if alarm.get('play_mp3', False):
-                actions.append("MP3")
-            if alarm.get('pause_autoclicker', False):
-                actions.append("Pause")
-            if alarm.get('start_autoclicker', False):
-                actions.append("Start")
-            if alarm.get('click_image', False):
-                actions.append("Img")
-            action_text = "+".join(actions) if actions else "None"
-
-            # Get days
-            days = alarm.get('days', [])
-            if len(days) == 7:
-                days_text = "Every day"
-            elif days:
-                day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-                days_text = ",".join([day_names[d] for d in sorted(days)])
-            else:
-                days_text = "No days"
+        rows = tuple(self._format_alarm_line(alarm) for alarm in self.alarms)
+        shown = self.alarm_listbox.get(0, tk.END)
+        if len(rows) != len(shown):
+            # Replace every row at once through the listbox's list variable
+            self._alarm_listvar.set(rows)
+            return
+
+        # Same row count: patch only the rows whose text changed, which keeps
+        # the selection and scroll position of the untouched rows
+        for index, (old, new) in enumerate(zip(shown, rows)):
+            if old != new:
+                self.alarm_listbox.delete(index)
+                self.alarm_listbox.insert(index, new)
 
-            display_text = f"{status} | {time_str} | {days_text} | {action_text}"
-            self.alarm_listbox.insert(tk.END, display_text)
+    def _refresh_alarm_row(self, index):
+        """Re-render a single alarm row in place and keep it selected"""
+        self.alarm_listbox.delete(index)
+        self.alarm_listbox.insert(index, self._format_alarm_line(self.alarms[index]))
+        self.alarm_listbox.selection_set(index)
 
     def show_add_alarm_dialog(self):
         """Show dialog to add a new alarm"""
@@ -1870,7 +2069,7 @@ class AutoClickerGUI:
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this alarm?"):
             index = selection[0]
             del self.alarms[index]
-            self.refresh_alarm_list()
+            self.alarm_listbox.delete(index)
             self.log("Alarm deleted")
             self.save_alarms()
 
@@ -1883,56 +2082,87 @@ class AutoClickerGUI:
 
         index = selection[0]
         self.alarms[index]['enabled'] = not self.alarms[index]['enabled']
-        self.refresh_alarm_list()
+        self._refresh_alarm_row(index)
         status = "enabled" if self.alarms[index]['enabled'] else "disabled"
         self.log(f"Alarm {status}")
         self.save_alarms()
 
     def show_alarm_dialog(self, mode="add", alarm_index=None):
         """Show dialog for adding or editing an alarm with enhanced features"""
+        # The dialog is built once, then hidden and re-shown with fresh values
+        if self._alarm_dialog is None or not self._alarm_dialog.winfo_exists():
+            self._alarm_dialog, self._populate_alarm_dialog = self._build_alarm_dialog()
+        self._populate_alarm_dialog(mode, alarm_index)
+
+        # Show the dialog and grab input (grab needs a mapped window)
+        self._alarm_dialog.deiconify()
+        self._alarm_dialog.lift()
+        self._alarm_dialog.grab_set()
+
+    def _build_alarm_dialog(self):
+        """
+        Create the alarm dialog widgets once
+
+        Returns:
+            Tuple of (dialog, populate); populate(mode, alarm_index) loads an
+            alarm, or blank values for a new one, into the existing widgets
+        """
         dialog = tk.Toplevel(self.root)
-        dialog.title("Add Alarm" if mode == "add" else "Edit Alarm")
+        # Keep the dialog unmapped while it is built so Tk lays it out once
+        dialog.withdraw()
         dialog.geometry("500x650")
         dialog.resizable(True, True)
         dialog.transient(self.root)
-        dialog.grab_set()
 
-        # If editing, load existing alarm data
-        if mode == "edit" and alarm_index is not None:
-            alarm = self.alarms[alarm_index]
-        else:
-            alarm = None
+        # Alarm being edited; set by populate() each time the dialog is shown
+        mode = "add"
+        alarm_index = None
+        alarm = None
 
         # Create canvas with scrollbar for scrollable content
         canvas = tk.Canvas(dialog)
         scrollbar = tk.Scrollbar(dialog, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Coalesce bursts of <Configure> events into one scrollregion update
+        scroll_update_id = None
+
+        def _update_scrollregion():
+            nonlocal scroll_update_id
+            scroll_update_id = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def _schedule_scrollregion(event=None):
+            nonlocal scroll_update_id
+            if scroll_update_id is not None:
+                canvas.after_cancel(scroll_update_id)
+            scroll_update_id = canvas.after(50, _update_scrollregion)
+
+        def _cancel_scrollregion(event):
+            if scroll_update_id is not None:
+                canvas.after_cancel(scroll_update_id)
+
+        scrollable_frame.bind("<Configure>", _schedule_scrollregion)
+        canvas.bind("<Destroy>", _cancel_scrollregion)
 
         window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
         # Make scrollable frame expand to fill canvas width
+        last_width = None
+
         def _configure_canvas(event):
-            # Get the canvas width (subtract scrollbar if visible)
-            canvas_width = event.width
-            # Set the embedded window to fill the canvas width
-            canvas.itemconfig(window_id, width=canvas_width)
-            # Also update the scroll region
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            nonlocal last_width
+            # Only resize the embedded window when the width actually changed
+            if event.width != last_width:
+                last_width = event.width
+                canvas.itemconfig(window_id, width=event.width)
+            _schedule_scrollregion()
 
         canvas.bind("<Configure>", _configure_canvas)
 
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Mouse wheel scrolling while the pointer is over the dialog
+        self.register_scroll_canvas(canvas)
 
         # Time settings (12-hour format with AM/PM)
         time_frame = tk.LabelFrame(scrollable_frame, text="Time (12-hour format)", padx=15, pady=10)
@@ -1942,7 +2172,7 @@ class AutoClickerGUI:
         time_inputs.pack()
 
         tk.Label(time_inputs, text="Hour:", font=("Arial", 9)).pack(side=tk.LEFT, padx=3)
-        hour_var = tk.IntVar(value=alarm.get('hour', 12) if alarm else 12)
+        hour_var = tk.IntVar(value=12)
         tk.Spinbox(
             time_inputs,
             from_=1,
@@ -1953,7 +2183,7 @@ class AutoClickerGUI:
         ).pack(side=tk.LEFT, padx=3)
 
         tk.Label(time_inputs, text="Minute:", font=("Arial", 9)).pack(side=tk.LEFT, padx=(10, 3))
-        minute_var = tk.IntVar(value=alarm.get('minute', 0) if alarm else 0)
+        minute_var = tk.IntVar(value=0)
         tk.Spinbox(
             time_inputs,
             from_=0,
@@ -1963,7 +2193,7 @@ class AutoClickerGUI:
             font=("Arial", 9)
         ).pack(side=tk.LEFT, padx=3)
 
-        am_pm_var = tk.StringVar(value=alarm.get('am_pm', 'AM') if alarm else 'AM')
+        am_pm_var = tk.StringVar(value='AM')
         am_pm_combo = ttk.Combobox(
             time_inputs,
             textvariable=am_pm_var,
@@ -1984,7 +2214,7 @@ class AutoClickerGUI:
         days_grid.pack()
 
         for i, day_name in enumerate(day_names):
-            var = tk.BooleanVar(value=i in alarm.get('days', []) if alarm else False)
+            var = tk.BooleanVar(value=False)
             day_vars.append(var)
             tk.Checkbutton(
                 days_grid,
@@ -2012,11 +2242,11 @@ class AutoClickerGUI:
         action_frame = tk.LabelFrame(scrollable_frame, text="Actions (Select one or more)", padx=15, pady=10)
         action_frame.pack(fill=tk.X, padx=15, pady=5)
 
-        play_recording_var = tk.BooleanVar(value=alarm.get('play_recording', False) if alarm else False)
-        play_mp3_var = tk.BooleanVar(value=alarm.get('play_mp3', False) if alarm else False)
-        pause_autoclicker_var = tk.BooleanVar(value=alarm.get('pause_autoclicker', False) if alarm else False)
-        start_autoclicker_var = tk.BooleanVar(value=alarm.get('start_autoclicker', False) if alarm else False)
-        click_image_var = tk.BooleanVar(value=alarm.get('click_image', False) if alarm else False)
+        play_recording_var = tk.BooleanVar(value=False)
+        play_mp3_var = tk.BooleanVar(value=False)
+        pause_autoclicker_var = tk.BooleanVar(value=False)
+        start_autoclicker_var = tk.BooleanVar(value=False)
+        click_image_var = tk.BooleanVar(value=False)
 
         tk.Checkbutton(
             action_frame,
@@ -2057,7 +2287,7 @@ class AutoClickerGUI:
         recording_frame = tk.LabelFrame(scrollable_frame, text="Recording File", padx=15, pady=8)
         recording_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        recording_file_var = tk.StringVar(value=alarm.get('recording_file', '') if alarm else '')
+        recording_file_var = tk.StringVar(value='')
 
         recording_entry_frame = tk.Frame(recording_frame)
         recording_entry_frame.pack(fill=tk.X, pady=3)
@@ -2071,7 +2301,7 @@ class AutoClickerGUI:
 
         def browse_recording():
             filename = filedialog.askopenfilename(
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=RECORDING_FILETYPES
             )
             if filename:
                 recording_file_var.set(filename)
@@ -2088,7 +2318,7 @@ class AutoClickerGUI:
         mp3_frame = tk.LabelFrame(scrollable_frame, text="MP3 File", padx=15, pady=8)
         mp3_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        mp3_file_var = tk.StringVar(value=alarm.get('mp3_file', '') if alarm else '')
+        mp3_file_var = tk.StringVar(value='')
 
         mp3_entry_frame = tk.Frame(mp3_frame)
         mp3_entry_frame.pack(fill=tk.X, pady=3)
@@ -2123,131 +2353,107 @@ class AutoClickerGUI:
         image_frame = tk.LabelFrame(scrollable_frame, text="Image Files (for Click on Image)", padx=15, pady=8)
         image_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        # Initialize image_files list from alarm data
-        image_files_list = []
-        if alarm:
-            # Check if old format (single image)
-            if 'image_file' in alarm and alarm['image_file']:
-                # Convert old format to new format
-                image_files_list = [{
-                    'file': alarm['image_file'],
-                    'monitor': alarm.get('image_monitor', 0)
-                }]
-            # Check if new format (multiple images)
-            elif 'image_files' in alarm:
-                image_files_list = alarm['image_files']
-
-        # Container for image entries
-        images_container = tk.Frame(image_frame)
-        images_container.pack(fill=tk.X, pady=3)
-
-        image_entries = []  # Store all image entry widgets
-
-        def add_image_entry(image_data=None):
-            entry_frame = tk.Frame(images_container, bd=1, relief=tk.GROOVE, padx=5, pady=5)
-            entry_frame.pack(fill=tk.X, pady=2)
-
-            file_var = tk.StringVar(value=image_data['file'] if image_data else '')
-            monitor_var = tk.IntVar(value=image_data['monitor'] if image_data else 0)
-
-            # File selection
-            file_frame = tk.Frame(entry_frame)
-            file_frame.pack(fill=tk.X)
-
-            tk.Entry(
-                file_frame,
-                textvariable=file_var,
-                font=("Arial", 8),
-                state='readonly'
-            ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 3))
-
-            def browse_image():
-                filename = filedialog.askopenfilename(
-                    filetypes=[
-                        ("Image files", "*.png *.jpg *.jpeg *.bmp"),
-                        ("PNG files", "*.png"),
-                        ("JPEG files", "*.jpg *.jpeg"),
-                        ("All files", "*.*")
-                    ]
-                )
-                if filename:
-                    file_var.set(filename)
-
-            tk.Button(
-                file_frame,
-                text="Browse",
-                command=browse_image,
-                font=("Arial", 7),
-                cursor="hand2",
-                width=8
-            ).pack(side=tk.LEFT, padx=2)
-
-            # Remove button
-            def remove_entry():
-                entry_frame.destroy()
-                image_entries.remove((file_var, monitor_var, entry_frame))
-
-            tk.Button(
-                file_frame,
-                text="✕",
-                command=remove_entry,
-                font=("Arial", 8, "bold"),
-                fg="red",
-                cursor="hand2",
-                width=2
-            ).pack(side=tk.LEFT)
-
-            # Monitor selection
-            monitor_frame = tk.Frame(entry_frame)
-            monitor_frame.pack(fill=tk.X, pady=(3, 0))
-
-            tk.Label(monitor_frame, text="Monitor:", font=("Arial", 7)).pack(side=tk.LEFT, padx=(0, 5))
-
-            monitor_options = ["All Monitors"] + [f"Monitor {i+1}" for i in range(len(self.analyzer.get_monitors()))]
-            monitor_combo = ttk.Combobox(
-                monitor_frame,
-                values=monitor_options,
-                state='readonly',
-                font=("Arial", 7),
-                width=13
-            )
-            monitor_combo.current(monitor_var.get())
-            monitor_combo.pack(side=tk.LEFT)
+        # One Treeview row per image instead of a widget stack per image.
+        # Monitor choices are refreshed each time the dialog is shown.
+        monitor_options = ["All Monitors"]
 
-            def on_monitor_change(event):
-                monitor_var.set(monitor_combo.current())
+        def monitor_label(monitor_index):
+            if monitor_index < len(monitor_options):
+                return monitor_options[monitor_index]
+            return f"Monitor {monitor_index}"
 
-            monitor_combo.bind('<<ComboboxSelected>>', on_monitor_change)
+        image_tree = ttk.Treeview(
+            image_frame,
+            columns=('file', 'monitor'),
+            show='headings',
+            height=4,
+            selectmode='extended'
+        )
+        image_tree.heading('file', text='Image File')
+        image_tree.heading('monitor', text='Monitor')
+        image_tree.column('file', width=280)
+        image_tree.column('monitor', width=100, anchor=tk.CENTER)
+        image_tree.pack(fill=tk.X, pady=3)
+
+        image_monitors = {}  # Treeview item id -> monitor index
+
+        def add_image_row(file_path, monitor_index):
+            item = image_tree.insert('', tk.END, values=(file_path, monitor_label(monitor_index)))
+            image_monitors[item] = monitor_index
+
+        # Toolbar acting on the selected rows
+        image_toolbar = tk.Frame(image_frame)
+        image_toolbar.pack(fill=tk.X, pady=(5, 0))
+
+        tk.Label(image_toolbar, text="Monitor:", font=("Arial", 7)).pack(side=tk.LEFT, padx=(0, 5))
+
+        monitor_combo = ttk.Combobox(
+            image_toolbar,
+            values=monitor_options,
+            state='readonly',
+            font=("Arial", 7),
+            width=13
+        )
+        monitor_combo.current(0)
+        monitor_combo.pack(side=tk.LEFT)
 
-            image_entries.append((file_var, monitor_var, entry_frame))
+        def on_monitor_change(event):
+            # Apply the chosen monitor to the selected rows
+            monitor_index = monitor_combo.current()
+            for item in image_tree.selection():
+                image_monitors[item] = monitor_index
+                image_tree.set(item, 'monitor', monitor_label(monitor_index))
 
-        # Add existing images
-        if image_files_list:
-            for img_data in image_files_list:
-                add_image_entry(img_data)
-        else:
-            # Add one empty entry by default
-            add_image_entry()
+        monitor_combo.bind('<<ComboboxSelected>>', on_monitor_change)
+
+        def on_image_select(event):
+            selection = image_tree.selection()
+            if selection and image_monitors[selection[0]] < len(monitor_options):
+                monitor_combo.current(image_monitors[selection[0]])
 
-        # Add Image button
-        add_btn_frame = tk.Frame(image_frame)
-        add_btn_frame.pack(fill=tk.X, pady=(5, 0))
+        image_tree.bind('<<TreeviewSelect>>', on_image_select)
+
+        def browse_image():
+            filename = filedialog.askopenfilename(
+                filetypes=[
+                    ("Image files", "*.png *.jpg *.jpeg *.bmp"),
+                    ("PNG files", "*.png"),
+                    ("JPEG files", "*.jpg *.jpeg"),
+                    ("All files", "*.*")
+                ]
+            )
+            if filename:
+                add_image_row(filename, monitor_combo.current())
+
+        def remove_selected_images():
+            for item in image_tree.selection():
+                image_tree.delete(item)
+                del image_monitors[item]
 
         tk.Button(
-            add_btn_frame,
-            text="+ Add Another Image",
-            command=lambda: add_image_entry(),
+            image_toolbar,
+            text="✕ Remove",
+            command=remove_selected_images,
+            font=("Arial", 8),
+            fg="red",
+            cursor="hand2"
+        ).pack(side=tk.RIGHT, padx=2)
+
+        tk.Button(
+            image_toolbar,
+            text="+ Add Image",
+            command=browse_image,
             font=("Arial", 8),
             cursor="hand2",
             bg="#4CAF50",
             fg="white"
-        ).pack()
+        ).pack(side=tk.RIGHT, padx=2)
 
         # Playback speed
         speed_frame = tk.LabelFrame(scrollable_frame, text="Recording Playback Speed", padx=15, pady=8)
         speed_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        speed_var = tk.DoubleVar(value=alarm.get('speed', 1.0) if alarm else 1.0)
+        speed_var = tk.DoubleVar(value=1.0)
 
         speed_inputs = tk.Frame(speed_frame)
         speed_inputs.pack()
@@ -2270,64 +2476,56 @@ class AutoClickerGUI:
 
         # Save button
         def save_alarm():
-            # Unbind mousewheel before closing
-            canvas.unbind_all("<MouseWheel>")
-
-            # Validate that at least one action is selected
-            if not (play_recording_var.get() or play_mp3_var.get() or pause_autoclicker_var.get() or start_autoclicker_var.get()):
-                messagebox.showwarning("No Action Selected", "Please select at least one action")
-                return
-
-            # Validate files for selected actions
-            if play_recording_var.get() and not recording_file_var.get():
-                messagebox.showwarning("Input Required", "Please select a recording file")
-                return
-
-            if play_mp3_var.get() and not mp3_file_var.get():
-                messagebox.showwarning("Input Required", "Please select an MP3 file")
-                return
-
-            # Get selected days
+            # Read every dialog variable once; each .get() is a Tcl round-trip
+            hour, minute, am_pm = hour_var.get(), minute_var.get(), am_pm_var.get()
+            play_recording, play_mp3, pause_autoclicker, start_autoclicker, click_image = (
+                var.get() for var in (
+                    play_recording_var, play_mp3_var, pause_autoclicker_var,
+                    start_autoclicker_var, click_image_var
+                )
+            )
+            recording_file = recording_file_var.get()
+            mp3_file = mp3_file_var.get()
             selected_days = [i for i, var in enumerate(day_vars) if var.get()]
-            if not selected_days:
-                messagebox.showwarning("No Days Selected", "Please select at least one day")
+
+            # Validate in one pass, stopping at the first problem
+            if not (play_recording or play_mp3 or pause_autoclicker or start_autoclicker):
+                warning = ("No Action Selected", "Please select at least one action")
+            elif play_recording and not recording_file:
+                warning = ("Input Required", "Please select a recording file")
+            elif play_mp3 and not mp3_file:
+                warning = ("Input Required", "Please select an MP3 file")
+            elif not selected_days:
+                warning = ("No Days Selected", "Please select at least one day")
+            else:
+                warning = None
+            if warning:
+                messagebox.showwarning(*warning)
                 return
 
             # Check if time was changed when editing
-            time_changed = False
-            if alarm:
-                old_hour = alarm.get('hour')
-                old_minute = alarm.get('minute')
-                old_am_pm = alarm.get('am_pm')
-                new_hour = hour_var.get()
-                new_minute = minute_var.get()
-                new_am_pm = am_pm_var.get()
-
-                if old_hour != new_hour or old_minute != new_minute or old_am_pm != new_am_pm:
-                    time_changed = True
+            time_changed = bool(alarm) and (
+                (alarm.get('hour'), alarm.get('minute'), alarm.get('am_pm')) != (hour, minute, am_pm)
+            )
 
             # Collect all image files
-            image_files = []
-            for file_var, monitor_var, _ in image_entries:
-                file_path = file_var.get()
-                if file_path:  # Only add if file is selected
-                    image_files.append({
-                        'file': file_path,
-                        'monitor': monitor_var.get()
-                    })
+            image_files = [
+                {'file': image_tree.set(item, 'file'), 'monitor': image_monitors[item]}
+                for item in image_tree.get_children()
+            ]
 
             alarm_data = {
-                'hour': hour_var.get(),
-                'minute': minute_var.get(),
-                'am_pm': am_pm_var.get(),
+                'hour': hour,
+                'minute': minute,
+                'am_pm': am_pm,
                 'days': selected_days,
-                'play_recording': play_recording_var.get(),
-                'play_mp3': play_mp3_var.get(),
-                'pause_autoclicker': pause_autoclicker_var.get(),
-                'start_autoclicker': start_autoclicker_var.get(),
-                'click_image': click_image_var.get(),
-                'recording_file': recording_file_var.get(),
-                'mp3_file': mp3_file_var.get(),
+                'play_recording': play_recording,
+                'play_mp3': play_mp3,
+                'pause_autoclicker': pause_autoclicker,
+                'start_autoclicker': start_autoclicker,
+                'click_image': click_image,
+                'recording_file': recording_file,
+                'mp3_file': mp3_file,
                 'image_files': image_files,  # Multiple images
                 'speed': speed_var.get(),
                 'enabled': alarm['enabled'] if alarm else True,
@@ -2335,23 +2533,34 @@ class AutoClickerGUI:
                 'triggered_today': {} if time_changed else (alarm.get('triggered_today', {}) if alarm else {})
             }
 
+            derive_alarm_fields(alarm_data)
+            if play_mp3:
+                self.preload_mp3(mp3_file)
+
             if mode == "add":
                 self.alarms.append(alarm_data)
-                self.log(f"Alarm added: {hour_var.get()}:{minute_var.get():02d} {am_pm_var.get()}")
+                self.log(f"Alarm added: {hour}:{minute:02d} {am_pm}")
             else:
                 self.alarms[alarm_index] = alarm_data
                 if time_changed:
-                    self.log(f"Alarm updated: {hour_var.get()}:{minute_var.get():02d} {am_pm_var.get()} (trigger flag cleared)")
+                    self.log(f"Alarm updated: {hour}:{minute:02d} {am_pm} (trigger flag cleared)")
                 else:
-                    self.log(f"Alarm updated: {hour_var.get()}:{minute_var.get():02d} {am_pm_var.get()}")
+                    self.log(f"Alarm updated: {hour}:{minute:02d} {am_pm}")
 
-            self.refresh_alarm_list()
+            # Patch only the affected row instead of rebuilding the list
+            if mode == "add":
+                self.alarm_listbox.insert(tk.END, self._format_alarm_line(alarm_data))
+            else:
+                self._refresh_alarm_row(alarm_index)
             self.save_alarms()
-            dialog.destroy()
+            close_dialog()
 
-        def cancel_dialog():
-            canvas.unbind_all("<MouseWheel>")
-            dialog.destroy()
+        def close_dialog():
+            # Hide instead of destroying so the widgets are reused next time
+            dialog.grab_release()
+            dialog.withdraw()
+
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
 
         btn_frame = tk.Frame(scrollable_frame)
         btn_frame.pack(pady=15)
@@ -2371,7 +2580,7 @@ class AutoClickerGUI:
         tk.Button(
             btn_frame,
             text="Cancel",
-            command=cancel_dialog,
+            command=close_dialog,
             bg="#95a5a6",
             fg="white",
             font=("Arial", 10, "bold"),
@@ -2380,6 +2589,50 @@ class AutoClickerGUI:
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
+        def populate(new_mode, new_index):
+            nonlocal mode, alarm_index, alarm
+            mode, alarm_index = new_mode, new_index
+            alarm = self.alarms[alarm_index] if mode == "edit" and alarm_index is not None else None
+            values = alarm or {}
+            dialog.title("Add Alarm" if mode == "add" else "Edit Alarm")
+
+            hour_var.set(values.get('hour', 12))
+            minute_var.set(values.get('minute', 0))
+            am_pm_var.set(values.get('am_pm', 'AM'))
+            days = values.get('days', [])
+            for i, var in enumerate(day_vars):
+                var.set(i in days)
+            play_recording_var.set(values.get('play_recording', False))
+            play_mp3_var.set(values.get('play_mp3', False))
+            pause_autoclicker_var.set(values.get('pause_autoclicker', False))
+            start_autoclicker_var.set(values.get('start_autoclicker', False))
+            click_image_var.set(values.get('click_image', False))
+            recording_file_var.set(values.get('recording_file', ''))
+            mp3_file_var.set(values.get('mp3_file', ''))
+            speed_var.set(values.get('speed', 1.0))
+
+            # Refresh the monitor choices, then reload the image rows
+            monitor_options[:] = ["All Monitors"] + [f"Monitor {i+1}" for i in range(len(self.analyzer.get_monitors()))]
+            monitor_combo.configure(values=monitor_options)
+            monitor_combo.current(0)
+            image_tree.delete(*image_tree.get_children())
+            image_monitors.clear()
+
+            # Older alarms store a single image instead of a list
+            if values.get('image_file'):
+                image_files_list = [{'file': values['image_file'], 'monitor': values.get('image_monitor', 0)}]
+            else:
+                image_files_list = values.get('image_files', [])
+            for img_data in image_files_list:
+                if img_data.get('file'):
+                    add_image_row(img_data['file'], img_data.get('monitor', 0))
+
+            canvas.yview_moveto(0)
+
+        # Lay the widgets out once while the dialog is still hidden
+        dialog.update_idletasks()
+        return dialog, populate
+
     def start_alarm_monitor(self):
         """Start monitoring all alarms"""
         if not self.alarms:
@@ -2399,158 +2652,201 @@ class AutoClickerGUI:
         self.log(f"Alarm monitoring started ({enabled_count} alarms active)")
         self.update_status(f"Monitoring {enabled_count} alarms")
 
-        def monitor_thread_func():
-            import time as time_module
-            while self.alarm_monitor_running:
-                now = datetime.now()
-                current_hour_24 = now.hour
-                current_minute = now.minute
-                current_weekday = now.weekday()  # 0=Monday, 6=Sunday
-
-                for alarm in self.alarms:
-                    if not alarm['enabled']:
-                        continue
-
-                    # Check if today is a scheduled day
-                    if current_weekday not in alarm.get('days', []):
-                        continue
-
-                    # Convert alarm time from 12-hour to 24-hour format
-                    alarm_hour_12 = alarm['hour']
-                    am_pm = alarm.get('am_pm', 'AM')
-
-                    if am_pm == 'PM' and alarm_hour_12 != 12:
-                        alarm_hour_24 = alarm_hour_12 + 12
-                    elif am_pm == 'AM' and alarm_hour_12 == 12:
-                        alarm_hour_24 = 0
+        for alarm in self.alarms:
+            if alarm['enabled'] and alarm.get('play_mp3', False):
+                self.preload_mp3(alarm.get('mp3_file', ''))
+
+        self._alarm_stop_event.clear()
+        self._alarm_heap = None
+        self._alarm_cleanup_day = None
+        self._schedule_alarm_tick(0)
+
+    def _schedule_alarm_tick(self, delay_ms):
+        """Run the alarm monitor tick after delay_ms, replacing any pending tick"""
+        if self._alarm_after_id is not None:
+            self.root.after_cancel(self._alarm_after_id)
+        self._alarm_after_id = self.root.after(delay_ms, self._alarm_tick)
+
+    def _alarm_tick(self):
+        """Fire due alarms and schedule the next tick (runs on the Tk thread)"""
+        self._alarm_after_id = None
+        if not self.alarm_monitor_running:
+            return
+
+        # One clock read serves the whole pass; the date comes from the same reading
+        now = datetime.now()
+
+        # Trigger keys only age across midnight, so prune them once a day
+        today = now.date()
+        if today != self._alarm_cleanup_day:
+            for alarm in self.alarms:
+                prune_trigger_keys(alarm, today)
+            self._alarm_cleanup_day = today
+
+        # Rebuild the schedule on start and whenever alarms change
+        if self._alarm_heap is None:
+            self._alarm_heap = self._build_alarm_heap(now)
+        heap = self._alarm_heap
+        alarms = self.alarms
+
+        # Fire every alarm that is due, then queue its next occurrence
+        while heap and heap[0][0] <= now:
+            fire_at, index = heapq.heappop(heap)
+            if index >= len(alarms):
+                continue
+            alarm = alarms[index]
+            # Skip alarms whose minute passed while the event loop was busy or asleep
+            if (now - fire_at).total_seconds() < 60:
+                self._fire_alarm(alarm, fire_at)
+            next_at = next_fire_time(alarm, now)
+            if next_at is not None:
+                heapq.heappush(heap, (next_at, index))
+
+        # Write trigger state once for all alarms fired in this tick
+        if self._alarms_dirty:
+            self._queue_alarms_write()
+
+        # Run again when the next alarm is due, or else on the next minute boundary,
+        # the finest granularity an alarm has, so wall-clock adjustments are picked up
+        now = datetime.now()
+        timeout = 60.0 - now.second - now.microsecond / 1e6
+        if heap:
+            timeout = min(timeout, max(0.0, (heap[0][0] - now).total_seconds()))
+        self._schedule_alarm_tick(int(timeout * 1000) + 1)
+
+    def _build_alarm_heap(self, now):
+        """Build a min-heap of (next fire time, alarm index) for enabled alarms"""
+        heap = []
+        for index, alarm in enumerate(self.alarms):
+            fire_at = next_fire_time(alarm, now)
+            if fire_at is not None:
+                heap.append((fire_at, index))
+        heapq.heapify(heap)
+        return heap
+
+    def _fire_alarm(self, alarm, fire_at):
+        """Mark an alarm as triggered for the day and queue its actions"""
+        # Trigger alarm
+        time_str = f"{alarm['hour']}:{alarm['minute']:02d} {alarm.get('am_pm', 'AM')}"
+        self.log(f"ALARM! Triggering: {time_str}")
+
+        # Mark as triggered for today
+        triggered = alarm.setdefault('triggered_today', {})
+        triggered[trigger_key(fire_at)] = True
+        self._alarms_dirty = True  # Saved by the monitor after this pass
+
+        # The actions can block for seconds, so the monitor only hands them off
+        self._alarm_action_queue.put(alarm)
+
+    def _alarm_worker(self):
+        """Run queued alarm actions one alarm at a time"""
+        while True:
+            alarm = self._alarm_action_queue.get()
+            try:
+                self._run_alarm_actions(alarm)
+            except Exception as e:
+                self.log(f"Error running alarm actions: {e}")
+
+    def _run_alarm_actions(self, alarm):
+        """Run all actions of a fired alarm (runs on the alarm worker thread)"""
+        # Execute all selected actions
+        if alarm.get('play_mp3', False):
+            self.play_mp3(alarm.get('mp3_file', ''))
+
+        if alarm.get('play_recording', False):
+            self.play_alarm_recording(
+                alarm.get('recording_file', ''),
+                alarm.get('speed', 1.0)
+            )
+
+        # Execute Click on Image first (if enabled)
+        image_found = False
+        if alarm.get('click_image', False):
+            # Support both old and new format
+            image_files = []
+
+            # Check for new format (multiple images)
+            if 'image_files' in alarm and alarm['image_files']:
+                image_files = alarm['image_files']
+            # Fall back to old format (single image)
+            elif 'image_file' in alarm and alarm['image_file']:
+                image_files = [{
+                    'file': alarm['image_file'],
+                    'monitor': alarm.get('image_monitor', 0)
+                }]
+
+            if image_files:
+                self.log(f"Alarm will search for {len(image_files)} image(s)...")
+
+                # Try each image in order
+                for idx, img_data in enumerate(image_files, 1):
+                    image_file = img_data['file']
+                    monitor_index = img_data['monitor']
+                    monitor = None if monitor_index == 0 else monitor_index
+
+                    # Search for image with 5 attempts (not unlimited)
+                    self.log(f"Searching for image {idx}/{len(image_files)}: {os.path.basename(image_file)} (max 5 attempts)...")
+                    found = self.find_and_click_image(image_file, 0.8, monitor, max_retries=5, retry_interval=2.0)
+
+                    if found:
+                        self.log(f"Image {idx} found and clicked!")
+                        image_found = True
+                        # Add delay after clicking before searching for next image
+                        if idx < len(image_files):  # Not the last image
+                            self.log(f"Waiting 1 second before searching for next image...")
+                            time.sleep(1.0)
                     else:
-                        alarm_hour_24 = alarm_hour_12
-
-                    alarm_minute = alarm['minute']
-
-                    # Create unique trigger key for today
-                    trigger_key = f"{now.year}-{now.month}-{now.day}"
-
-                    # Get triggered_today dict (create if doesn't exist)
-                    if 'triggered_today' not in alarm:
-                        alarm['triggered_today'] = {}
-
-                    # Check if it's time to trigger
-                    if (current_hour_24 == alarm_hour_24 and
-                        current_minute == alarm_minute and
-                        alarm['triggered_today'].get(trigger_key, False) == False):
-
-                        # Trigger alarm
-                        time_str = f"{alarm_hour_12}:{alarm_minute:02d} {am_pm}"
-                        self.log(f"ALARM! Triggering: {time_str}")
-
-                        # Execute all selected actions
-                        if alarm.get('play_mp3', False):
-                            self.play_mp3(alarm.get('mp3_file', ''))
-
-                        if alarm.get('play_recording', False):
-                            self.play_alarm_recording(
-                                alarm.get('recording_file', ''),
-                                alarm.get('speed', 1.0)
-                            )
-
-                        # Execute Click on Image first (if enabled)
-                        image_found = False
-                        if alarm.get('click_image', False):
-                            # Support both old and new format
-                            image_files = []
-
-                            # Check for new format (multiple images)
-                            if 'image_files' in alarm and alarm['image_files']:
-                                image_files = alarm['image_files']
-                            # Fall back to old format (single image)
-                            elif 'image_file' in alarm and alarm['image_file']:
-                                image_files = [{
-                                    'file': alarm['image_file'],
-                                    'monitor': alarm.get('image_monitor', 0)
-                                }]
-
-                            if image_files:
-                                self.log(f"Alarm will search for {len(image_files)} image(s)...")
-
-                                # Try each image in order
-                                for idx, img_data in enumerate(image_files, 1):
-                                    image_file = img_data['file']
-                                    monitor_index = img_data['monitor']
-                                    monitor = None if monitor_index == 0 else monitor_index
-
-                                    # Search for image with 5 attempts (not unlimited)
-                                    self.log(f"Searching for image {idx}/{len(image_files)}: {os.path.basename(image_file)} (max 5 attempts)...")
-                                    found = self.find_and_click_image(image_file, 0.8, monitor, max_retries=5, retry_interval=2.0)
-
-                                    if found:
-                                        self.log(f"Image {idx} found and clicked!")
-                                        image_found = True
-                                        # Add delay after clicking before searching for next image
-                                        if idx < len(image_files):  # Not the last image
-                                            self.log(f"Waiting 1 second before searching for next image...")
-                                            time_module.sleep(1.0)
-                                    else:
-                                        self.log(f"Image {idx} not found after 5 attempts")
-
-                                if not image_found:
-                                    self.log("None of the images were found, alarm actions completed")
-                                else:
-                                    # Add delay after all images are clicked before pausing
-                                    self.log(f"All images clicked, waiting 1 second before next action...")
-                                    time_module.sleep(1.0)
-                            else:
-                                self.log("Click on Image action selected but no image files specified")
-
-                        # Pause autoclicker AFTER clicking images (if enabled)
-                        if alarm.get('pause_autoclicker', False):
-                            if self.img_click_running:
-                                self.stop_image_click()
-                                self.log("Image Click stopped by alarm")
-
-                        # Only start autoclicker if no click_image OR if image was found
-                        if alarm.get('start_autoclicker', False):
-                            # If click_image is enabled, only start if image was found
-                            if alarm.get('click_image', False):
-                                if image_found:
-                                    if not self.img_click_running and hasattr(self, 'start_img_click_btn') and self.start_img_click_btn['state'] == tk.NORMAL:
-                                        self.start_image_click()
-                                        self.log("Image Click started by alarm (image was found)")
-                                else:
-                                    self.log("Skipping start autoclicker - image was not found")
-                            else:
-                                # No click_image action, start autoclicker normally
-                                if not self.img_click_running and hasattr(self, 'start_img_click_btn') and self.start_img_click_btn['state'] == tk.NORMAL:
-                                    self.start_image_click()
-                                    self.log("Image Click started by alarm")
-
-                        # Mark as triggered for today
-                        alarm['triggered_today'][trigger_key] = True
-                        self.save_alarms()  # Save trigger state
-
-                    # Clean up old trigger keys (keep only last 2 days)
-                    if alarm.get('triggered_today'):
-                        keys_to_remove = []
-                        for key in alarm['triggered_today']:
-                            try:
-                                year, month, day = map(int, key.split('-'))
-                                trigger_date = datetime(year, month, day)
-                                days_ago = (now - trigger_date).days
-                                if days_ago > 1:
-                                    keys_to_remove.append(key)
-                            except:
-                                pass
-                        for key in keys_to_remove:
-                            del alarm['triggered_today'][key]
-
-                time_module.sleep(1)  # Check every second
-
-        self.alarm_monitor_thread = threading.Thread(target=monitor_thread_func, daemon=True)
-        self.alarm_monitor_thread.start()
+                        self.log(f"Image {idx} not found after 5 attempts")
+
+                if not image_found:
+                    self.log("None of the images were found, alarm actions completed")
+                else:
+                    # Add delay after all images are clicked before pausing
+                    self.log(f"All images clicked, waiting 1 second before next action...")
+                    time.sleep(1.0)
+            else:
+                self.log("Click on Image action selected but no image files specified")
+
+        # Image Click start/stop touches widgets, so it is queued onto the Tk thread
+        # with post_gui(); queued calls run in order, so a pause still precedes a start.
+
+        # Pause autoclicker AFTER clicking images (if enabled)
+        if alarm.get('pause_autoclicker', False):
+            self.post_gui(self._alarm_stop_image_click)
+
+        # Only start autoclicker if no click_image OR if image was found
+        if alarm.get('start_autoclicker', False):
+            # If click_image is enabled, only start if image was found
+            if alarm.get('click_image', False):
+                if image_found:
+                    self.post_gui(self._alarm_start_image_click, "Image Click started by alarm (image was found)")
+                else:
+                    self.log("Skipping start autoclicker - image was not found")
+            else:
+                # No click_image action, start autoclicker normally
+                self.post_gui(self._alarm_start_image_click, "Image Click started by alarm")
+
+    def _alarm_stop_image_click(self):
+        """Stop Image Click for an alarm (runs on the Tk thread)"""
+        if self.img_click_running:
+            self.stop_image_click()
+            self.log("Image Click stopped by alarm")
+
+    def _alarm_start_image_click(self, message):
+        """Start Image Click for an alarm if it is idle (runs on the Tk thread)"""
+        if not self.img_click_running and hasattr(self, 'start_img_click_btn') and self.start_img_click_btn['state'] == tk.NORMAL:
+            self.start_image_click()
+            self.log(message)
 
     def stop_alarm_monitor(self):
         """Stop monitoring all alarms"""
         self.alarm_monitor_running = False
+        if self._alarm_after_id is not None:
+            self.root.after_cancel(self._alarm_after_id)
+            self._alarm_after_id = None
+        self._alarm_stop_event.set()
+        if self._alarms_dirty:
+            self.save_alarms()
         self.start_monitor_btn.config(state=tk.NORMAL)
         self.stop_monitor_btn.config(state=tk.DISABLED)
         self.alarm_monitor_status_label.config(text="⚫ Monitoring: OFF", fg="gray")
@@ -2561,20 +2857,48 @@ class AutoClickerGUI:
     def play_mp3(self, mp3_file):
         """Play an MP3 file"""
         try:
-            import pygame
-            pygame.mixer.init()
-            pygame.mixer.music.load(mp3_file)
-            pygame.mixer.music.play()
+            pygame = _get_pygame()
+            try:
+                self._get_sound(mp3_file).play()
+            except pygame.error:
+                # SDL_mixer builds without MP3 Sound support can still stream it
+                pygame.mixer.music.load(mp3_file)
+                pygame.mixer.music.play()
             self.log(f"Playing MP3: {mp3_file}")
         except Exception as e:
             self.log(f"Error playing MP3: {e}")
 
+    def _get_sound(self, mp3_file):
+        """Return the decoded Sound for an MP3 file, decoding it again only if the file changed"""
+        pygame = _get_pygame()
+        # Open the audio device once; later alarms reuse the running mixer
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        stat = os.stat(mp3_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._sound_lock:
+            cached = self._sound_cache.get(mp3_file)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            sound = pygame.mixer.Sound(mp3_file)
+            self._sound_cache[mp3_file] = (stamp, sound)
+            return sound
+
+    def preload_mp3(self, mp3_file):
+        """Decode an alarm's MP3 in the background so firing it only has to play"""
+        def preload():
+            try:
+                self._get_sound(mp3_file)
+            except Exception:
+                pass  # play_mp3 falls back to streaming and reports real errors
+
+        if mp3_file:
+            threading.Thread(target=preload, daemon=True).start()
+
     def play_alarm_recording(self, recording_file, speed=1.0):
         """Play a recording file for alarm"""
         try:
-            with open(recording_file, 'r') as f:
-                data = json.load(f)
-                events = data['events']
+            events = self._load_recording_events(recording_file)
 
             self.log(f"Playing recording: {recording_file}")
 
@@ -2583,12 +2907,22 @@ class AutoClickerGUI:
         except Exception as e:
             self.log(f"Error playing recording: {e}")
 
+    def _load_recording_events(self, recording_file):
+        """Return a recording's events, re-parsing only when the file has changed"""
+        stat = os.stat(recording_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._recording_cache.get(recording_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        events = read_recording_file(recording_file)['events']
+        self._recording_cache[recording_file] = (stamp, events)
+        return events
+
     # Utility methods
     def show_monitor_preview(self):
         """Show preview window with thumbnails of all monitors"""
         try:
-            thumbnails = self.analyzer.get_monitor_thumbnails(max_width=300)
-
             # Create preview window
             preview_window = tk.Toplevel(self.root)
             preview_window.title("Monitor Preview")
@@ -2597,7 +2931,7 @@ class AutoClickerGUI:
             tk.Label(
                 preview_window,
                 text="Monitor Previews - Click to refresh",
-                font=("Arial", 14, "bold"),
+                font=self._font_title,
                 pady=10
             ).pack()
 
@@ -2614,47 +2948,54 @@ class AutoClickerGUI:
             canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
             canvas.configure(yscrollcommand=scrollbar.set)
 
-            # Display thumbnails
-            for i, thumbnail in enumerate(thumbnails):
-                monitor_frame = tk.LabelFrame(
-                    scrollable_frame,
-                    text=f"Monitor {i + 1}",
-                    padx=10,
-                    pady=10,
-                    font=("Arial", 11, "bold")
-                )
-                monitor_frame.pack(fill=tk.X, padx=15, pady=8)
-
-                # Convert PIL image to PhotoImage
-                photo = ImageTk.PhotoImage(thumbnail)
-
-                # Keep reference to prevent garbage collection
-                label = tk.Label(monitor_frame, image=photo)
-                label.image = photo
-                label.pack()
-
-                # Add monitor info
-                try:
-                    monitors = self.analyzer.get_monitors()
-                    mon = monitors[i]
-                    info_text = f"Size: {mon['width']}x{mon['height']} | Position: ({mon['left']}, {mon['top']})"
-                    tk.Label(
-                        monitor_frame,
-                        text=info_text,
-                        font=("Arial", 9),
-                        fg="gray"
-                    ).pack(pady=5)
-                except:
-                    pass
+            # Thumbnails are captured on a worker thread; show a placeholder until then
+            tk.Label(
+                scrollable_frame,
+                text="Loading monitor previews...",
+                font=("Arial", 10),
+                fg="gray"
+            ).pack(pady=20)
+            labels = None
 
             canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
             scrollbar.pack(side="right", fill="y")
 
+            def show_thumbnails(future):
+                """Put captured thumbnails into the preview (runs on the Tk thread)"""
+                nonlocal labels
+                if not preview_window.winfo_exists():
+                    return
+                refresh_btn.config(state=tk.NORMAL)
+                try:
+                    thumbnails = future.result()
+
+                    # Only rebuild the frames on first load or if a monitor was added or removed
+                    if labels is None or len(thumbnails) != len(labels):
+                        for child in scrollable_frame.winfo_children():
+                            child.destroy()
+                        labels = self._build_preview_frames(scrollable_frame, thumbnails)
+                        return
+
+                    for i, (label, thumbnail) in enumerate(zip(labels, thumbnails)):
+                        photo = self._thumbnail_photo(i, thumbnail)
+                        if label.image is not photo:
+                            label.configure(image=photo)
+                            label.image = photo
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to capture monitor previews: {e}")
+                    self.log(f"Error capturing monitor previews: {e}")
+
+            def refresh_previews():
+                """Capture fresh thumbnails without blocking the Tk thread"""
+                refresh_btn.config(state=tk.DISABLED)
+                future = self._preview_executor.submit(self.analyzer.get_monitor_thumbnails, max_width=300)
+                future.add_done_callback(lambda f: self.post_gui(show_thumbnails, f))
+
             # Refresh button
             refresh_btn = tk.Button(
                 preview_window,
                 text="🔄 Refresh Previews",
-                command=lambda: [preview_window.destroy(), self.show_monitor_preview()],
+                command=refresh_previews,
                 bg="#3498db",
                 fg="white",
                 font=("Arial", 10, "bold"),
@@ -2664,29 +3005,166 @@ class AutoClickerGUI:
             )
             refresh_btn.pack(pady=10)
 
+            refresh_previews()
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create monitor preview: {e}")
             self.log(f"Error creating monitor preview: {e}")
 
+    def _build_preview_frames(self, parent, thumbnails):
+        """Create one labelled frame per monitor thumbnail and return the image labels"""
+        # Enumerate monitors once for all thumbnails
+        try:
+            monitors = self.analyzer.get_monitors()
+        except Exception:
+            monitors = []
+
+        labels = []
+        for i, thumbnail in enumerate(thumbnails):
+            monitor_frame = tk.LabelFrame(
+                parent,
+                text=f"Monitor {i + 1}",
+                padx=10,
+                pady=10,
+                font=self._font_frame
+            )
+            monitor_frame.pack(fill=tk.X, padx=15, pady=8)
+
+            photo = self._thumbnail_photo(i, thumbnail)
+
+            # Keep reference to prevent garbage collection
+            label = tk.Label(monitor_frame, image=photo)
+            label.image = photo
+            label.pack()
+            labels.append(label)
 
+            # Add monitor info
+            try:
+                mon = monitors[i]
+                info_text = f"Size: {mon['width']}x{mon['height']} | Position: ({mon['left']}, {mon['top']})"
+                tk.Label(
+                    monitor_frame,
+                    text=info_text,
+                    font=self._font_info,
+                    fg="gray"
+                ).pack(pady=5)
+            except:
+                pass
+
+        # Drop pooled images for monitors that are gone
+        del self._photo_pool[len(thumbnails):]
+        del self._photo_keys[len(thumbnails):]
+        return labels
+
+    def _thumbnail_photo(self, index, thumbnail):
+        """Get the pooled PhotoImage for a monitor slot, updated in place with the thumbnail"""
+        key = hash(thumbnail.tobytes())
+        if index < len(self._photo_pool):
+            photo = self._photo_pool[index]
+            if photo.width() == thumbnail.width and photo.height() == thumbnail.height:
+                # Paste into the existing Tk image; skip it if the pixels are unchanged
+                if self._photo_keys[index] != key:
+                    photo.paste(thumbnail)
+                    self._photo_keys[index] = key
+                return photo
+
+        # Imported here; only the monitor preview needs ImageTk
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(thumbnail)
+        if index < len(self._photo_pool):
+            self._photo_pool[index] = photo
+            self._photo_keys[index] = key
+        else:
+            self._photo_pool.append(photo)
+            self._photo_keys.append(key)
+        return photo
 
     def log(self, message):
         """Add message to log and write to file"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
+        # Format the timestamp at most once per second; bursts reuse it
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        full_message = f"[{self._last_ts_str}] {message}\n"
+
+        # Log to GUI; the drain loop writes buffered lines in one widget update,
+        # so this is safe to call from any thread
+        self._log_buf.append(full_message)
+
+        # Log to file through the rotating, buffered file logger
+        logger.info(message)
+
+    def _prewarm_imports(self):
+        """Import seldom-used heavy modules in the background after startup"""
+        try:
+            _get_pygame()
+        except ImportError:
+            pass
+
+    def post_gui(self, func, *args):
+        """Queue a call to run on the Tk thread; safe to call from any thread"""
+        self._gui_queue.put((func, args))
 
-        # Log to GUI
+    def _drain_gui_queue(self):
+        """Run all queued GUI calls and flush the log widget, then re-arm"""
+        while True:
+            try:
+                func, args = self._gui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error in queued GUI update: {e}")
+        self._flush_log()
+        self.root.after(GUI_DRAIN_INTERVAL_MS, self._drain_gui_queue)
+
+    def _flush_log_file(self):
+        """Write buffered log records to the log file, then re-arm"""
+        flush_file_logs()
+        self.root.after(LOG_FILE_FLUSH_INTERVAL_MS, self._flush_log_file)
+
+    def _flush_log(self):
+        """Write all buffered log lines to the log widget in one insert"""
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        if not lines:
+            return
+
+        # Only follow new output if the user has not scrolled back through history
+        at_bottom = self.log_text.yview()[1] >= 0.999
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, full_message)
-        self.log_text.see(tk.END)
+        self.log_text.insert(tk.END, "".join(lines))
+        # Trim the oldest lines so the widget does not grow without bound
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+        if at_bottom:
+            self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
-        # Log to file
+    def register_scroll_canvas(self, canvas):
+        """Scroll canvas with the mouse wheel while the pointer is over it"""
+        self._scroll_canvases.add(canvas)
+
+    def _on_mousewheel(self, event):
+        """Scroll the registered canvas under the pointer (one handler for the whole app)"""
         try:
-            with open("autoclicker_log.txt", "a", encoding="utf-8") as log_file:
-                log_file.write(full_message)
-        except Exception as e:
-            print(f"Error writing to log file: {e}")
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal widget, such as a combobox dropdown
+            return
+        while widget is not None:
+            if widget.winfo_class() in SELF_SCROLLING_CLASSES:
+                return
+            if widget in self._scroll_canvases:
+                steps = int(-1*(event.delta/120))
+                if steps:
+                    widget.yview_scroll(steps, "units")
+                return
+            widget = widget.master
 
     def update_status(self, message):
         """Update status bar"""
@@ -2695,6 +3173,7 @@ class AutoClickerGUI:
 
 def main():
     """Main entry point"""
+    setup_logging()
     root = tk.Tk()
     app = AutoClickerGUI(root)
     root.mainloop()
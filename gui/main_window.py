@@ -4,21 +4,31 @@ This is the central orchestrator that composes all tab components.
 """
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import tkinter.font as tkfont
 import threading
+import queue
 import os
 import json
 import time
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import heapq
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
-from PIL import Image, ImageTk
-import keyboard
-import pyautogui
+from PIL import Image
 
-from mouse_recorder import MouseRecorder
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+from mouse_recorder import RECORDING_FILETYPES, MouseRecorder, read_recording_file
 from auto_clicker import AutoClicker
 from screenshot_analyzer import ScreenshotAnalyzer
-from logging_config import get_logger
+from logging_config import flush_file_logs, get_logger, setup_logging
+from alarm_utils import (
+    ACTIONS_TEXT, DAYS_TEXT, actions_mask, days_mask, derive_alarm_fields,
+    next_fire_time, prune_trigger_keys, trigger_key
+)
 
 # Import tab components
 from gui.tabs.recording_tab import RecordingTab
@@ -28,10 +38,78 @@ from gui.tabs.alarm_tab import AlarmTab
 # Module logger
 logger = get_logger("gui")
 
+# Lines kept in the log widget; older lines are trimmed
+LOG_MAX_LINES = 5000
+
+# How often queued GUI work from worker threads is run on the Tk thread
+GUI_DRAIN_INTERVAL_MS = 50
+
+# How often buffered log records are written to the log file
+LOG_FILE_FLUSH_INTERVAL_MS = 1000
+
+# Quiet period before a requested settings save is written to disk
+SETTINGS_SAVE_DELAY_MS = 200
+
+# Widgets that scroll themselves on the mouse wheel; a canvas behind them is left alone
+SELF_SCROLLING_CLASSES = frozenset({"Text", "Listbox", "Treeview"})
+
+
+# pygame is imported on first use (or by the startup pre-warm) and kept here
+_pygame: Any = None
+
+
+def _get_pygame() -> Any:
+    """Import pygame once and return the module."""
+    global _pygame
+    if _pygame is None:
+        import pygame
+        _pygame = pygame
+    return _pygame
+
+
+# Reused encoders: settings are machine-written only, alarms stay readable
+_COMPACT_ENCODER: json.JSONEncoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_PRETTY_ENCODER: json.JSONEncoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Parsed JSON files by path: (st_mtime_ns, st_size, data)
+_SETTINGS_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def _load_json_cached(path: str) -> Any:
+    """Load a JSON file, reusing the parsed copy while the file is unchanged."""
+    st = os.stat(path)
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _cached_json(path: str) -> Any:
+    """Return the cached data for path if the file still matches it, else None."""
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    return None
+
+
+def _remember_json(path: str, data: Any) -> None:
+    """Record data as the parsed contents of a file that was just written."""
+    st = os.stat(path)
+    _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+
 
 class AutoClickerGUI:
     """Main GUI application with modular tab components."""
-    
+
     def __init__(self, root: tk.Tk) -> None:
         """Initialize the main window."""
         self.root = root
@@ -43,23 +121,76 @@ class AutoClickerGUI:
         self.root.minsize(800, 600)
 
         # Initialize components
-        self.recorder = MouseRecorder()
+        # Count updates come from the recorder's thread; see RecordingTab.post_event_count
+        self.recorder = MouseRecorder(count_callback=lambda count: self.recording_tab.post_event_count(count))
         self.clicker = AutoClicker()
-        self.analyzer = ScreenshotAnalyzer()
+        # Share the clicker's analyzer so its monitor and template caches serve both
+        self.analyzer: ScreenshotAnalyzer = self.clicker.analyzer
 
         # State variables
         self.is_recording: bool = False
         self.current_recording_file: Optional[str] = None
         self.loaded_events: List[Dict[str, Any]] = []
         self.img_click_running: bool = False
+        self._img_stop_event: threading.Event = threading.Event()
         self.alarms: List[Dict[str, Any]] = []
         self.alarm_monitor_running: bool = False
-        self.alarm_monitor_thread: Optional[threading.Thread] = None
+        self._alarm_after_id: Optional[str] = None
+        # Pending (fire time, alarm index) schedule; None means rebuild on the next tick
+        self._alarm_heap: Optional[List[Tuple[datetime, int]]] = None
+        self._alarm_cleanup_day: Optional[date] = None
+        # Set while monitoring is stopped; cuts short in-flight image search waits
+        self._alarm_stop_event: threading.Event = threading.Event()
+        self._alarms_dirty: bool = False
+        self._io_queue: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue()
+        self._alarm_action_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._save_pending_id: Optional[str] = None
+        # Settings key -> Tk variable, registered by the tabs as widgets are built
+        self.settings_vars: Dict[str, tk.Variable] = {}
+        # Install the system-wide F11/F12 hook; False keeps hotkeys to this window
+        self.global_hotkeys: bool = True
+        self._global_hotkeys_installed: bool = False
+        # Alarm dialog, built on first use and then hidden/shown
+        self._alarm_dialog: Optional[tk.Toplevel] = None
+        self._populate_alarm_dialog: Optional[Callable[[str, Optional[int]], None]] = None
+        self._recording_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+        self._photo_pool: List['ImageTk.PhotoImage'] = []
+        self._photo_keys: List[int] = []
+        self._preview_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._sound_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._sound_lock: threading.Lock = threading.Lock()
+        # Bounded because the log widget keeps only LOG_MAX_LINES anyway
+        self._log_buf: deque = deque(maxlen=LOG_MAX_LINES)
+        self._gui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._last_ts_sec: int = 0
+        self._last_ts_str: str = ""
         self.alarms_file: str = "alarms.json"
 
+        # Shared fonts for the monitor preview, so Tk resolves each font once
+        self._font_title: tkfont.Font = tkfont.Font(family="Arial", size=14, weight="bold")
+        self._font_frame: tkfont.Font = tkfont.Font(family="Arial", size=11, weight="bold")
+        self._font_info: tkfont.Font = tkfont.Font(family="Arial", size=9)
+
+        # One mouse wheel binding for the app, dispatched to the canvas under the pointer
+        self._scroll_canvases: Set[tk.Canvas] = set()
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+
         # Setup GUI
         self.setup_gui()
 
+        # Run queued GUI work and flush the log widget on the Tk thread
+        self.root.after(GUI_DRAIN_INTERVAL_MS, self._drain_gui_queue)
+        self.root.after(LOG_FILE_FLUSH_INTERVAL_MS, self._flush_log_file)
+
+        # Warm optional imports once the window is up, off the Tk thread
+        self.root.after_idle(lambda: threading.Thread(target=self._prewarm_imports, daemon=True).start())
+
+        # Alarm saves are written by a single background thread
+        threading.Thread(target=self._io_worker, daemon=True).start()
+
+        # Alarm actions (audio, playback, image search) run off the Tk thread
+        threading.Thread(target=self._alarm_worker, daemon=True).start()
+
     def setup_gui(self) -> None:
         """Setup the GUI layout."""
         # Title - more compact
@@ -162,20 +293,31 @@ class AutoClickerGUI:
         # Apply saved settings after all UI elements are created
         self.apply_saved_settings()
 
-        # Auto-start alarm monitoring if there are enabled alarms
-        self.auto_start_alarm_monitoring()
-
-        # Setup global hotkeys
-        self.setup_hotkeys()
+        # Auto-start alarm monitoring and install global hotkeys once the
+        # window has been drawn, so neither delays the first paint
+        self.root.after_idle(self.auto_start_alarm_monitoring)
+        self.root.after_idle(self.setup_hotkeys)
 
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def setup_hotkeys(self) -> None:
-        """Setup global keyboard shortcuts."""
+        """Setup keyboard shortcuts."""
+        if not self.global_hotkeys:
+            # Tk bindings only fire while this window has focus, but need no
+            # system-wide keyboard hook
+            self.root.bind_all("<F11>", lambda event: self.hotkey_start_image_click())
+            self.root.bind_all("<F12>", lambda event: self.hotkey_stop_image_click())
+            self.log("Hotkeys enabled (app window only): F11=Start Image Click, F12=Stop Image Click")
+            return
+
+        # The keyboard module installs a low-level hook so F12 can stop image
+        # click while another window has focus
         try:
+            import keyboard
             keyboard.add_hotkey('f11', self.hotkey_start_image_click, suppress=False)
             keyboard.add_hotkey('f12', self.hotkey_stop_image_click, suppress=False)
+            self._global_hotkeys_installed = True
             self.log("Hotkeys enabled: F11=Start Image Click, F12=Stop Image Click")
         except Exception as e:
             self.log(f"Warning: Could not setup hotkeys: {e}")
@@ -183,16 +325,16 @@ class AutoClickerGUI:
     def hotkey_start_image_click(self) -> None:
         """Hotkey handler for starting image click."""
         if not self.img_click_running:
-            self.root.after(0, self.image_click_tab.start_image_click)
+            self.post_gui(self.image_click_tab.start_image_click)
 
     def hotkey_stop_image_click(self) -> None:
         """Hotkey handler for stopping image click."""
         if self.img_click_running:
-            self.root.after(0, self.image_click_tab.stop_image_click)
+            self.post_gui(self.image_click_tab.stop_image_click)
 
     def manual_save_settings(self) -> None:
         """Manually save settings with user feedback."""
-        self.save_settings()
+        self._save_settings_now()
         self.log("Settings saved successfully!")
         self.update_status("Settings saved")
         self.root.after(2000, lambda: self.update_status("Ready"))
@@ -206,26 +348,31 @@ class AutoClickerGUI:
         self.root.after(2000, lambda: self.update_status("Ready"))
 
     def save_settings(self) -> None:
+        """Schedule a settings save, coalescing bursts of requests into one write."""
+        if self._save_pending_id is not None:
+            self.root.after_cancel(self._save_pending_id)
+        self._save_pending_id = self.root.after(SETTINGS_SAVE_DELAY_MS, self._save_settings_now)
+
+    def _save_settings_now(self) -> None:
         """Save current settings to file."""
-        settings: Dict[str, Any] = {
-            "last_playback_file": self.playback_filename_var.get() if hasattr(self, 'playback_filename_var') else "",
-            "playback_speed": self.speed_var.get() if hasattr(self, 'speed_var') else 1.0,
-            "template_image": self.template_image_var.get() if hasattr(self, 'template_image_var') else "",
-            "confidence": self.confidence_var.get() if hasattr(self, 'confidence_var') else 0.8,
-            "img_monitor": self.img_monitor_var.get() if hasattr(self, 'img_monitor_var') else 0,
-            "img_action_mode": self.img_action_mode_var.get() if hasattr(self, 'img_action_mode_var') else "click",
-            "img_repeat": self.img_repeat_var.get() if hasattr(self, 'img_repeat_var') else 1,
-            "img_interval": self.img_interval_var.get() if hasattr(self, 'img_interval_var') else 0.0,
-            "img_unlimited": self.img_unlimited_var.get() if hasattr(self, 'img_unlimited_var') else False,
-            "img_retry_on_not_found": self.img_retry_on_not_found_var.get() if hasattr(self, 'img_retry_on_not_found_var') else False,
-            "img_playback_file": self.img_playback_file_var.get() if hasattr(self, 'img_playback_file_var') else "",
-            "img_playback_speed": self.img_playback_speed_var.get() if hasattr(self, 'img_playback_speed_var') else 1.0,
-            "record_filename": self.record_filename_var.get() if hasattr(self, 'record_filename_var') else "recording.json",
-        }
+        if self._save_pending_id is not None:
+            self.root.after_cancel(self._save_pending_id)
+            self._save_pending_id = None
+
+        settings: Dict[str, Any] = {key: var.get() for key, var in self.settings_vars.items()}
+        settings["global_hotkeys"] = self.global_hotkeys
+
+        # Nothing changed since the last load or save; skip the rewrite
+        if settings == _cached_json(self.settings_file):
+            return
 
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Write a temp file and swap it in so a crash never leaves partial JSON
+            tmp_path = self.settings_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(_COMPACT_ENCODER.encode(settings))
+            os.replace(tmp_path, self.settings_file)
+            _remember_json(self.settings_file, settings)
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
 
@@ -235,9 +382,9 @@ class AutoClickerGUI:
             return
 
         try:
-            with open(self.settings_file, 'r') as f:
-                settings = json.load(f)
+            settings = _load_json_cached(self.settings_file)
             self.saved_settings = settings
+            self.global_hotkeys = settings.get("global_hotkeys", True)
             logger.info("Settings loaded from file")
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
@@ -251,35 +398,20 @@ class AutoClickerGUI:
         settings = self.saved_settings
 
         try:
-            if "last_playback_file" in settings and hasattr(self, 'playback_filename_var'):
-                self.playback_filename_var.set(settings["last_playback_file"])
-            if "playback_speed" in settings and hasattr(self, 'speed_var'):
-                self.speed_var.set(settings["playback_speed"])
-            if "template_image" in settings and hasattr(self, 'template_image_var'):
-                self.template_image_var.set(settings["template_image"])
-            if "confidence" in settings and hasattr(self, 'confidence_var'):
-                self.confidence_var.set(settings["confidence"])
-            if "img_monitor" in settings and hasattr(self, 'img_monitor_var'):
-                self.img_monitor_var.set(settings["img_monitor"])
-            if "img_action_mode" in settings and hasattr(self, 'img_action_mode_var'):
-                self.img_action_mode_var.set(settings["img_action_mode"])
-            if "img_repeat" in settings and hasattr(self, 'img_repeat_var'):
-                self.img_repeat_var.set(settings["img_repeat"])
-            if "img_interval" in settings and hasattr(self, 'img_interval_var'):
-                self.img_interval_var.set(settings["img_interval"])
-            if "img_unlimited" in settings and hasattr(self, 'img_unlimited_var'):
-                self.img_unlimited_var.set(settings["img_unlimited"])
-                if hasattr(self, 'image_click_tab'):
-                    self.image_click_tab.toggle_img_repeat_count()
-            if "img_retry_on_not_found" in settings and hasattr(self, 'img_retry_on_not_found_var'):
-                self.img_retry_on_not_found_var.set(settings["img_retry_on_not_found"])
-            if "img_playback_file" in settings and hasattr(self, 'img_playback_file_var'):
-                self.img_playback_file_var.set(settings["img_playback_file"])
-            if "img_playback_speed" in settings and hasattr(self, 'img_playback_speed_var'):
-                self.img_playback_speed_var.set(settings["img_playback_speed"])
-            if "record_filename" in settings and hasattr(self, 'record_filename_var'):
-                self.record_filename_var.set(settings["record_filename"])
-
+            for key, value in settings.items():
+                var = self.settings_vars.get(key)
+                if var is None:
+                    continue
+                # Only write values that differ so unchanged variables do not fire traces
+                try:
+                    unchanged = var.get() == value
+                except tk.TclError:
+                    unchanged = False  # Entry holds text the variable cannot parse
+                if not unchanged:
+                    var.set(value)
+
+            if "img_unlimited" in settings and hasattr(self, 'image_click_tab'):
+                self.image_click_tab.toggle_img_repeat_count()
             if hasattr(self, 'image_click_tab'):
                 self.image_click_tab.update_img_action_controls()
 
@@ -298,8 +430,11 @@ class AutoClickerGUI:
             return
 
         try:
-            with open(self.alarms_file, 'r') as f:
-                self.alarms = json.load(f)
+            self.alarms = _load_json_cached(self.alarms_file)
+            today = date.today()
+            for alarm in self.alarms:
+                derive_alarm_fields(alarm)
+                prune_trigger_keys(alarm, today)
             logger.info(f"Loaded {len(self.alarms)} alarms from {self.alarms_file}")
             if hasattr(self, 'alarm_listbox'):
                 self.refresh_alarm_list()
@@ -308,101 +443,165 @@ class AutoClickerGUI:
             self.alarms = []
 
     def save_alarms(self) -> None:
-        """Save alarms to separate alarms.json file."""
-        try:
-            with open(self.alarms_file, 'w') as f:
-                json.dump(self.alarms, f, indent=2)
-            logger.info(f"Saved {len(self.alarms)} alarms to {self.alarms_file}")
-        except Exception as e:
-            logger.error(f"Error saving alarms: {e}")
+        """Queue alarms.json for writing and reschedule a running monitor."""
+        self._queue_alarms_write()
+        # Every alarm edit ends here, so rebuild the monitor's schedule
+        self._alarm_heap = None
+        if self.alarm_monitor_running:
+            self._schedule_alarm_tick(0)
+
+    def _queue_alarms_write(self) -> None:
+        """Queue a snapshot of the alarms for the writer thread."""
+        # Copy each alarm so later edits cannot change the snapshot mid-write;
+        # underscore keys are scheduler-only fields (derive_alarm_fields) and stay out of the file
+        snapshot = []
+        for alarm in self.alarms:
+            saved = {key: value for key, value in alarm.items() if not key.startswith('_')}
+            if 'triggered_today' in saved:
+                saved['triggered_today'] = dict(saved['triggered_today'])
+            snapshot.append(saved)
+        self._alarms_dirty = False
+        self._io_queue.put((self.alarms_file, snapshot))
+
+    def _io_worker(self) -> None:
+        """Write queued snapshots to disk, one at a time, until a None sentinel."""
+        while True:
+            item = self._io_queue.get()
+            try:
+                if item is None:
+                    return
+                path, payload = item
+                tmp_path = path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(_PRETTY_ENCODER.encode(payload))
+                os.replace(tmp_path, path)
+                _remember_json(path, payload)
+                logger.info(f"Saved {len(payload)} alarms to {path}")
+            except Exception as e:
+                # Let the monitor or on_closing try again
+                self._alarms_dirty = True
+                logger.error(f"Error saving alarms: {e}")
+            finally:
+                self._io_queue.task_done()
 
     def auto_start_alarm_monitoring(self) -> None:
         """Automatically start alarm monitoring if there are enabled alarms."""
         if not self.alarms:
             return
 
-        enabled_count = sum(1 for alarm in self.alarms if alarm['enabled'])
-        if enabled_count > 0:
+        if any(alarm['enabled'] for alarm in self.alarms):
             self.start_alarm_monitor()
+            enabled_count = sum(1 for alarm in self.alarms if alarm['enabled'])
             logger.info(f"Auto-started alarm monitoring with {enabled_count} enabled alarms")
 
+    def _format_alarm_line(self, alarm: Dict[str, Any]) -> str:
+        """Format a single alarm as a listbox row."""
+        # Weekday and action labels come from precomputed bitmask tables;
+        # the weekday mask is cached on the alarm by derive_alarm_fields
+        weekdays = alarm['_days_mask'] if '_days_mask' in alarm else days_mask(alarm.get('days', ()))
+        return (
+            f"{'✓ ON' if alarm['enabled'] else '✗ OFF'} | "
+            f"{alarm['hour']}:{alarm['minute']:02d} {alarm.get('am_pm', 'AM')} | "
+            f"{DAYS_TEXT[weekdays]} | {ACTIONS_TEXT[actions_mask(alarm)]}"
+        )
+
     def refresh_alarm_list(self) -> None:
         """Refresh the alarm list display."""
-        self.alarm_listbox.delete(0, tk.END)
-        for alarm in self.alarms:
-            status = "✓ ON" if alarm['enabled'] else "✗ OFF"
-            hour = alarm['hour']
-            minute = alarm['minute']
-            am_pm = alarm.get('am_pm', 'AM')
-            time_str = f"{hour}:{minute:02d} {am_pm}"
-
-            actions = []
-            if alarm.get('play_recording', False):
-                actions.append("Rec")
-            if alarm.get('play_mp3', False):
-                actions.append("MP3")
-            if alarm.get('pause_autoclicker', False):
-                actions.append("Pause")
-            if alarm.get('start_autoclicker', False):
-                actions.append("Start")
-            if alarm.get('click_image', False):
-                actions.append("Img")
-            action_text = "+".join(actions) if actions else "None"
-
-            days = alarm.get('days', [])
-            if len(days) == 7:
-                days_text = "Every day"
-            elif days:
-                day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-                days_text = ",".join([day_names[d] for d in sorted(days)])
-            else:
-                days_text = "No days"
+        rows = tuple(self._format_alarm_line(alarm) for alarm in self.alarms)
+        shown = self.alarm_listbox.get(0, tk.END)
+        if len(rows) != len(shown):
+            # Replace every row at once through the listbox's list variable
+            self._alarm_listvar.set(rows)
+            return
 
-            display_text = f"{status} | {time_str} | {days_text} | {action_text}"
-            self.alarm_listbox.insert(tk.END, display_text)
+        # Same row count: patch only the rows whose text changed, which keeps
+        # the selection and scroll position of the untouched rows
+        for index, (old, new) in enumerate(zip(shown, rows)):
+            if old != new:
+                self.alarm_listbox.delete(index)
+                self.alarm_listbox.insert(index, new)
+
+    def _refresh_alarm_row(self, index: int) -> None:
+        """Re-render a single alarm row in place and keep it selected."""
+        self.alarm_listbox.delete(index)
+        self.alarm_listbox.insert(index, self._format_alarm_line(self.alarms[index]))
+        self.alarm_listbox.selection_set(index)
 
     def show_alarm_dialog(self, mode: str = "add", alarm_index: Optional[int] = None) -> None:
         """Show dialog for adding or editing an alarm with enhanced features."""
+        # The dialog is built once, then hidden and re-shown with fresh values
+        if self._alarm_dialog is None or not self._alarm_dialog.winfo_exists():
+            self._alarm_dialog, self._populate_alarm_dialog = self._build_alarm_dialog()
+        self._populate_alarm_dialog(mode, alarm_index)
+
+        # Show the dialog and grab input (grab needs a mapped window)
+        self._alarm_dialog.deiconify()
+        self._alarm_dialog.lift()
+        self._alarm_dialog.grab_set()
+
+    def _build_alarm_dialog(self) -> Tuple[tk.Toplevel, Callable[[str, Optional[int]], None]]:
+        """
+        Create the alarm dialog widgets once.
+
+        Returns:
+            Tuple of (dialog, populate); populate(mode, alarm_index) loads an
+            alarm, or blank values for a new one, into the existing widgets
+        """
         dialog = tk.Toplevel(self.root)
-        dialog.title("Add Alarm" if mode == "add" else "Edit Alarm")
+        # Keep the dialog unmapped while it is built so Tk lays it out once
+        dialog.withdraw()
         dialog.geometry("500x650")
         dialog.resizable(True, True)
         dialog.transient(self.root)
-        dialog.grab_set()
 
-        # If editing, load existing alarm data
-        if mode == "edit" and alarm_index is not None:
-            alarm = self.alarms[alarm_index]
-        else:
-            alarm = None
+        # Alarm being edited; set by populate() each time the dialog is shown
+        mode = "add"
+        alarm_index: Optional[int] = None
+        alarm: Optional[Dict[str, Any]] = None
 
         # Create canvas with scrollbar for scrollable content
         canvas = tk.Canvas(dialog)
         scrollbar = tk.Scrollbar(dialog, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Coalesce bursts of <Configure> events into one scrollregion update
+        scroll_update_id: Optional[str] = None
+
+        def _update_scrollregion() -> None:
+            nonlocal scroll_update_id
+            scroll_update_id = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def _schedule_scrollregion(event: Any = None) -> None:
+            nonlocal scroll_update_id
+            if scroll_update_id is not None:
+                canvas.after_cancel(scroll_update_id)
+            scroll_update_id = canvas.after(50, _update_scrollregion)
+
+        def _cancel_scrollregion(event: Any) -> None:
+            if scroll_update_id is not None:
+                canvas.after_cancel(scroll_update_id)
+
+        scrollable_frame.bind("<Configure>", _schedule_scrollregion)
+        canvas.bind("<Destroy>", _cancel_scrollregion)
 
         window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
         # Make scrollable frame expand to fill canvas width
+        last_width: Optional[int] = None
+
         def _configure_canvas(event: Any) -> None:
-            canvas_width = event.width
-            canvas.itemconfig(window_id, width=canvas_width)
-            canvas.update_idletasks()
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            nonlocal last_width
+            if event.width != last_width:
+                last_width = event.width
+                canvas.itemconfig(window_id, width=event.width)
+            _schedule_scrollregion()
 
         canvas.bind("<Configure>", _configure_canvas)
 
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event: Any) -> None:
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Mouse wheel scrolling while the pointer is over the dialog
+        self.register_scroll_canvas(canvas)
 
         # Time settings (12-hour format with AM/PM)
         time_frame = tk.LabelFrame(scrollable_frame, text="Time (12-hour format)", padx=15, pady=10)
@@ -412,7 +611,7 @@ class AutoClickerGUI:
         time_inputs.pack()
 
         tk.Label(time_inputs, text="Hour:", font=("Arial", 9)).pack(side=tk.LEFT, padx=3)
-        hour_var = tk.IntVar(value=alarm.get('hour', 12) if alarm else 12)
+        hour_var = tk.IntVar(value=12)
         tk.Spinbox(
             time_inputs,
             from_=1,
@@ -423,7 +622,7 @@ class AutoClickerGUI:
         ).pack(side=tk.LEFT, padx=3)
 
         tk.Label(time_inputs, text="Minute:", font=("Arial", 9)).pack(side=tk.LEFT, padx=(10, 3))
-        minute_var = tk.IntVar(value=alarm.get('minute', 0) if alarm else 0)
+        minute_var = tk.IntVar(value=0)
         tk.Spinbox(
             time_inputs,
             from_=0,
@@ -433,7 +632,7 @@ class AutoClickerGUI:
             font=("Arial", 9)
         ).pack(side=tk.LEFT, padx=3)
 
-        am_pm_var = tk.StringVar(value=alarm.get('am_pm', 'AM') if alarm else 'AM')
+        am_pm_var = tk.StringVar(value='AM')
         am_pm_combo = ttk.Combobox(
             time_inputs,
             textvariable=am_pm_var,
@@ -454,7 +653,7 @@ class AutoClickerGUI:
         days_grid.pack()
 
         for i, day_name in enumerate(day_names):
-            var = tk.BooleanVar(value=i in alarm.get('days', []) if alarm else False)
+            var = tk.BooleanVar(value=False)
             day_vars.append(var)
             tk.Checkbutton(
                 days_grid,
@@ -482,11 +681,11 @@ class AutoClickerGUI:
         action_frame = tk.LabelFrame(scrollable_frame, text="Actions (Select one or more)", padx=15, pady=10)
         action_frame.pack(fill=tk.X, padx=15, pady=5)
 
-        play_recording_var = tk.BooleanVar(value=alarm.get('play_recording', False) if alarm else False)
-        play_mp3_var = tk.BooleanVar(value=alarm.get('play_mp3', False) if alarm else False)
-        pause_autoclicker_var = tk.BooleanVar(value=alarm.get('pause_autoclicker', False) if alarm else False)
-        start_autoclicker_var = tk.BooleanVar(value=alarm.get('start_autoclicker', False) if alarm else False)
-        click_image_var = tk.BooleanVar(value=alarm.get('click_image', False) if alarm else False)
+        play_recording_var = tk.BooleanVar(value=False)
+        play_mp3_var = tk.BooleanVar(value=False)
+        pause_autoclicker_var = tk.BooleanVar(value=False)
+        start_autoclicker_var = tk.BooleanVar(value=False)
+        click_image_var = tk.BooleanVar(value=False)
 
         tk.Checkbutton(action_frame, text="Play Recording", variable=play_recording_var, font=("Arial", 8)).pack(anchor=tk.W, pady=1)
         tk.Checkbutton(action_frame, text="Play MP3 File", variable=play_mp3_var, font=("Arial", 8)).pack(anchor=tk.W, pady=1)
@@ -498,14 +697,14 @@ class AutoClickerGUI:
         recording_frame = tk.LabelFrame(scrollable_frame, text="Recording File", padx=15, pady=8)
         recording_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        recording_file_var = tk.StringVar(value=alarm.get('recording_file', '') if alarm else '')
+        recording_file_var = tk.StringVar(value='')
         recording_entry_frame = tk.Frame(recording_frame)
         recording_entry_frame.pack(fill=tk.X, pady=3)
 
         tk.Entry(recording_entry_frame, textvariable=recording_file_var, font=("Arial", 8), state='readonly').pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 3))
 
         def browse_recording() -> None:
-            filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+            filename = filedialog.askopenfilename(filetypes=RECORDING_FILETYPES)
             if filename:
                 recording_file_var.set(filename)
 
@@ -515,7 +714,7 @@ class AutoClickerGUI:
         mp3_frame = tk.LabelFrame(scrollable_frame, text="MP3 File", padx=15, pady=8)
         mp3_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        mp3_file_var = tk.StringVar(value=alarm.get('mp3_file', '') if alarm else '')
+        mp3_file_var = tk.StringVar(value='')
         mp3_entry_frame = tk.Frame(mp3_frame)
         mp3_entry_frame.pack(fill=tk.X, pady=3)
 
@@ -532,76 +731,68 @@ class AutoClickerGUI:
         image_frame = tk.LabelFrame(scrollable_frame, text="Image Files (for Click on Image)", padx=15, pady=8)
         image_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        # Initialize image_files list from alarm data
-        image_files_list: List[Dict[str, Any]] = []
-        if alarm:
-            if 'image_file' in alarm and alarm['image_file']:
-                image_files_list = [{'file': alarm['image_file'], 'monitor': alarm.get('image_monitor', 0)}]
-            elif 'image_files' in alarm:
-                image_files_list = alarm['image_files']
-
-        images_container = tk.Frame(image_frame)
-        images_container.pack(fill=tk.X, pady=3)
-
-        image_entries: List[tuple] = []
-
-        def add_image_entry(image_data: Optional[Dict[str, Any]] = None) -> None:
-            entry_frame = tk.Frame(images_container, bd=1, relief=tk.GROOVE, padx=5, pady=5)
-            entry_frame.pack(fill=tk.X, pady=2)
+        # One Treeview row per image; monitor choices are refreshed on every show
+        monitor_options: List[str] = ["All Monitors"]
 
-            file_var = tk.StringVar(value=image_data['file'] if image_data else '')
-            monitor_var = tk.IntVar(value=image_data['monitor'] if image_data else 0)
+        def monitor_label(monitor_index: int) -> str:
+            if monitor_index < len(monitor_options):
+                return monitor_options[monitor_index]
+            return f"Monitor {monitor_index}"
 
-            file_frame = tk.Frame(entry_frame)
-            file_frame.pack(fill=tk.X)
+        image_tree = ttk.Treeview(image_frame, columns=('file', 'monitor'), show='headings', height=4, selectmode='extended')
+        image_tree.heading('file', text='Image File')
+        image_tree.heading('monitor', text='Monitor')
+        image_tree.column('file', width=280)
+        image_tree.column('monitor', width=100, anchor=tk.CENTER)
+        image_tree.pack(fill=tk.X, pady=3)
 
-            tk.Entry(file_frame, textvariable=file_var, font=("Arial", 8), state='readonly').pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 3))
+        image_monitors: Dict[str, int] = {}
 
-            def browse_image() -> None:
-                filename = filedialog.askopenfilename(filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp"), ("All files", "*.*")])
-                if filename:
-                    file_var.set(filename)
+        def add_image_row(file_path: str, monitor_index: int) -> None:
+            item = image_tree.insert('', tk.END, values=(file_path, monitor_label(monitor_index)))
+            image_monitors[item] = monitor_index
 
-            tk.Button(file_frame, text="Browse", command=browse_image, font=("Arial", 7), cursor="hand2", width=8).pack(side=tk.LEFT, padx=2)
+        image_toolbar = tk.Frame(image_frame)
+        image_toolbar.pack(fill=tk.X, pady=(5, 0))
 
-            def remove_entry() -> None:
-                entry_frame.destroy()
-                image_entries.remove((file_var, monitor_var, entry_frame))
+        tk.Label(image_toolbar, text="Monitor:", font=("Arial", 7)).pack(side=tk.LEFT, padx=(0, 5))
+        monitor_combo = ttk.Combobox(image_toolbar, values=monitor_options, state='readonly', font=("Arial", 7), width=13)
+        monitor_combo.current(0)
+        monitor_combo.pack(side=tk.LEFT)
 
-            tk.Button(file_frame, text="✕", command=remove_entry, font=("Arial", 8, "bold"), fg="red", cursor="hand2", width=2).pack(side=tk.LEFT)
+        def on_monitor_change(event: Any) -> None:
+            monitor_index = monitor_combo.current()
+            for item in image_tree.selection():
+                image_monitors[item] = monitor_index
+                image_tree.set(item, 'monitor', monitor_label(monitor_index))
 
-            monitor_frame = tk.Frame(entry_frame)
-            monitor_frame.pack(fill=tk.X, pady=(3, 0))
+        monitor_combo.bind('<<ComboboxSelected>>', on_monitor_change)
 
-            tk.Label(monitor_frame, text="Monitor:", font=("Arial", 7)).pack(side=tk.LEFT, padx=(0, 5))
+        def on_image_select(event: Any) -> None:
+            selection = image_tree.selection()
+            if selection and image_monitors[selection[0]] < len(monitor_options):
+                monitor_combo.current(image_monitors[selection[0]])
 
-            monitor_options = ["All Monitors"] + [f"Monitor {i+1}" for i in range(len(self.analyzer.get_monitors()))]
-            monitor_combo = ttk.Combobox(monitor_frame, values=monitor_options, state='readonly', font=("Arial", 7), width=13)
-            monitor_combo.current(monitor_var.get())
-            monitor_combo.pack(side=tk.LEFT)
+        image_tree.bind('<<TreeviewSelect>>', on_image_select)
 
-            def on_monitor_change(event: Any) -> None:
-                monitor_var.set(monitor_combo.current())
-
-            monitor_combo.bind('<<ComboboxSelected>>', on_monitor_change)
-            image_entries.append((file_var, monitor_var, entry_frame))
-
-        if image_files_list:
-            for img_data in image_files_list:
-                add_image_entry(img_data)
-        else:
-            add_image_entry()
+        def browse_image() -> None:
+            filename = filedialog.askopenfilename(filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp"), ("All files", "*.*")])
+            if filename:
+                add_image_row(filename, monitor_combo.current())
 
-        add_btn_frame = tk.Frame(image_frame)
-        add_btn_frame.pack(fill=tk.X, pady=(5, 0))
+        def remove_selected_images() -> None:
+            for item in image_tree.selection():
+                image_tree.delete(item)
+                del image_monitors[item]
 
-        tk.Button(add_btn_frame, text="+ Add Another Image", command=lambda: add_image_entry(), font=("Arial", 8), cursor="hand2", bg="#4CAF50", fg="white").pack()
+        tk.Button(image_toolbar, text="✕ Remove", command=remove_selected_images, font=("Arial", 8), fg="red", cursor="hand2").pack(side=tk.RIGHT, padx=2)
+        tk.Button(image_toolbar, text="+ Add Image", command=browse_image, font=("Arial", 8), cursor="hand2", bg="#4CAF50", fg="white").pack(side=tk.RIGHT, padx=2)
 
         # Playback speed
         speed_frame = tk.LabelFrame(scrollable_frame, text="Recording Playback Speed", padx=15, pady=8)
         speed_frame.pack(fill=tk.X, padx=15, pady=3)
 
-        speed_var = tk.DoubleVar(value=alarm.get('speed', 1.0) if alarm else 1.0)
+        speed_var = tk.DoubleVar(value=1.0)
         speed_inputs = tk.Frame(speed_frame)
         speed_inputs.pack()
 
@@ -615,74 +806,133 @@ class AutoClickerGUI:
 
         # Save button
         def save_alarm() -> None:
-            canvas.unbind_all("<MouseWheel>")
-
-            if not (play_recording_var.get() or play_mp3_var.get() or pause_autoclicker_var.get() or start_autoclicker_var.get() or click_image_var.get()):
-                messagebox.showwarning("No Action Selected", "Please select at least one action")
-                return
-
-            if play_recording_var.get() and not recording_file_var.get():
-                messagebox.showwarning("Input Required", "Please select a recording file")
-                return
-
-            if play_mp3_var.get() and not mp3_file_var.get():
-                messagebox.showwarning("Input Required", "Please select an MP3 file")
-                return
-
+            # Read every dialog variable once; each .get() is a Tcl round-trip
+            hour, minute, am_pm = hour_var.get(), minute_var.get(), am_pm_var.get()
+            play_recording, play_mp3, pause_autoclicker, start_autoclicker, click_image = (
+                var.get() for var in (
+                    play_recording_var, play_mp3_var, pause_autoclicker_var,
+                    start_autoclicker_var, click_image_var
+                )
+            )
+            recording_file = recording_file_var.get()
+            mp3_file = mp3_file_var.get()
             selected_days = [i for i, var in enumerate(day_vars) if var.get()]
-            if not selected_days:
-                messagebox.showwarning("No Days Selected", "Please select at least one day")
+
+            warning: Optional[Tuple[str, str]] = None
+            if not (play_recording or play_mp3 or pause_autoclicker or start_autoclicker or click_image):
+                warning = ("No Action Selected", "Please select at least one action")
+            elif play_recording and not recording_file:
+                warning = ("Input Required", "Please select a recording file")
+            elif play_mp3 and not mp3_file:
+                warning = ("Input Required", "Please select an MP3 file")
+            elif not selected_days:
+                warning = ("No Days Selected", "Please select at least one day")
+            if warning:
+                messagebox.showwarning(*warning)
                 return
 
-            time_changed = False
-            if alarm:
-                if (alarm.get('hour') != hour_var.get() or alarm.get('minute') != minute_var.get() or alarm.get('am_pm') != am_pm_var.get()):
-                    time_changed = True
+            time_changed = bool(alarm) and (
+                (alarm.get('hour'), alarm.get('minute'), alarm.get('am_pm')) != (hour, minute, am_pm)
+            )
 
-            image_files = []
-            for file_var_item, monitor_var_item, _ in image_entries:
-                file_path = file_var_item.get()
-                if file_path:
-                    image_files.append({'file': file_path, 'monitor': monitor_var_item.get()})
+            image_files = [
+                {'file': image_tree.set(item, 'file'), 'monitor': image_monitors[item]}
+                for item in image_tree.get_children()
+            ]
 
             alarm_data = {
-                'hour': hour_var.get(),
-                'minute': minute_var.get(),
-                'am_pm': am_pm_var.get(),
+                'hour': hour,
+                'minute': minute,
+                'am_pm': am_pm,
                 'days': selected_days,
-                'play_recording': play_recording_var.get(),
-                'play_mp3': play_mp3_var.get(),
-                'pause_autoclicker': pause_autoclicker_var.get(),
-                'start_autoclicker': start_autoclicker_var.get(),
-                'click_image': click_image_var.get(),
-                'recording_file': recording_file_var.get(),
-                'mp3_file': mp3_file_var.get(),
+                'play_recording': play_recording,
+                'play_mp3': play_mp3,
+                'pause_autoclicker': pause_autoclicker,
+                'start_autoclicker': start_autoclicker,
+                'click_image': click_image,
+                'recording_file': recording_file,
+                'mp3_file': mp3_file,
                 'image_files': image_files,
                 'speed': speed_var.get(),
                 'enabled': alarm['enabled'] if alarm else True,
                 'triggered_today': {} if time_changed else (alarm.get('triggered_today', {}) if alarm else {})
             }
 
+            derive_alarm_fields(alarm_data)
+            if play_mp3:
+                self.preload_mp3(mp3_file)
+
             if mode == "add":
                 self.alarms.append(alarm_data)
-                self.log(f"Alarm added: {hour_var.get()}:{minute_var.get():02d} {am_pm_var.get()}")
+                self.log(f"Alarm added: {hour}:{minute:02d} {am_pm}")
             else:
                 self.alarms[alarm_index] = alarm_data
-                self.log(f"Alarm updated: {hour_var.get()}:{minute_var.get():02d} {am_pm_var.get()}")
+                self.log(f"Alarm updated: {hour}:{minute:02d} {am_pm}")
 
-            self.refresh_alarm_list()
+            # Patch only the affected row instead of rebuilding the list
+            if mode == "add":
+                self.alarm_listbox.insert(tk.END, self._format_alarm_line(alarm_data))
+            else:
+                self._refresh_alarm_row(alarm_index)
             self.save_alarms()
-            dialog.destroy()
+            close_dialog()
 
-        def cancel_dialog() -> None:
-            canvas.unbind_all("<MouseWheel>")
-            dialog.destroy()
+        def close_dialog() -> None:
+            # Hide instead of destroying so the widgets are reused next time
+            dialog.grab_release()
+            dialog.withdraw()
+
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
 
         btn_frame = tk.Frame(scrollable_frame)
         btn_frame.pack(pady=15)
 
         tk.Button(btn_frame, text="💾 Save Alarm", command=save_alarm, bg="#27ae60", fg="white", font=("Arial", 11, "bold"), padx=20, pady=10, cursor="hand2").pack(side=tk.LEFT, padx=5)
-        tk.Button(btn_frame, text="Cancel", command=cancel_dialog, bg="#95a5a6", fg="white", font=("Arial", 10, "bold"), padx=15, pady=8, cursor="hand2").pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Cancel", command=close_dialog, bg="#95a5a6", fg="white", font=("Arial", 10, "bold"), padx=15, pady=8, cursor="hand2").pack(side=tk.LEFT, padx=5)
+
+        def populate(new_mode: str, new_index: Optional[int]) -> None:
+            nonlocal mode, alarm_index, alarm
+            mode, alarm_index = new_mode, new_index
+            alarm = self.alarms[alarm_index] if mode == "edit" and alarm_index is not None else None
+            values: Dict[str, Any] = alarm or {}
+            dialog.title("Add Alarm" if mode == "add" else "Edit Alarm")
+
+            hour_var.set(values.get('hour', 12))
+            minute_var.set(values.get('minute', 0))
+            am_pm_var.set(values.get('am_pm', 'AM'))
+            days = values.get('days', [])
+            for i, var in enumerate(day_vars):
+                var.set(i in days)
+            play_recording_var.set(values.get('play_recording', False))
+            play_mp3_var.set(values.get('play_mp3', False))
+            pause_autoclicker_var.set(values.get('pause_autoclicker', False))
+            start_autoclicker_var.set(values.get('start_autoclicker', False))
+            click_image_var.set(values.get('click_image', False))
+            recording_file_var.set(values.get('recording_file', ''))
+            mp3_file_var.set(values.get('mp3_file', ''))
+            speed_var.set(values.get('speed', 1.0))
+
+            # Refresh the monitor choices, then reload the image rows
+            monitor_options[:] = ["All Monitors"] + [f"Monitor {i+1}" for i in range(len(self.analyzer.get_monitors()))]
+            monitor_combo.configure(values=monitor_options)
+            monitor_combo.current(0)
+            image_tree.delete(*image_tree.get_children())
+            image_monitors.clear()
+
+            # Older alarms store a single image instead of a list
+            if values.get('image_file'):
+                image_files_list = [{'file': values['image_file'], 'monitor': values.get('image_monitor', 0)}]
+            else:
+                image_files_list = values.get('image_files', [])
+            for img_data in image_files_list:
+                if img_data.get('file'):
+                    add_image_row(img_data['file'], img_data.get('monitor', 0))
+
+            canvas.yview_moveto(0)
+
+        # Lay the widgets out once while the dialog is still hidden
+        dialog.update_idletasks()
+        return dialog, populate
 
     def start_alarm_monitor(self) -> None:
         """Start monitoring all alarms."""
@@ -703,73 +953,132 @@ class AutoClickerGUI:
         self.log(f"Alarm monitoring started ({enabled_count} alarms active)")
         self.update_status(f"Monitoring {enabled_count} alarms")
 
-        def monitor_thread_func() -> None:
-            import time as time_module
-            while self.alarm_monitor_running:
-                now = datetime.now()
-                current_hour_24 = now.hour
-                current_minute = now.minute
-                current_weekday = now.weekday()
-
-                for alarm in self.alarms:
-                    if not alarm['enabled']:
-                        continue
-
-                    if current_weekday not in alarm.get('days', []):
-                        continue
-
-                    alarm_hour_12 = alarm['hour']
-                    am_pm = alarm.get('am_pm', 'AM')
-
-                    if am_pm == 'PM' and alarm_hour_12 != 12:
-                        alarm_hour_24 = alarm_hour_12 + 12
-                    elif am_pm == 'AM' and alarm_hour_12 == 12:
-                        alarm_hour_24 = 0
-                    else:
-                        alarm_hour_24 = alarm_hour_12
-
-                    alarm_minute = alarm['minute']
-                    trigger_key = f"{now.year}-{now.month}-{now.day}"
-
-                    if 'triggered_today' not in alarm:
-                        alarm['triggered_today'] = {}
-
-                    if (current_hour_24 == alarm_hour_24 and
-                        current_minute == alarm_minute and
-                        alarm['triggered_today'].get(trigger_key, False) == False):
-
-                        time_str = f"{alarm_hour_12}:{alarm_minute:02d} {am_pm}"
-                        self.log(f"ALARM! Triggering: {time_str}")
-
-                        if alarm.get('play_mp3', False):
-                            self.play_mp3(alarm.get('mp3_file', ''))
-
-                        if alarm.get('play_recording', False):
-                            self.play_alarm_recording(
-                                alarm.get('recording_file', ''),
-                                alarm.get('speed', 1.0)
-                            )
+        for alarm in self.alarms:
+            if alarm['enabled'] and alarm.get('play_mp3', False):
+                self.preload_mp3(alarm.get('mp3_file', ''))
+
+        self._alarm_stop_event.clear()
+        self._alarm_heap = None
+        self._alarm_cleanup_day = None
+        self._schedule_alarm_tick(0)
+
+    def _schedule_alarm_tick(self, delay_ms: int) -> None:
+        """Run the alarm monitor tick after delay_ms, replacing any pending tick."""
+        if self._alarm_after_id is not None:
+            self.root.after_cancel(self._alarm_after_id)
+        self._alarm_after_id = self.root.after(delay_ms, self._alarm_tick)
+
+    def _alarm_tick(self) -> None:
+        """Fire due alarms and schedule the next tick (runs on the Tk thread)."""
+        self._alarm_after_id = None
+        if not self.alarm_monitor_running:
+            return
 
-                        if alarm.get('click_image', False):
-                            self._execute_alarm_image_clicks(alarm)
+        # One clock read serves the whole pass; the date comes from the same reading
+        now = datetime.now()
+
+        # Trigger keys only age across midnight, so prune them once a day
+        today = now.date()
+        if today != self._alarm_cleanup_day:
+            for alarm in self.alarms:
+                prune_trigger_keys(alarm, today)
+            self._alarm_cleanup_day = today
+
+        # Rebuild the schedule on start and whenever alarms change
+        if self._alarm_heap is None:
+            self._alarm_heap = self._build_alarm_heap(now)
+        heap = self._alarm_heap
+        alarms = self.alarms
+
+        # Fire every alarm that is due, then queue its next occurrence
+        while heap and heap[0][0] <= now:
+            fire_at, index = heapq.heappop(heap)
+            if index >= len(alarms):
+                continue
+            alarm = alarms[index]
+            # Skip alarms whose minute passed while the event loop was busy or asleep
+            if (now - fire_at).total_seconds() < 60:
+                self._fire_alarm(alarm, fire_at)
+            next_at = next_fire_time(alarm, now)
+            if next_at is not None:
+                heapq.heappush(heap, (next_at, index))
+
+        # Write trigger state once for all alarms fired in this tick
+        if self._alarms_dirty:
+            self._queue_alarms_write()
+
+        # Run again when the next alarm is due, or else on the next minute boundary,
+        # the finest granularity an alarm has, so wall-clock adjustments are picked up
+        now = datetime.now()
+        timeout = 60.0 - now.second - now.microsecond / 1e6
+        if heap:
+            timeout = min(timeout, max(0.0, (heap[0][0] - now).total_seconds()))
+        self._schedule_alarm_tick(int(timeout * 1000) + 1)
+
+    def _build_alarm_heap(self, now: datetime) -> List[Tuple[datetime, int]]:
+        """Build a min-heap of (next fire time, alarm index) for enabled alarms."""
+        heap: List[Tuple[datetime, int]] = []
+        for index, alarm in enumerate(self.alarms):
+            fire_at = next_fire_time(alarm, now)
+            if fire_at is not None:
+                heap.append((fire_at, index))
+        heapq.heapify(heap)
+        return heap
+
+    def _fire_alarm(self, alarm: Dict[str, Any], fire_at: datetime) -> None:
+        """Mark an alarm as triggered for the day and queue its actions."""
+        time_str = f"{alarm['hour']}:{alarm['minute']:02d} {alarm.get('am_pm', 'AM')}"
+        self.log(f"ALARM! Triggering: {time_str}")
+
+        triggered = alarm.setdefault('triggered_today', {})
+        triggered[trigger_key(fire_at)] = True
+        self._alarms_dirty = True
+
+        # The actions can block for seconds, so the monitor only hands them off
+        self._alarm_action_queue.put(alarm)
+
+    def _alarm_worker(self) -> None:
+        """Run queued alarm actions one alarm at a time."""
+        while True:
+            alarm = self._alarm_action_queue.get()
+            try:
+                self._run_alarm_actions(alarm)
+            except Exception as e:
+                logger.error(f"Error running alarm actions: {e}")
+
+    def _run_alarm_actions(self, alarm: Dict[str, Any]) -> None:
+        """Run all actions of a fired alarm (runs on the alarm worker thread)."""
+        if alarm.get('play_mp3', False):
+            self.play_mp3(alarm.get('mp3_file', ''))
+
+        if alarm.get('play_recording', False):
+            self.play_alarm_recording(
+                alarm.get('recording_file', ''),
+                alarm.get('speed', 1.0)
+            )
 
-                        if alarm.get('pause_autoclicker', False):
-                            if self.img_click_running:
-                                self.image_click_tab.stop_image_click()
-                                self.log("Image Click stopped by alarm")
+        if alarm.get('click_image', False):
+            self._execute_alarm_image_clicks(alarm)
 
-                        if alarm.get('start_autoclicker', False):
-                            if not self.img_click_running:
-                                self.image_click_tab.start_image_click()
-                                self.log("Image Click started by alarm")
+        # Image Click start/stop touches widgets, so it is queued onto the Tk thread;
+        # queued calls run in order, so a pause still precedes a start
+        if alarm.get('pause_autoclicker', False):
+            self.post_gui(self._alarm_stop_image_click)
 
-                        alarm['triggered_today'][trigger_key] = True
-                        self.save_alarms()
+        if alarm.get('start_autoclicker', False):
+            self.post_gui(self._alarm_start_image_click)
 
-                time_module.sleep(1)
+    def _alarm_stop_image_click(self) -> None:
+        """Stop Image Click for an alarm (runs on the Tk thread)."""
+        if self.img_click_running:
+            self.image_click_tab.stop_image_click()
+            self.log("Image Click stopped by alarm")
 
-        self.alarm_monitor_thread = threading.Thread(target=monitor_thread_func, daemon=True)
-        self.alarm_monitor_thread.start()
+    def _alarm_start_image_click(self) -> None:
+        """Start Image Click for an alarm if it is idle (runs on the Tk thread)."""
+        if not self.img_click_running:
+            self.image_click_tab.start_image_click()
+            self.log("Image Click started by alarm")
 
     def _execute_alarm_image_clicks(self, alarm: Dict[str, Any]) -> None:
         """Execute image click actions for an alarm."""
@@ -804,6 +1113,12 @@ class AutoClickerGUI:
     def stop_alarm_monitor(self) -> None:
         """Stop monitoring all alarms."""
         self.alarm_monitor_running = False
+        if self._alarm_after_id is not None:
+            self.root.after_cancel(self._alarm_after_id)
+            self._alarm_after_id = None
+        self._alarm_stop_event.set()
+        if self._alarms_dirty:
+            self.save_alarms()
         self.start_monitor_btn.config(state=tk.NORMAL)
         self.stop_monitor_btn.config(state=tk.DISABLED)
         self.alarm_monitor_status_label.config(text="⚫ Monitoring: OFF", fg="gray")
@@ -829,38 +1144,40 @@ class AutoClickerGUI:
             image_name = os.path.basename(image_path)
             self.log(f"Searching for image: {image_name}")
 
-            while (max_retries == -1 or attempt < max_retries) and self.alarm_monitor_running:
-                try:
-                    result = self.analyzer.find_image_on_screen(image_path, confidence, monitor)
-
-                    if result:
-                        x, y, match_confidence = result
-
-                        if monitor is not None:
-                            monitors = self.analyzer.get_monitors()
-                            if monitor > 0 and monitor <= len(monitors):
-                                mon = monitors[monitor - 1]
-                                x += mon['left']
-                                y += mon['top']
-
-                        pyautogui.moveTo(x, y, duration=0.2)
-                        pyautogui.click()
-                        self.log(f"Image found and clicked at ({x}, {y}) with confidence {match_confidence:.2f}")
-                        return True
-                    else:
-                        attempt += 1
-                        if attempt == 1:
-                            self.log(f"Image not found, retrying every {retry_interval}s until found...")
-                        
-                        for _ in range(int(retry_interval * 10)):
-                            if not self.alarm_monitor_running:
+            # One capture handle serves every retry
+            with self.analyzer.capture_session() as sct:
+                while (max_retries == -1 or attempt < max_retries) and self.alarm_monitor_running:
+                    try:
+                        result = self.analyzer.find_image_on_screen(image_path, confidence, monitor, sct=sct)
+
+                        if result:
+                            x, y, match_confidence = result
+
+                            if monitor is not None:
+                                monitors = self.analyzer.get_monitors()
+                                if monitor > 0 and monitor <= len(monitors):
+                                    mon = monitors[monitor - 1]
+                                    x += mon['left']
+                                    y += mon['top']
+
+                            # Jump straight to the target and click; no tweened move
+                            self.clicker.click_at_position(x, y)
+                            self.log(f"Image found and clicked at ({x}, {y}) with confidence {match_confidence:.2f}")
+                            return True
+                        else:
+                            attempt += 1
+                            if attempt == 1:
+                                self.log(f"Image not found, retrying every {retry_interval}s until found...")
+
+                            # Stopping the monitor ends the wait at once
+                            if self._alarm_stop_event.wait(retry_interval):
                                 return False
-                            time.sleep(0.1)
 
-                except Exception as search_error:
-                    self.log(f"Error during image search (attempt {attempt}): {search_error}")
-                    time.sleep(retry_interval)
-                    attempt += 1
+                    except Exception as search_error:
+                        self.log(f"Error during image search (attempt {attempt}): {search_error}")
+                        attempt += 1
+                        if self._alarm_stop_event.wait(retry_interval):
+                            return False
 
             return False
 
@@ -871,31 +1188,69 @@ class AutoClickerGUI:
     def play_mp3(self, mp3_file: str) -> None:
         """Play an MP3 file."""
         try:
-            import pygame
-            pygame.mixer.init()
-            pygame.mixer.music.load(mp3_file)
-            pygame.mixer.music.play()
+            pygame = _get_pygame()
+            try:
+                self._get_sound(mp3_file).play()
+            except pygame.error:
+                # SDL_mixer builds without MP3 Sound support can still stream it
+                pygame.mixer.music.load(mp3_file)
+                pygame.mixer.music.play()
             self.log(f"Playing MP3: {mp3_file}")
         except Exception as e:
             self.log(f"Error playing MP3: {e}")
 
+    def _get_sound(self, mp3_file: str) -> Any:
+        """Return the decoded Sound for an MP3 file, decoding it again only if the file changed."""
+        pygame = _get_pygame()
+        # Open the audio device once; later alarms reuse the running mixer
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        stat = os.stat(mp3_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._sound_lock:
+            cached = self._sound_cache.get(mp3_file)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            sound = pygame.mixer.Sound(mp3_file)
+            self._sound_cache[mp3_file] = (stamp, sound)
+            return sound
+
+    def preload_mp3(self, mp3_file: str) -> None:
+        """Decode an alarm's MP3 in the background so firing it only has to play."""
+        def preload() -> None:
+            try:
+                self._get_sound(mp3_file)
+            except Exception:
+                pass  # play_mp3 falls back to streaming and reports real errors
+
+        if mp3_file:
+            threading.Thread(target=preload, daemon=True).start()
+
     def play_alarm_recording(self, recording_file: str, speed: float = 1.0) -> None:
         """Play a recording file for alarm."""
         try:
-            with open(recording_file, 'r') as f:
-                data = json.load(f)
-                events = data['events']
+            events = self._load_recording_events(recording_file)
 
             self.log(f"Playing recording: {recording_file}")
             self.clicker.play_recording(events, speed=speed)
         except Exception as e:
             self.log(f"Error playing recording: {e}")
 
+    def _load_recording_events(self, recording_file: str) -> List[Dict[str, Any]]:
+        """Return a recording's events, re-parsing only when the file has changed."""
+        stat = os.stat(recording_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._recording_cache.get(recording_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        events: List[Dict[str, Any]] = read_recording_file(recording_file)['events']
+        self._recording_cache[recording_file] = (stamp, events)
+        return events
+
     def show_monitor_preview(self) -> None:
         """Show preview window with thumbnails of all monitors."""
         try:
-            thumbnails = self.analyzer.get_monitor_thumbnails(max_width=300)
-
             preview_window = tk.Toplevel(self.root)
             preview_window.title("Monitor Preview")
             preview_window.geometry("700x600")
@@ -903,7 +1258,7 @@ class AutoClickerGUI:
             tk.Label(
                 preview_window,
                 text="Monitor Previews - Click to refresh",
-                font=("Arial", 14, "bold"),
+                font=self._font_title,
                 pady=10
             ).pack()
 
@@ -919,41 +1274,53 @@ class AutoClickerGUI:
             canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
             canvas.configure(yscrollcommand=scrollbar.set)
 
-            for i, thumbnail in enumerate(thumbnails):
-                monitor_frame = tk.LabelFrame(
-                    scrollable_frame,
-                    text=f"Monitor {i + 1}",
-                    padx=10,
-                    pady=10,
-                    font=("Arial", 11, "bold")
-                )
-                monitor_frame.pack(fill=tk.X, padx=15, pady=8)
-
-                photo = ImageTk.PhotoImage(thumbnail)
-                label = tk.Label(monitor_frame, image=photo)
-                label.image = photo  # type: ignore
-                label.pack()
-
-                try:
-                    monitors = self.analyzer.get_monitors()
-                    mon = monitors[i]
-                    info_text = f"Size: {mon['width']}x{mon['height']} | Position: ({mon['left']}, {mon['top']})"
-                    tk.Label(
-                        monitor_frame,
-                        text=info_text,
-                        font=("Arial", 9),
-                        fg="gray"
-                    ).pack(pady=5)
-                except:
-                    pass
+            # Thumbnails are captured on a worker thread; show a placeholder until then
+            tk.Label(
+                scrollable_frame,
+                text="Loading monitor previews...",
+                font=("Arial", 10),
+                fg="gray"
+            ).pack(pady=20)
+            labels: Optional[List[tk.Label]] = None
 
             canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
             scrollbar.pack(side="right", fill="y")
 
+            def show_thumbnails(future: Future) -> None:
+                """Put captured thumbnails into the preview (runs on the Tk thread)."""
+                nonlocal labels
+                if not preview_window.winfo_exists():
+                    return
+                refresh_btn.config(state=tk.NORMAL)
+                try:
+                    thumbnails = future.result()
+
+                    # Only rebuild the frames on first load or if a monitor was added or removed
+                    if labels is None or len(thumbnails) != len(labels):
+                        for child in scrollable_frame.winfo_children():
+                            child.destroy()
+                        labels = self._build_preview_frames(scrollable_frame, thumbnails)
+                        return
+
+                    for i, (label, thumbnail) in enumerate(zip(labels, thumbnails)):
+                        photo = self._thumbnail_photo(i, thumbnail)
+                        if label.image is not photo:  # type: ignore
+                            label.configure(image=photo)
+                            label.image = photo  # type: ignore
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to capture monitor previews: {e}")
+                    self.log(f"Error capturing monitor previews: {e}")
+
+            def refresh_previews() -> None:
+                """Capture fresh thumbnails without blocking the Tk thread."""
+                refresh_btn.config(state=tk.DISABLED)
+                future = self._preview_executor.submit(self.analyzer.get_monitor_thumbnails, max_width=300)
+                future.add_done_callback(lambda f: self.post_gui(show_thumbnails, f))
+
             refresh_btn = tk.Button(
                 preview_window,
                 text="🔄 Refresh Previews",
-                command=lambda: [preview_window.destroy(), self.show_monitor_preview()],
+                command=refresh_previews,
                 bg="#3498db",
                 fg="white",
                 font=("Arial", 10, "bold"),
@@ -963,41 +1330,189 @@ class AutoClickerGUI:
             )
             refresh_btn.pack(pady=10)
 
+            refresh_previews()
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create monitor preview: {e}")
             self.log(f"Error creating monitor preview: {e}")
 
+    def _build_preview_frames(self, parent: tk.Widget, thumbnails: List[Image.Image]) -> List[tk.Label]:
+        """Create one labelled frame per monitor thumbnail and return the image labels."""
+        # Enumerate monitors once for all thumbnails
+        try:
+            monitors: List[Dict[str, int]] = self.analyzer.get_monitors()
+        except Exception:
+            monitors = []
+
+        labels: List[tk.Label] = []
+        for i, thumbnail in enumerate(thumbnails):
+            monitor_frame = tk.LabelFrame(
+                parent,
+                text=f"Monitor {i + 1}",
+                padx=10,
+                pady=10,
+                font=self._font_frame
+            )
+            monitor_frame.pack(fill=tk.X, padx=15, pady=8)
+
+            photo = self._thumbnail_photo(i, thumbnail)
+            label = tk.Label(monitor_frame, image=photo)
+            label.image = photo  # type: ignore
+            label.pack()
+            labels.append(label)
+
+            try:
+                mon = monitors[i]
+                info_text = f"Size: {mon['width']}x{mon['height']} | Position: ({mon['left']}, {mon['top']})"
+                tk.Label(
+                    monitor_frame,
+                    text=info_text,
+                    font=self._font_info,
+                    fg="gray"
+                ).pack(pady=5)
+            except:
+                pass
+
+        # Drop pooled images for monitors that are gone
+        del self._photo_pool[len(thumbnails):]
+        del self._photo_keys[len(thumbnails):]
+        return labels
+
+    def _thumbnail_photo(self, index: int, thumbnail: Image.Image) -> 'ImageTk.PhotoImage':
+        """Get the pooled PhotoImage for a monitor slot, updated in place with the thumbnail."""
+        key = hash(thumbnail.tobytes())
+        if index < len(self._photo_pool):
+            photo = self._photo_pool[index]
+            if photo.width() == thumbnail.width and photo.height() == thumbnail.height:
+                # Paste into the existing Tk image; skip it if the pixels are unchanged
+                if self._photo_keys[index] != key:
+                    photo.paste(thumbnail)
+                    self._photo_keys[index] = key
+                return photo
+
+        # Imported here; only the monitor preview needs ImageTk
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(thumbnail)
+        if index < len(self._photo_pool):
+            self._photo_pool[index] = photo
+            self._photo_keys[index] = key
+        else:
+            self._photo_pool.append(photo)
+            self._photo_keys.append(key)
+        return photo
+
     def log(self, message: str) -> None:
         """Add message to log and write to file."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
+        # Format the timestamp at most once per second; bursts reuse it
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        full_message = f"[{self._last_ts_str}] {message}\n"
 
-        # Log to GUI
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, full_message)
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        # Log to GUI; the drain loop writes buffered lines in one widget update,
+        # so this is safe to call from any thread
+        self._log_buf.append(full_message)
 
         # Log to file via logger
         logger.info(message)
 
+    def _prewarm_imports(self) -> None:
+        """Import seldom-used heavy modules in the background after startup."""
+        try:
+            _get_pygame()
+        except ImportError:
+            pass
+
+    def post_gui(self, func: Callable[..., Any], *args: Any) -> None:
+        """Queue a call to run on the Tk thread; safe to call from any thread."""
+        self._gui_queue.put((func, args))
+
+    def _drain_gui_queue(self) -> None:
+        """Run all queued GUI calls and flush the log widget, then re-arm."""
+        while True:
+            try:
+                func, args = self._gui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Error in queued GUI update: {e}")
+        self._flush_log()
+        self.root.after(GUI_DRAIN_INTERVAL_MS, self._drain_gui_queue)
+
+    def _flush_log_file(self) -> None:
+        """Write buffered log records to the log file, then re-arm."""
+        flush_file_logs()
+        self.root.after(LOG_FILE_FLUSH_INTERVAL_MS, self._flush_log_file)
+
+    def _flush_log(self) -> None:
+        """Write all buffered log lines to the log widget in one insert."""
+        lines: List[str] = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        if not lines:
+            return
+
+        # Only follow new output if the user has not scrolled back through history
+        at_bottom = self.log_text.yview()[1] >= 0.999
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, "".join(lines))
+        # Trim the oldest lines so the widget does not grow without bound
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+        if at_bottom:
+            self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
+
+    def register_scroll_canvas(self, canvas: tk.Canvas) -> None:
+        """Scroll canvas with the mouse wheel while the pointer is over it."""
+        self._scroll_canvases.add(canvas)
+
+    def _on_mousewheel(self, event: Any) -> None:
+        """Scroll the registered canvas under the pointer (one handler for the whole app)."""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal widget, such as a combobox dropdown
+            return
+        while widget is not None:
+            if widget.winfo_class() in SELF_SCROLLING_CLASSES:
+                return
+            if widget in self._scroll_canvases:
+                steps = int(-1*(event.delta/120))
+                if steps:
+                    widget.yview_scroll(steps, "units")
+                return
+            widget = widget.master
+
     def update_status(self, message: str) -> None:
         """Update status bar."""
         self.status_bar.config(text=message)
 
     def on_closing(self) -> None:
         """Handle window closing."""
-        self.save_settings()
-
-        try:
-            keyboard.unhook_all()
-        except:
-            pass
+        self._save_settings_now()
+        if self._alarms_dirty:
+            self.save_alarms()
+        # Let the writer finish queued saves before the process exits
+        self._io_queue.put(None)
+        self._io_queue.join()
+
+        if self._global_hotkeys_installed:
+            try:
+                import keyboard
+                keyboard.unhook_all()
+            except:
+                pass
         self.root.destroy()
 
 
 def main() -> None:
     """Main entry point."""
+    setup_logging()
     root = tk.Tk()
     app = AutoClickerGUI(root)
     root.mainloop()
@@ -88,8 +88,11 @@ class AlarmTab(BaseTab):
         alarm_scrollbar = tk.Scrollbar(listbox_frame)
         alarm_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        # Rows are backed by a Tcl list variable so a full refresh is a single set
+        self.main_window._alarm_listvar = tk.StringVar()
         self.main_window.alarm_listbox = tk.Listbox(
             listbox_frame,
+            listvariable=self.main_window._alarm_listvar,
             yscrollcommand=alarm_scrollbar.set,
             font=("Segoe UI", 9),
             height=6,
@@ -178,7 +181,7 @@ class AlarmTab(BaseTab):
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this alarm?"):
             index = selection[0]
             del self.main_window.alarms[index]
-            self.main_window.refresh_alarm_list()
+            self.main_window.alarm_listbox.delete(index)
             self.log("Alarm deleted")
             self.main_window.save_alarms()
 
@@ -191,7 +194,7 @@ class AlarmTab(BaseTab):
 
         index = selection[0]
         self.main_window.alarms[index]['enabled'] = not self.main_window.alarms[index]['enabled']
-        self.main_window.refresh_alarm_list()
+        self.main_window._refresh_alarm_row(index)
         status = "enabled" if self.main_window.alarms[index]['enabled'] else "disabled"
         self.log(f"Alarm {status}")
         self.main_window.save_alarms()
@@ -67,22 +67,8 @@ class BaseTab:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event: Any) -> None:
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        # Bind to enter/leave events to enable scrolling when mouse is over the tab
-        def _bind_to_mousewheel(event: Any) -> None:
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        def _unbind_from_mousewheel(event: Any) -> None:
-            canvas.unbind_all("<MouseWheel>")
-
-        # Bind when mouse enters the canvas area
-        canvas.bind('<Enter>', _bind_to_mousewheel)
-        canvas.bind('<Leave>', _unbind_from_mousewheel)
-        scrollable_frame.bind('<Enter>', _bind_to_mousewheel)
-        scrollable_frame.bind('<Leave>', _unbind_from_mousewheel)
+        # Enable mouse wheel scrolling when the pointer is over the tab
+        self.main_window.register_scroll_canvas(canvas)
 
         # Make scrollable frame expand to fill canvas width
         def _configure_canvas(event: Any) -> None:
@@ -5,10 +5,11 @@ Handles image template matching and clicking functionality.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
-import json
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Optional, List, Dict, Any
 
 from gui.tabs.base_tab import BaseTab
+from mouse_recorder import RECORDING_FILETYPES, read_recording_file
 
 if TYPE_CHECKING:
     from gui.main_window import AutoClickerGUI
@@ -20,6 +21,7 @@ class ImageClickTab(BaseTab):
     def __init__(self, notebook: ttk.Notebook, main_window: 'AutoClickerGUI') -> None:
         """Initialize the image click tab."""
         super().__init__(notebook, main_window)
+        self._playback_panel: Optional[tk.Frame] = None
         
     def create(self) -> None:
         """Create the image template matching tab."""
@@ -93,6 +95,7 @@ class ImageClickTab(BaseTab):
         file_frame.pack(fill=tk.X, pady=5)
 
         self.main_window.template_image_var = tk.StringVar()
+        self.main_window.settings_vars["template_image"] = self.main_window.template_image_var
         filename_entry = tk.Entry(
             file_frame,
             textvariable=self.main_window.template_image_var,
@@ -123,6 +126,7 @@ class ImageClickTab(BaseTab):
         ).pack(side=tk.LEFT)
 
         self.main_window.confidence_var = tk.DoubleVar(value=0.8)
+        self.main_window.settings_vars["confidence"] = self.main_window.confidence_var
         confidence_scale = tk.Scale(
             conf_slider_frame,
             from_=0.5,
@@ -141,9 +145,17 @@ class ImageClickTab(BaseTab):
         )
         self.confidence_label.pack(side=tk.LEFT)
 
-        self.main_window.confidence_var.trace('w', lambda *args: self.confidence_label.config(
-            text=f"{self.main_window.confidence_var.get():.2f}"
-        ))
+        self.main_window.confidence_var.trace_add("write", self._on_confidence_changed)
+
+        # Auto-tune: judge a match by how clearly it beats the runner-up
+        self.main_window.img_auto_confidence_var = tk.BooleanVar(value=False)
+        self.main_window.settings_vars["img_auto_confidence"] = self.main_window.img_auto_confidence_var
+        tk.Checkbutton(
+            confidence_frame,
+            text="Auto-tune (accept a match that clearly stands out, ignoring the threshold)",
+            variable=self.main_window.img_auto_confidence_var,
+            font=("Arial", 9)
+        ).pack(anchor=tk.W)
 
         tk.Label(
             confidence_frame,
@@ -163,17 +175,11 @@ class ImageClickTab(BaseTab):
             font=("Arial", 9)
         ).pack(anchor=tk.W, pady=(0, 5))
 
-        # Get available monitors
-        try:
-            monitors = self.main_window.analyzer.get_monitors()
-            monitor_count = len(monitors)
-        except:
-            monitor_count = 1
-
         monitor_select_frame = tk.Frame(img_monitor_frame)
         monitor_select_frame.pack(fill=tk.X, pady=5)
 
         self.main_window.img_monitor_var = tk.IntVar(value=0)
+        self.main_window.settings_vars["img_monitor"] = self.main_window.img_monitor_var
 
         tk.Radiobutton(
             monitor_select_frame,
@@ -183,39 +189,24 @@ class ImageClickTab(BaseTab):
             font=("Arial", 9)
         ).pack(side=tk.LEFT, padx=5)
 
-        for i in range(monitor_count):
-            tk.Radiobutton(
-                monitor_select_frame,
-                text=f"Monitor {i + 1}",
-                variable=self.main_window.img_monitor_var,
-                value=i + 1,
-                font=("Arial", 9)
-            ).pack(side=tk.LEFT, padx=5)
-
-        # Preview button
-        if monitor_count > 1:
-            preview_btn = tk.Button(
-                monitor_select_frame,
-                text="👁 Preview Monitors",
-                command=self.main_window.show_monitor_preview,
-                bg="#16a085",
-                fg="white",
-                font=("Arial", 9, "bold"),
-                padx=10,
-                pady=5,
-                cursor="hand2"
-            )
-            preview_btn.pack(side=tk.LEFT, padx=10)
+        # Enumerate monitors off the Tk thread; their buttons are added when it finishes
+        future = self.main_window._preview_executor.submit(self.main_window.analyzer.get_monitors)
+        future.add_done_callback(
+            lambda f: self.main_window.post_gui(self._add_monitor_radios, monitor_select_frame, f)
+        )
 
         # Action Mode Selection
         action_mode_frame = tk.LabelFrame(content, text="Action When Found", padx=12, pady=12, font=("Segoe UI", 9))
         action_mode_frame.pack(fill=tk.X, padx=15, pady=8)
 
         self.main_window.img_action_mode_var = tk.StringVar(value="click")
+        self.main_window.settings_vars["img_action_mode"] = self.main_window.img_action_mode_var
 
         # Create playback variables here so they exist before update_img_action_controls is called
         self.main_window.img_playback_file_var = tk.StringVar()
+        self.main_window.settings_vars["img_playback_file"] = self.main_window.img_playback_file_var
         self.main_window.img_playback_speed_var = tk.DoubleVar(value=1.0)
+        self.main_window.settings_vars["img_playback_speed"] = self.main_window.img_playback_speed_var
 
         tk.Label(
             action_mode_frame,
@@ -261,6 +252,7 @@ class ImageClickTab(BaseTab):
 
         # Unlimited checkbox
         self.main_window.img_unlimited_var = tk.BooleanVar(value=False)
+        self.main_window.settings_vars["img_unlimited"] = self.main_window.img_unlimited_var
         unlimited_check = tk.Checkbutton(
             repeat_frame,
             text="♾️ Unlimited Repeats (runs until stopped or image not found)",
@@ -273,6 +265,7 @@ class ImageClickTab(BaseTab):
 
         # Keep retrying checkbox
         self.main_window.img_retry_on_not_found_var = tk.BooleanVar(value=False)
+        self.main_window.settings_vars["img_retry_on_not_found"] = self.main_window.img_retry_on_not_found_var
         retry_check = tk.Checkbutton(
             repeat_frame,
             text="🔄 Keep Retrying if Image Not Found (doesn't stop, waits and retries)",
@@ -288,6 +281,7 @@ class ImageClickTab(BaseTab):
         # Repeat count
         tk.Label(repeat_controls, text="Repeat Count:", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
         self.main_window.img_repeat_var = tk.IntVar(value=1)
+        self.main_window.settings_vars["img_repeat"] = self.main_window.img_repeat_var
         self.main_window.img_repeat_spinbox = tk.Spinbox(
             repeat_controls,
             from_=1,
@@ -301,6 +295,7 @@ class ImageClickTab(BaseTab):
         # Interval
         tk.Label(repeat_controls, text="Interval (seconds):", font=("Arial", 9)).pack(side=tk.LEFT, padx=(20, 5))
         self.main_window.img_interval_var = tk.DoubleVar(value=0.0)
+        self.main_window.settings_vars["img_interval"] = self.main_window.img_interval_var
         tk.Spinbox(
             repeat_controls,
             from_=0.0,
@@ -333,61 +328,101 @@ class ImageClickTab(BaseTab):
         if filename:
             self.main_window.template_image_var.set(filename)
 
-    def update_img_action_controls(self) -> None:
-        """Update the action controls based on selected mode."""
-        # Clear existing controls
-        for widget in self.main_window.img_action_controls_frame.winfo_children():
-            widget.destroy()
-
-        mode = self.main_window.img_action_mode_var.get()
-
-        if mode == "playback":
-            # Show recording file selection
-            tk.Label(
-                self.main_window.img_action_controls_frame,
-                text="Select recording to play when image is found:",
-                font=("Arial", 9)
-            ).pack(anchor=tk.W, pady=(0, 5))
+    def _on_confidence_changed(self, *_: Any) -> None:
+        """Show the confidence threshold next to its slider."""
+        self.confidence_label.config(text=f"{self.main_window.confidence_var.get():.2f}")
 
-            file_frame = tk.Frame(self.main_window.img_action_controls_frame)
-            file_frame.pack(fill=tk.X, pady=5)
+    def _add_monitor_radios(self, frame: tk.Frame, future: Future) -> None:
+        """Add a radio button per monitor, and the preview button if there are several."""
+        try:
+            monitor_count = len(future.result())
+        except Exception:
+            monitor_count = 1
 
-            filename_entry = tk.Entry(
-                file_frame,
-                textvariable=self.main_window.img_playback_file_var,
-                font=("Arial", 9),
-                state='readonly'
-            )
-            filename_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        for i in range(monitor_count):
+            tk.Radiobutton(
+                frame,
+                text=f"Monitor {i + 1}",
+                variable=self.main_window.img_monitor_var,
+                value=i + 1,
+                font=("Arial", 9)
+            ).pack(side=tk.LEFT, padx=5)
 
-            browse_btn = tk.Button(
-                file_frame,
-                text="Browse...",
-                command=self.browse_playback_file_for_image,
+        # Preview button
+        if monitor_count > 1:
+            preview_btn = tk.Button(
+                frame,
+                text="👁 Preview Monitors",
+                command=self.main_window.show_monitor_preview,
+                bg="#16a085",
+                fg="white",
+                font=("Arial", 9, "bold"),
+                padx=10,
+                pady=5,
                 cursor="hand2"
             )
-            browse_btn.pack(side=tk.LEFT)
-
-            # Playback speed
-            speed_frame = tk.Frame(self.main_window.img_action_controls_frame)
-            speed_frame.pack(fill=tk.X, pady=5)
-
-            tk.Label(speed_frame, text="Playback Speed:", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
-            tk.Spinbox(
-                speed_frame,
-                from_=0.1,
-                to=5.0,
-                increment=0.1,
-                textvariable=self.main_window.img_playback_speed_var,
-                width=8,
-                font=("Arial", 9)
-            ).pack(side=tk.LEFT, padx=5)
-            tk.Label(speed_frame, text="x", font=("Arial", 9)).pack(side=tk.LEFT)
+            preview_btn.pack(side=tk.LEFT, padx=10)
+
+    def update_img_action_controls(self) -> None:
+        """Show the controls for the selected action mode."""
+        if self.main_window.img_action_mode_var.get() == "playback":
+            # Built on first use and kept; switching modes only packs or forgets it
+            if self._playback_panel is None:
+                self._playback_panel = self._build_playback_panel()
+            self._playback_panel.pack(fill=tk.X)
+        elif self._playback_panel is not None:
+            self._playback_panel.pack_forget()
+
+    def _build_playback_panel(self) -> tk.Frame:
+        """Build the recording file and speed controls for playback mode."""
+        panel = tk.Frame(self.main_window.img_action_controls_frame)
+
+        tk.Label(
+            panel,
+            text="Select recording to play when image is found:",
+            font=("Arial", 9)
+        ).pack(anchor=tk.W, pady=(0, 5))
+
+        file_frame = tk.Frame(panel)
+        file_frame.pack(fill=tk.X, pady=5)
+
+        filename_entry = tk.Entry(
+            file_frame,
+            textvariable=self.main_window.img_playback_file_var,
+            font=("Arial", 9),
+            state='readonly'
+        )
+        filename_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+
+        browse_btn = tk.Button(
+            file_frame,
+            text="Browse...",
+            command=self.browse_playback_file_for_image,
+            cursor="hand2"
+        )
+        browse_btn.pack(side=tk.LEFT)
+
+        # Playback speed
+        speed_frame = tk.Frame(panel)
+        speed_frame.pack(fill=tk.X, pady=5)
+
+        tk.Label(speed_frame, text="Playback Speed:", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        tk.Spinbox(
+            speed_frame,
+            from_=0.1,
+            to=5.0,
+            increment=0.1,
+            textvariable=self.main_window.img_playback_speed_var,
+            width=8,
+            font=("Arial", 9)
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Label(speed_frame, text="x", font=("Arial", 9)).pack(side=tk.LEFT)
+        return panel
 
     def browse_playback_file_for_image(self) -> None:
         """Browse for recording file to play when image is found."""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=RECORDING_FILETYPES
         )
         if filename:
             self.main_window.img_playback_file_var.set(filename)
@@ -410,8 +445,10 @@ class ImageClickTab(BaseTab):
         self.main_window.start_img_click_btn.config(state=tk.DISABLED)
         self.main_window.stop_img_click_btn.config(state=tk.NORMAL)
         self.main_window.img_click_running = True
+        self.main_window._img_stop_event.clear()
 
         confidence = self.main_window.confidence_var.get()
+        auto_confidence = self.main_window.img_auto_confidence_var.get()
 
         # Get monitor selection
         monitor: Optional[int] = self.main_window.img_monitor_var.get()
@@ -426,11 +463,11 @@ class ImageClickTab(BaseTab):
 
         # Get action mode
         action_mode = self.main_window.img_action_mode_var.get()
-        playback_events: Optional[List[Dict[str, Any]]] = None
+        playback_file = ""
         playback_speed = 1.0
 
         if action_mode == "playback":
-            # Load recording file
+            # Recording file is parsed on the worker thread
             playback_file = self.main_window.img_playback_file_var.get()
             if not playback_file:
                 messagebox.showwarning("Input Required", "Please select a recording file for playback mode")
@@ -438,22 +475,22 @@ class ImageClickTab(BaseTab):
                 self.main_window.stop_img_click_btn.config(state=tk.DISABLED)
                 self.main_window.img_click_running = False
                 return
+            playback_speed = self.main_window.img_playback_speed_var.get()
 
+        def image_click_thread() -> None:
+            playback_events: Optional[List[Dict[str, Any]]] = None
             try:
-                with open(playback_file, 'r') as f:
-                    data = json.load(f)
-                    playback_events = data['events']
-                    playback_speed = self.main_window.img_playback_speed_var.get()
+                if action_mode == "playback":
+                    # Parse here so a large recording does not freeze the window
+                    try:
+                        playback_events = read_recording_file(playback_file)['events']
+                    except Exception as e:
+                        self.main_window.post_gui(
+                            messagebox.showerror, "Error", f"Failed to load recording: {e}"
+                        )
+                        return
                     self.log(f"Loaded {len(playback_events)} events from {playback_file}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load recording: {e}")
-                self.main_window.start_img_click_btn.config(state=tk.NORMAL)
-                self.main_window.stop_img_click_btn.config(state=tk.DISABLED)
-                self.main_window.img_click_running = False
-                return
 
-        def image_click_thread() -> None:
-            try:
                 self.log(f"Searching for image: {image_path}")
                 if monitor:
                     self.log(f"Using Monitor {monitor}")
@@ -466,7 +503,7 @@ class ImageClickTab(BaseTab):
                 if retry_on_not_found:
                     self.log(f"Retry mode: Will keep searching if image not found")
 
-                self.update_status("Searching for template image...")
+                self.main_window.post_gui(self.update_status, "Searching for template image...")
 
                 success = self.main_window.clicker.click_on_image(
                     image_path,
@@ -479,38 +516,41 @@ class ImageClickTab(BaseTab):
                     unlimited=unlimited,
                     retry_on_not_found=retry_on_not_found,
                     stop_flag=lambda: not self.main_window.img_click_running,
-                    log_callback=self.log
+                    log_callback=self.log,
+                    stop_event=self.main_window._img_stop_event,
+                    auto_confidence=auto_confidence
                 )
 
                 # Check if stopped by user before showing results
                 if not self.main_window.img_click_running:
                     # User stopped it, don't show any message
                     self.log("Image click stopped by user")
-                    self.update_status("Stopped")
+                    self.main_window.post_gui(self.update_status, "Stopped")
                 elif success:
                     if action_mode == "playback":
                         self.log("Image found and recording played!")
-                        self.update_status("Image found and recording played")
+                        self.main_window.post_gui(self.update_status, "Image found and recording played")
                     else:
                         self.log("Image found and clicked!")
-                        self.update_status("Image click successful")
+                        self.main_window.post_gui(self.update_status, "Image click successful")
                 else:
                     self.log("Image not found")
-                    self.update_status("Image not found")
+                    self.main_window.post_gui(self.update_status, "Image not found")
             except Exception as e:
                 self.log(f"Error during image click: {e}")
-                self.update_status("Error during image click")
+                self.main_window.post_gui(self.update_status, "Error during image click")
             finally:
                 # Re-enable buttons when done
                 self.main_window.img_click_running = False
-                self.main_window.start_img_click_btn.config(state=tk.NORMAL)
-                self.main_window.stop_img_click_btn.config(state=tk.DISABLED)
+                self.main_window.post_gui(lambda: self.main_window.start_img_click_btn.config(state=tk.NORMAL))
+                self.main_window.post_gui(lambda: self.main_window.stop_img_click_btn.config(state=tk.DISABLED))
 
         threading.Thread(target=image_click_thread, daemon=True).start()
 
     def stop_image_click(self) -> None:
         """Stop the image click process."""
         self.main_window.img_click_running = False
+        self.main_window._img_stop_event.set()
         self.log("Stopping image click...")
         self.update_status("Image click stopped by user")
 
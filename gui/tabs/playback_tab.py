@@ -5,9 +5,10 @@ Handles playing back recorded mouse actions.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from gui.tabs.base_tab import BaseTab
+from mouse_recorder import RECORDING_FILETYPES
 
 if TYPE_CHECKING:
     from gui.main_window import AutoClickerGUI
@@ -43,6 +44,7 @@ class PlaybackTab(BaseTab):
         file_frame.pack(fill=tk.X, pady=3)
 
         self.main_window.playback_filename_var = tk.StringVar()
+        self.main_window.settings_vars["last_playback_file"] = self.main_window.playback_filename_var
         filename_entry = tk.Entry(
             file_frame,
             textvariable=self.main_window.playback_filename_var,
@@ -94,6 +96,7 @@ class PlaybackTab(BaseTab):
         tk.Label(speed_frame, text="Playback Speed:", font=("Segoe UI", 9)).pack(side=tk.LEFT)
 
         self.main_window.speed_var = tk.DoubleVar(value=1.0)
+        self.main_window.settings_vars["playback_speed"] = self.main_window.speed_var
         speed_scale = tk.Scale(
             speed_frame,
             from_=0.1,
@@ -108,7 +111,7 @@ class PlaybackTab(BaseTab):
         self.speed_label = tk.Label(speed_frame, text="1.0x", font=("Segoe UI", 9, "bold"))
         self.speed_label.pack(side=tk.LEFT)
 
-        self.main_window.speed_var.trace('w', lambda *args: self.speed_label.config(text=f"{self.main_window.speed_var.get():.1f}x"))
+        self.main_window.speed_var.trace_add("write", self._on_speed_changed)
 
         # Play button
         play_btn = tk.Button(
@@ -134,10 +137,14 @@ class PlaybackTab(BaseTab):
         )
         warning_label.pack()
 
+    def _on_speed_changed(self, *_: Any) -> None:
+        """Show the playback speed next to its slider."""
+        self.speed_label.config(text=f"{self.main_window.speed_var.get():.1f}x")
+
     def browse_load_file(self) -> None:
         """Browse for recording file."""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=RECORDING_FILETYPES
         )
         if filename:
             self.main_window.playback_filename_var.set(filename)
@@ -149,15 +156,23 @@ class PlaybackTab(BaseTab):
             messagebox.showerror("Error", "Please select a file first")
             return
 
-        try:
-            self.main_window.loaded_events = self.main_window.recorder.load_recording(filename)
-            self.main_window.loaded_info_label.config(
-                text=f"Loaded {len(self.main_window.loaded_events)} events"
-            )
-            self.log(f"Loaded recording from {filename}")
-        except Exception as e:
-            self.log(f"Error loading recording: {e}")
-            messagebox.showerror("Error", f"Failed to load recording: {e}")
+        # Parse off the Tk thread so a large recording does not freeze the window
+        def load_thread() -> None:
+            try:
+                events = self.main_window.recorder.load_recording(filename)
+            except Exception as e:
+                self.log(f"Error loading recording: {e}")
+                self.main_window.post_gui(messagebox.showerror, "Error", f"Failed to load recording: {e}")
+                return
+            self.main_window.post_gui(self._show_loaded_recording, filename, events)
+
+        threading.Thread(target=load_thread, daemon=True).start()
+
+    def _show_loaded_recording(self, filename: str, events: List[Dict[str, Any]]) -> None:
+        """Make a freshly parsed recording the loaded one (runs on the Tk thread)."""
+        self.main_window.loaded_events = events
+        self.main_window.loaded_info_label.config(text=f"Loaded {len(events)} events")
+        self.log(f"Loaded recording from {filename}")
 
     def play_recording(self) -> None:
         """Play back the loaded recording."""
@@ -172,11 +187,11 @@ class PlaybackTab(BaseTab):
         def playback_thread() -> None:
             try:
                 self.main_window.clicker.play_recording(self.main_window.loaded_events, speed=speed)
-                self.root.after(0, lambda: self.log("Playback completed"))
-                self.root.after(0, lambda: self.update_status("Ready"))
+                self.log("Playback completed")
+                self.main_window.post_gui(self.update_status, "Ready")
             except Exception as e:
-                self.root.after(0, lambda: self.log(f"Playback error: {e}"))
-                self.root.after(0, lambda: self.update_status("Ready"))
+                self.log(f"Playback error: {e}")
+                self.main_window.post_gui(self.update_status, "Ready")
 
         thread = threading.Thread(target=playback_thread, daemon=True)
         thread.start()
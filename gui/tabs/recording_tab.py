@@ -7,6 +7,7 @@ from tkinter import ttk, filedialog, messagebox
 from typing import TYPE_CHECKING
 
 from gui.tabs.base_tab import BaseTab
+from mouse_recorder import RECORDING_FILETYPES
 
 if TYPE_CHECKING:
     from gui.main_window import AutoClickerGUI
@@ -18,6 +19,8 @@ class RecordingTab(BaseTab):
     def __init__(self, notebook: ttk.Notebook, main_window: 'AutoClickerGUI') -> None:
         """Initialize the recording tab."""
         super().__init__(notebook, main_window)
+        # True while a label refresh is queued, so bursts of counts collapse into one
+        self._event_count_pending: bool = False
         
     def create(self) -> None:
         """Create the mouse recorder tab."""
@@ -108,6 +111,7 @@ class RecordingTab(BaseTab):
         filename_frame.pack(fill=tk.X, pady=3)
 
         self.main_window.record_filename_var = tk.StringVar(value="recording.json")
+        self.main_window.settings_vars["record_filename"] = self.main_window.record_filename_var
         filename_entry = tk.Entry(
             filename_frame,
             textvariable=self.main_window.record_filename_var,
@@ -151,7 +155,7 @@ class RecordingTab(BaseTab):
         self.log("Recording started")
         self.update_status("Recording in progress...")
 
-        # Update event count periodically
+        # The recorder pushes count updates through count_callback while recording
         self.update_event_count()
 
     def stop_recording(self) -> None:
@@ -163,22 +167,25 @@ class RecordingTab(BaseTab):
         self.main_window.stop_record_btn.config(state=tk.DISABLED)
         self.main_window.record_status_label.config(text="⚫ Not Recording", fg="gray")
 
+        self.update_event_count()
         self.log(f"Recording stopped. Captured {len(events)} events")
         self.update_status("Recording stopped")
 
+    def post_event_count(self, count: int) -> None:
+        """Queue an event count label refresh from the recorder's thread, at most one at a time."""
+        if not self._event_count_pending:
+            self._event_count_pending = True
+            self.main_window.post_gui(self.update_event_count)
+
     def update_event_count(self) -> None:
         """Update the event count label."""
-        if self.main_window.is_recording:
-            count = len(self.main_window.recorder.events)
-            self.main_window.event_count_label.config(text=f"Events recorded: {count}")
-            self.root.after(100, self.update_event_count)
-        else:
-            count = len(self.main_window.recorder.events)
-            self.main_window.event_count_label.config(text=f"Events recorded: {count}")
+        self._event_count_pending = False
+        count = self.main_window.recorder.event_count
+        self.main_window.event_count_label.config(text=f"Events recorded: {count}")
 
     def save_recording(self) -> None:
         """Save the current recording."""
-        if not self.main_window.recorder.events:
+        if not self.main_window.recorder.event_count:
             messagebox.showwarning("No Recording", "No events to save. Please record something first.")
             return
 
@@ -190,7 +197,7 @@ class RecordingTab(BaseTab):
         try:
             # Save with all events - no optimization needed since timing is preserved
             self.main_window.recorder.save_recording(filename, optimize=False)
-            self.log(f"Recording saved to {filename} ({len(self.main_window.recorder.events)} events)")
+            self.log(f"Recording saved to {filename} ({self.main_window.recorder.event_count} events)")
             messagebox.showinfo("Success", f"Recording saved to {filename}")
         except Exception as e:
             self.log(f"Error saving recording: {e}")
@@ -200,7 +207,7 @@ class RecordingTab(BaseTab):
         """Browse for save location."""
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=RECORDING_FILETYPES
         )
         if filename:
             self.main_window.record_filename_var.set(filename)
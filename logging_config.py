@@ -1,9 +1,116 @@
 """
 Centralized logging configuration for the Auto Clicker application.
+
+File records are buffered and written in batches. Warnings and errors, a
+full buffer, or a buffer older than LOG_BUFFER_MAX_AGE_MS flush it; the
+listener thread also flushes whenever logging goes quiet for that long, so
+a hard crash loses at most about that much INFO/DEBUG output.
 """
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from typing import Optional
+from typing import Any, Optional
+
+# Rotate the log file at this size, keeping this many old files
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 5
+
+# Records buffered before a batched write; warnings and errors flush at once
+LOG_BUFFER_CAPACITY = 100
+# Also flush once the oldest buffered record is this old
+LOG_BUFFER_MAX_AGE_MS = 1000
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes pre-encoded records in batches.
+
+    emit() only encodes the record into a pending bytearray; flush() hands
+    the whole batch to a single os.write on the file descriptor. The file
+    size is tracked in memory, so rollover checks need no seek per record.
+    os.write bypasses the text stream's newline translation, so emit()
+    writes os.linesep itself and the file keeps the platform's line endings.
+    """
+
+    def __init__(self, filename: str, **kwargs: Any) -> None:
+        super().__init__(filename, **kwargs)
+        self._pending = bytearray()
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            text = self.format(record) + self.terminator
+            if os.linesep != "\n":
+                text = text.replace("\n", os.linesep)
+            data = text.encode(self.encoding or "utf-8")
+            total = self._size + len(self._pending)
+            if self.maxBytes > 0 and total and total + len(data) >= self.maxBytes:
+                self._write_pending()
+                self.doRollover()
+                self._size = 0
+            self._pending += data
+        except Exception:
+            self.handleError(record)
+
+    def _write_pending(self) -> None:
+        """Write the pending batch with one system call."""
+        if not self._pending:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        os.write(self.stream.fileno(), self._pending)
+        self._size += len(self._pending)
+        del self._pending[:]
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+class _BatchFlushMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes its target once per batch."""
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        if super().shouldFlush(record):
+            return True
+        # Time bound, so quiet INFO lines don't sit in memory indefinitely
+        return (record.created - self.buffer[0].created) * 1000 >= LOG_BUFFER_MAX_AGE_MS
+
+    def flush(self) -> None:
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes the file buffer when the queue goes idle."""
+
+    def __init__(self, log_queue: Any, *handlers: logging.Handler, **kwargs: Any) -> None:
+        super().__init__(log_queue, *handlers, **kwargs)
+        self._flush_timeout = LOG_BUFFER_MAX_AGE_MS / 1000
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, self._flush_timeout)
+            except queue.Empty:
+                if not block:
+                    raise
+                flush_file_logs()
+
+
+# Buffer in front of the file handler, flushed by flush_file_logs()
+_memory_handler: Optional[logging.handlers.MemoryHandler] = None
 
 
 def setup_logging(
@@ -22,6 +129,7 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _memory_handler
     logger = logging.getLogger("autoclicker")
     
     # Avoid adding handlers multiple times
@@ -29,17 +137,33 @@ def setup_logging(
         return logger
     
     logger.setLevel(logging.DEBUG)
-    
-    # File handler - writes to log file
+    # Records are fully handled here; don't emit them again via the root logger
+    logger.propagate = False
+
+    # Both handlers run on a listener thread, so callers (including the Tk
+    # main thread and the mouse listener) only pay for a queue put
+    handlers = []
+
+    # File handler - writes to a size-rotated log file.
+    # A MemoryHandler in front of it batches records into fewer writes.
     try:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = BatchedRotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
         file_handler.setLevel(level)
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        memory_handler = _BatchFlushMemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+        )
+        memory_handler.setLevel(level)
+        atexit.register(memory_handler.close)
+        _memory_handler = memory_handler
+        handlers.append(memory_handler)
     except Exception as e:
         print(f"Warning: Could not create log file handler: {e}")
     
@@ -51,14 +175,31 @@ def setup_logging(
         datefmt="%H:%M:%S"
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
+    handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Registered after the buffer so it runs first: drain the queue, then flush
+    atexit.register(listener.stop)
+
     return logger
 
 
+def flush_file_logs() -> None:
+    """Write any buffered log records to the log file."""
+    if _memory_handler is not None:
+        _memory_handler.flush()
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get a logger instance for the given module name.
+
+    Handlers are installed by setup_logging(), which each entry point calls
+    once; until then only warnings and errors reach stderr.
     
     Args:
         name: Module name (will be appended to 'autoclicker.')
@@ -69,7 +210,3 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     if name:
         return logging.getLogger(f"autoclicker.{name}")
     return logging.getLogger("autoclicker")
-
-
-# Initialize default logger on import
-logger = setup_logging()
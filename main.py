@@ -4,10 +4,12 @@ Main application - Auto Clicker with Mouse Recording and AI Analysis
 import argparse
 import sys
 import os
-from mouse_recorder import MouseRecorder
-from auto_clicker import AutoClicker
-from screenshot_analyzer import ScreenshotAnalyzer
-from dotenv import load_dotenv
+import threading
+
+from logging_config import setup_logging
+
+# The modes import their dependencies themselves (pyautogui, cv2, openai, ...),
+# so --help and each mode only pay for what they use
 
 
 def print_banner():
@@ -23,14 +25,29 @@ def print_banner():
 
 def record_mode(args):
     """Record mouse movements and clicks"""
+    from pynput import keyboard
+    from mouse_recorder import MouseRecorder
+
     recorder = MouseRecorder()
+    stop = threading.Event()
 
+    def on_press(key):
+        if key in (keyboard.Key.f10, keyboard.Key.esc):
+            stop.set()
+
+    key_listener = keyboard.Listener(on_press=on_press)
     try:
+        key_listener.start()
         recorder.start_recording()
-        input("Press Enter to stop recording...\n")
+        print("Press F10 or Esc to stop recording...")
+        # Wake twice a second to show a live event counter
+        while not stop.wait(0.5):
+            print(f"\rEvents recorded: {recorder.event_count}", end='', flush=True)
+        print()
     except KeyboardInterrupt:
         print("\nRecording interrupted")
     finally:
+        key_listener.stop()
         recorder.stop_recording()
 
         if args.output:
@@ -49,6 +66,10 @@ def playback_mode(args):
         print(f"Error: File not found: {args.input}")
         return
 
+    from dotenv import load_dotenv
+    from auto_clicker import AutoClicker
+    from mouse_recorder import MouseRecorder
+
     load_dotenv()
     clicker = AutoClicker(api_key=os.getenv('OPENAI_API_KEY'))
     recorder = MouseRecorder()
@@ -67,6 +88,9 @@ def ai_click_mode(args):
         print("Error: Please specify target with --target")
         return
 
+    from dotenv import load_dotenv
+    from auto_clicker import AutoClicker
+
     load_dotenv()
     clicker = AutoClicker(api_key=os.getenv('OPENAI_API_KEY'))
 
@@ -100,6 +124,9 @@ def image_click_mode(args):
         print(f"Error: Image file not found: {args.image}")
         return
 
+    from dotenv import load_dotenv
+    from auto_clicker import AutoClicker
+
     load_dotenv()
     clicker = AutoClicker()
 
@@ -115,6 +142,9 @@ def image_click_mode(args):
 
 def screenshot_mode(args):
     """Capture a screenshot"""
+    from dotenv import load_dotenv
+    from screenshot_analyzer import ScreenshotAnalyzer
+
     load_dotenv()
     analyzer = ScreenshotAnalyzer()
 
@@ -129,7 +159,7 @@ def screenshot_mode(args):
             print("Error: Region must be in format: x,y,width,height")
             return
 
-    screenshot = analyzer.capture_screenshot(region)
+    screenshot = analyzer.capture_screenshot(region, raw=True)
 
     output_file = args.output if args.output else 'screenshot.png'
     analyzer.save_screenshot(screenshot, output_file)
@@ -141,6 +171,9 @@ def repeat_click_mode(args):
         print("Error: Please specify --x, --y, and --count")
         return
 
+    from dotenv import load_dotenv
+    from auto_clicker import AutoClicker
+
     load_dotenv()
     clicker = AutoClicker()
 
@@ -186,26 +219,31 @@ Examples:
     # Record mode
     record_parser = subparsers.add_parser('record', help='Record mouse movements')
     record_parser.add_argument('--output', '-o', help='Output file (default: recording.json)')
+    record_parser.set_defaults(func=record_mode)
 
     # Playback mode
     playback_parser = subparsers.add_parser('playback', help='Play back recorded movements')
     playback_parser.add_argument('--input', '-i', required=True, help='Input recording file')
     playback_parser.add_argument('--speed', '-s', type=float, help='Playback speed (default: 1.0)')
+    playback_parser.set_defaults(func=playback_mode)
 
     # AI click mode
     ai_click_parser = subparsers.add_parser('ai-click', help='Use AI to find and click element')
     ai_click_parser.add_argument('--target', '-t', required=True, help='Description of target to click')
     ai_click_parser.add_argument('--region', '-r', help='Screen region to search (x,y,width,height)')
+    ai_click_parser.set_defaults(func=ai_click_mode)
 
     # Image click mode
     image_click_parser = subparsers.add_parser('image-click', help='Find and click template image')
     image_click_parser.add_argument('--image', '-i', required=True, help='Template image path')
     image_click_parser.add_argument('--confidence', '-c', type=float, help='Confidence threshold (default: 0.8)')
+    image_click_parser.set_defaults(func=image_click_mode)
 
     # Screenshot mode
     screenshot_parser = subparsers.add_parser('screenshot', help='Capture screenshot')
     screenshot_parser.add_argument('--output', '-o', help='Output file (default: screenshot.png)')
     screenshot_parser.add_argument('--region', '-r', help='Screen region (x,y,width,height)')
+    screenshot_parser.set_defaults(func=screenshot_mode)
 
     # Repeat click mode
     repeat_parser = subparsers.add_parser('repeat', help='Repeat clicks at position')
@@ -214,29 +252,20 @@ Examples:
     repeat_parser.add_argument('--count', type=int, required=True, help='Number of clicks')
     repeat_parser.add_argument('--interval', type=float, help='Interval between clicks (default: 1.0)')
     repeat_parser.add_argument('--button', choices=['left', 'right'], help='Mouse button (default: left)')
+    repeat_parser.set_defaults(func=repeat_click_mode)
 
 
     args = parser.parse_args()
 
-    if not args.mode:
+    # Each subparser sets func to its mode; none means no mode was given
+    if not getattr(args, 'func', None):
         parser.print_help()
         return
 
-    # Route to appropriate mode
-    modes = {
-        'record': record_mode,
-        'playback': playback_mode,
-        'ai-click': ai_click_mode,
-        'image-click': image_click_mode,
-        'screenshot': screenshot_mode,
-        'repeat': repeat_click_mode
+    # Only modes that do work open the log file, not --help
+    setup_logging()
 
-    }
-
-    if args.mode in modes:
-        modes[args.mode](args)
-    else:
-        parser.print_help()
+    args.func(args)
 
 
 if __name__ == '__main__':
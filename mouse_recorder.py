@@ -2,29 +2,342 @@
 Mouse movement and click recorder
 Records mouse positions, clicks, and delays for playback
 """
+import array
 import json
+import mmap
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
+import numpy as np
 from pynput import mouse
 from pynput.mouse import Button, Listener
 
 from logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Module logger
 logger = get_logger("mouse_recorder")
 
+# Event type codes used by the recorder's column buffers
+EVENT_MOVE = 0
+EVENT_CLICK = 1
+EVENT_SCROLL = 2
+
+# count_callback fires each time the event count crosses a multiple of this
+COUNT_CALLBACK_INTERVAL = 16
+
+# Seconds between moves of queued events into the column buffers
+DRAIN_INTERVAL = 0.005
+
+# Starting "last move" position, so the first move is never dropped as jitter
+MOVE_FAR_AWAY = -10 ** 9
+
+# Default move throttle: a move is skipped when it is both this close to and
+# this soon after the last recorded move
+MIN_MOVE_PX = 5
+MIN_MOVE_MS = 10
+
+# Default tolerance in pixels for simplifying recorded mouse paths
+SIMPLIFY_EPSILON = 3.0
+
+# Recordings with this extension are saved as compressed column arrays instead of JSON
+BINARY_EXTENSION = '.rec'
+
+# File dialog filters for recording files
+RECORDING_FILETYPES = [
+    ("Recordings", "*.json *.rec"),
+    ("JSON files", "*.json"),
+    ("Binary recordings", "*.rec"),
+    ("All files", "*.*"),
+]
+
+_EVENT_CODES = {'move': EVENT_MOVE, 'click': EVENT_CLICK, 'scroll': EVENT_SCROLL}
+
+
+def _build_events(types, xs, ys, a, b, ts, names: List[str], start: int, stop: int) -> List[Dict[str, Any]]:
+    """
+    Convert rows of event columns into event dictionaries.
+
+    Args:
+        types, xs, ys, a, b, ts: Event columns (see MouseRecorder)
+        names: Button names indexed by the click rows' 'a' column
+        start: First row to convert
+        stop: Row to stop before
+
+    Returns:
+        List of event dictionaries
+    """
+    events: List[Dict[str, Any]] = []
+    append = events.append
+    for i in range(start, stop):
+        kind = types[i]
+        if kind == EVENT_MOVE:
+            append({'type': 'move', 'x': xs[i], 'y': ys[i], 'timestamp': ts[i]})
+        elif kind == EVENT_CLICK:
+            append({'type': 'click', 'x': xs[i], 'y': ys[i], 'button': names[a[i]], 'timestamp': ts[i]})
+        else:
+            append({'type': 'scroll', 'x': xs[i], 'y': ys[i], 'dx': a[i], 'dy': b[i], 'timestamp': ts[i]})
+    return events
+
+
+def _write_binary_recording(filename: str, data: Dict[str, Any]) -> None:
+    """
+    Write recording data as compressed NumPy column arrays.
+
+    Args:
+        filename: Path to save the recording
+        data: Recording data with an 'events' list
+    """
+    events = data['events']
+    count = len(events)
+    types = np.empty(count, dtype=np.int8)
+    xs = np.empty(count, dtype=np.int32)
+    ys = np.empty(count, dtype=np.int32)
+    a = np.zeros(count, dtype=np.int32)
+    b = np.zeros(count, dtype=np.int32)
+    ts = np.empty(count, dtype=np.float64)
+    names: List[str] = []
+
+    for i, event in enumerate(events):
+        kind = _EVENT_CODES[event['type']]
+        types[i] = kind
+        xs[i] = event['x']
+        ys[i] = event['y']
+        ts[i] = event['timestamp']
+        if kind == EVENT_CLICK:
+            if event['button'] not in names:
+                names.append(event['button'])
+            a[i] = names.index(event['button'])
+        elif kind == EVENT_SCROLL:
+            a[i] = event['dx']
+            b[i] = event['dy']
+
+    # Pass a file object so numpy does not append '.npz' to the name
+    with open(filename, 'wb') as f:
+        np.savez_compressed(
+            f, types=types, xs=xs, ys=ys, a=a, b=b, ts=ts,
+            buttons=np.array(names, dtype=str),
+            recorded_at=np.array(data['recorded_at']),
+            optimized=np.array(data['optimized'])
+        )
+
+
+def _read_binary_recording(filename: str) -> Dict[str, Any]:
+    """
+    Read a recording written by _write_binary_recording.
+
+    Args:
+        filename: Path to the recording file
+
+    Returns:
+        Recording data with an 'events' list, as read from a JSON recording
+    """
+    with np.load(filename) as archive:
+        types = archive['types'].tolist()
+        events = _build_events(
+            types, archive['xs'].tolist(), archive['ys'].tolist(),
+            archive['a'].tolist(), archive['b'].tolist(), archive['ts'].tolist(),
+            archive['buttons'].tolist(), 0, len(types)
+        )
+        return {
+            'recorded_at': archive['recorded_at'].item(),
+            'events': events,
+            'optimized': archive['optimized'].item()
+        }
+
+
+def read_recording_file(filename: str) -> Dict[str, Any]:
+    """
+    Read and parse a recording file without an intermediate copy.
+
+    JSON files are memory-mapped and handed straight to orjson when it is
+    installed; otherwise they fall back to the stdlib json parser. Files
+    ending in BINARY_EXTENSION are read as NumPy column arrays.
+
+    Args:
+        filename: Path to the recording file
+
+    Returns:
+        Parsed recording data with an 'events' list
+    """
+    if filename.lower().endswith(BINARY_EXTENSION):
+        return _read_binary_recording(filename)
+    with open(filename, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def simplify_path(xs: np.ndarray, ys: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Select the points of a polyline to keep using Ramer-Douglas-Peucker.
+
+    Args:
+        xs: X coordinates of the path, as floats
+        ys: Y coordinates of the path, as floats
+        epsilon: Largest allowed distance in pixels from a dropped point to the simplified path
+
+    Returns:
+        Boolean mask of the points to keep; the endpoints are always kept
+    """
+    n = len(xs)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+
+    # Iterative with an explicit stack so long paths cannot hit the recursion limit
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        x1, y1, x2, y2 = xs[start], ys[start], xs[end], ys[end]
+        seg_x = xs[start + 1:end]
+        seg_y = ys[start + 1:end]
+        dx, dy = x2 - x1, y2 - y1
+        length = np.hypot(dx, dy)
+        if length == 0:
+            # Path returns to its start: measure from that point instead of a line
+            dist = np.hypot(seg_x - x1, seg_y - y1)
+        else:
+            dist = np.abs(dy * seg_x - dx * seg_y + x2 * y1 - y2 * x1) / length
+        i = int(dist.argmax())
+        if dist[i] > epsilon:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return keep
+
 
 class MouseRecorder:
     """Records mouse events including movements, clicks, and scrolls."""
+
+    __slots__ = (
+        'recording', 'start_time', 'listener', 'count_callback', '_time', '_queue', '_drain_thread', '_lx', '_ly', '_lt',
+        '_min_move_d2', '_min_move_s',
+        '_events', '_types', '_xs', '_ys', '_a', '_b', '_ts', '_button_names', '_button_codes', '_converted',
+    )
     
-    def __init__(self) -> None:
-        """Initialize the mouse recorder."""
-        self.events: List[Dict[str, Any]] = []
+    def __init__(
+        self,
+        count_callback: Optional[Callable[[int], None]] = None,
+        min_move_px: float = MIN_MOVE_PX,
+        min_move_ms: float = MIN_MOVE_MS
+    ) -> None:
+        """
+        Initialize the mouse recorder.
+
+        Args:
+            count_callback: Called from the drain thread with the event count
+                every COUNT_CALLBACK_INTERVAL recorded events
+            min_move_px: Moves closer than this to the last recorded move are
+                skipped unless min_move_ms has passed (0 disables the throttle)
+            min_move_ms: Milliseconds after which a move is recorded however small
+        """
         self.recording: bool = False
         self.start_time: Optional[float] = None
         self.listener: Optional[Listener] = None
+        self.count_callback = count_callback
+        # Clock bound once so the listener callbacks skip the global lookup;
+        # timestamps are offsets from start_time, so a monotonic clock is used
+        self._time = time.perf_counter
+        # The listener callbacks only push row tuples here; the drain thread
+        # moves them into the column buffers so the OS callback returns quickly
+        self._queue: deque = deque()
+        self._drain_thread: Optional[threading.Thread] = None
+        # Position and time of the last recorded move, for dropping 1px jitter
+        # and throttling small moves
+        self._lx: int = MOVE_FAR_AWAY
+        self._ly: int = MOVE_FAR_AWAY
+        self._lt: float = float('-inf')
+        # Throttle settings in the units on_move compares against
+        self._min_move_d2: float = min_move_px * min_move_px
+        self._min_move_s: float = min_move_ms / 1000.0
+
+        # Events as dicts: loaded ones plus recorded rows already converted
+        self._events: List[Dict[str, Any]] = []
+        # Recorded events are appended to typed column buffers, one row per event;
+        # _a/_b hold the button index for clicks and dx/dy for scrolls
+        self._types: array.array = array.array('b')
+        self._xs: array.array = array.array('i')
+        self._ys: array.array = array.array('i')
+        self._a: array.array = array.array('i')
+        self._b: array.array = array.array('i')
+        self._ts: array.array = array.array('d')
+        self._button_names: List[str] = []
+        # Button -> index into _button_names, so clicks skip the name lookup
+        self._button_codes: Dict[Button, int] = {}
+        # Number of recorded rows already converted into _events
+        self._converted: int = 0
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded or loaded events as dictionaries, converted on first access."""
+        # Timestamps are written last, so every row below this count is complete
+        count = len(self._ts)
+        if self._converted < count:
+            self._events.extend(_build_events(
+                self._types, self._xs, self._ys, self._a, self._b, self._ts,
+                self._button_names, self._converted, count
+            ))
+            self._converted = count
+        return self._events
+
+    @events.setter
+    def events(self, events: List[Dict[str, Any]]) -> None:
+        self._events = events
+        self._queue.clear()
+        for column in (self._types, self._xs, self._ys, self._a, self._b, self._ts):
+            del column[:]
+        self._converted = 0
+
+    @property
+    def event_count(self) -> int:
+        """Number of events, without converting pending recorded rows."""
+        return len(self._events) + len(self._ts) - self._converted + len(self._queue)
+
+    def _flush_queue(self) -> None:
+        """Move queued event rows into the column buffers."""
+        queue = self._queue
+        pending = len(queue)
+        if not pending:
+            return
+        popleft = queue.popleft
+        kinds, xs, ys, a, b, ts = zip(*[popleft() for _ in range(pending)])
+        before = len(self._ts)
+        self._types.extend(kinds)
+        self._xs.extend(xs)
+        self._ys.extend(ys)
+        self._a.extend(a)
+        self._b.extend(b)
+        # Timestamps are extended last, see the events property
+        self._ts.extend(ts)
+
+        callback = self.count_callback
+        if callback is not None and before // COUNT_CALLBACK_INTERVAL != len(self._ts) // COUNT_CALLBACK_INTERVAL:
+            callback(self.event_count)
+
+    def _drain(self) -> None:
+        """Drain the event queue until recording stops."""
+        while self.recording:
+            self._flush_queue()
+            time.sleep(DRAIN_INTERVAL)
+
+    def _record(self, kind: int, x: int, y: int, a: int, b: int) -> None:
+        """Queue one event row."""
+        if self.recording:
+            self._queue.append((kind, x, y, a, b, self._time() - self.start_time))
 
     def on_move(self, x: int, y: int) -> None:
         """
@@ -34,14 +347,21 @@ class MouseRecorder:
             x: X coordinate
             y: Y coordinate
         """
-        if self.recording and self.start_time is not None:
-            timestamp = time.time() - self.start_time
-            self.events.append({
-                'type': 'move',
-                'x': x,
-                'y': y,
-                'timestamp': timestamp
-            })
+        # Called at the mouse report rate, so _record is inlined here
+        if self.recording:
+            # Drivers often repeat a position or jitter by a pixel; skip those moves
+            dx = x - self._lx
+            dy = y - self._ly
+            if -2 < dx < 2 and -2 < dy < 2:
+                return
+            # Small moves arriving faster than the throttle interval add nothing to the path
+            now = self._time()
+            if dx * dx + dy * dy < self._min_move_d2 and now - self._lt < self._min_move_s:
+                return
+            self._lx = x
+            self._ly = y
+            self._lt = now
+            self._queue.append((EVENT_MOVE, x, y, 0, 0, now - self.start_time))
 
     def on_click(self, x: int, y: int, button: Button, pressed: bool) -> None:
         """
@@ -53,15 +373,12 @@ class MouseRecorder:
             button: Mouse button that was clicked
             pressed: True if button was pressed, False if released
         """
-        if self.recording and pressed and self.start_time is not None:
-            timestamp = time.time() - self.start_time
-            self.events.append({
-                'type': 'click',
-                'x': x,
-                'y': y,
-                'button': button.name,
-                'timestamp': timestamp
-            })
+        if pressed:
+            code = self._button_codes.get(button)
+            if code is None:
+                code = self._button_codes[button] = len(self._button_names)
+                self._button_names.append(button.name)
+            self._record(EVENT_CLICK, x, y, code, 0)
 
     def on_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
         """
@@ -73,30 +390,26 @@ class MouseRecorder:
             dx: Horizontal scroll amount
             dy: Vertical scroll amount
         """
-        if self.recording and self.start_time is not None:
-            timestamp = time.time() - self.start_time
-            self.events.append({
-                'type': 'scroll',
-                'x': x,
-                'y': y,
-                'dx': dx,
-                'dy': dy,
-                'timestamp': timestamp
-            })
+        self._record(EVENT_SCROLL, x, y, dx, dy)
 
     def start_recording(self) -> None:
         """Start recording mouse events."""
         self.events = []
+        self._lx = self._ly = MOVE_FAR_AWAY
+        self._lt = float('-inf')
+        # start_time is set first; the callbacks only check the recording flag
+        self.start_time = self._time()
         self.recording = True
-        self.start_time = time.time()
 
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
         self.listener = mouse.Listener(
             on_move=self.on_move,
             on_click=self.on_click,
             on_scroll=self.on_scroll
         )
         self.listener.start()
-        logger.info("Recording started. Press Ctrl+C to stop.")
+        logger.info("Recording started")
 
     def stop_recording(self) -> List[Dict[str, Any]]:
         """
@@ -108,54 +421,48 @@ class MouseRecorder:
         self.recording = False
         if self.listener:
             self.listener.stop()
+        if self._drain_thread:
+            self._drain_thread.join()
+            self._drain_thread = None
+        self._flush_queue()
         logger.info(f"Recording stopped. Captured {len(self.events)} events.")
         return self.events
 
-    def save_recording(self, filename: str, optimize: bool = True) -> None:
+    def save_recording(self, filename: str, optimize: bool = True, epsilon: float = SIMPLIFY_EPSILON) -> None:
         """
-        Save recorded events to a JSON file.
+        Save recorded events to a JSON file, or a binary one if the name ends in BINARY_EXTENSION.
 
         Args:
             filename: Path to save the recording
             optimize: If True, simplify move events to reduce file size and improve playback speed
+            epsilon: Path simplification tolerance in pixels, used when optimizing
         """
         events = self.events
 
-        # Optimize by keeping only significant moves (before clicks/scrolls)
-        if optimize:
+        # Optimize by simplifying each run of moves between clicks/scrolls
+        if optimize and events:
             original_count = len(events)
-            optimized_events: List[Dict[str, Any]] = []
-
-            for i, event in enumerate(events):
-                if event['type'] in ('click', 'scroll'):
-                    # Always keep clicks and scrolls
-                    optimized_events.append(event)
-                elif event['type'] == 'move':
-                    # Keep move event only if it's followed by a click/scroll within next few events
-                    # This preserves the movement path before actions
-                    is_significant = False
-                    for j in range(i + 1, min(i + 10, len(events))):
-                        if events[j]['type'] in ('click', 'scroll'):
-                            is_significant = True
-                            break
-
-                    # Also keep if it's a significant movement (more than 50 pixels from last kept move)
-                    if not is_significant and optimized_events:
-                        last_move: Optional[Dict[str, Any]] = None
-                        for prev_event in reversed(optimized_events):
-                            if prev_event['type'] == 'move':
-                                last_move = prev_event
-                                break
-
-                        if last_move:
-                            distance = ((event['x'] - last_move['x'])**2 + (event['y'] - last_move['y'])**2)**0.5
-                            if distance > 50:
-                                is_significant = True
-
-                    if is_significant or i == 0:  # Always keep first move
-                        optimized_events.append(event)
-
-            events = optimized_events
+            keep = [event['type'] != 'move' for event in events]
+            move_idx = np.flatnonzero(np.fromiter(
+                (event['type'] == 'move' for event in events), dtype=bool, count=original_count
+            ))
+            # Coordinates of all moves are extracted once; runs are slices of them
+            move_list = move_idx.tolist()
+            xs = np.fromiter((events[i]['x'] for i in move_list), dtype=np.float64, count=len(move_list))
+            ys = np.fromiter((events[i]['y'] for i in move_list), dtype=np.float64, count=len(move_list))
+
+            # Runs break wherever a non-move event sits between two moves
+            bounds = [0, *(np.flatnonzero(np.diff(move_idx) > 1) + 1).tolist(), len(move_list)]
+            for start, end in zip(bounds, bounds[1:]):
+                if end - start <= 2:
+                    # Nothing to drop between the endpoints
+                    for i in move_list[start:end]:
+                        keep[i] = True
+                    continue
+                for i in move_idx[start:end][simplify_path(xs[start:end], ys[start:end], epsilon)].tolist():
+                    keep[i] = True
+
+            events = [event for event, kept in zip(events, keep) if kept]
             logger.info(f"Optimized recording: {original_count} -> {len(events)} events (removed {original_count - len(events)} move events)")
 
         data: Dict[str, Any] = {
@@ -164,8 +471,17 @@ class MouseRecorder:
             'optimized': optimize
         }
 
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if filename.lower().endswith(BINARY_EXTENSION):
+            _write_binary_recording(filename, data)
+            logger.info(f"Recording saved to {filename}")
+            return
+
+        # Compact output: indentation roughly triples the size of long recordings
+        with open(filename, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(data))
+            else:
+                f.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
         logger.info(f"Recording saved to {filename}")
 
     def load_recording(self, filename: str) -> List[Dict[str, Any]]:
@@ -178,8 +494,7 @@ class MouseRecorder:
         Returns:
             List of recorded events
         """
-        with open(filename, 'r') as f:
-            data: Dict[str, Any] = json.load(f)
+        data = read_recording_file(filename)
 
         self.events = data['events']
         logger.info(f"Loaded {len(self.events)} events from {filename}")
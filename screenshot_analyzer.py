@@ -2,19 +2,41 @@
 Screenshot capture and image template matching
 Uses OpenCV for template matching to find and click on screen elements
 """
-from typing import List, Dict, Optional, Tuple, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import ContextManager, List, Dict, Optional, Tuple, Union
 
 import pyautogui
 import cv2
 import numpy as np
 from PIL import Image
 from mss import mss
+from mss.base import MSSBase
+from mss.screenshot import ScreenShot
+from mss.tools import to_png
 
 from logging_config import get_logger
 
 # Module logger
 logger = get_logger("screenshot_analyzer")
 
+# Coarse-to-fine matching: search at 1/2 scale (one pyrDown level), then
+# refine the best coarse candidates at full resolution
+PYRAMID_LEVELS = 1
+PYRAMID_MIN_TEMPLATE_SIZE = 48  # Keeps coarse templates at 24px or more; smaller ones lose too much detail
+PYRAMID_CANDIDATES = 5  # Distinct peaks, after non-max suppression
+PYRAMID_MARGIN = 8  # Pixels around each candidate searched at full resolution
+PYRAMID_SCORE_SLACK = 0.15  # Coarse scores run lower than full-resolution ones
+
+# Auto confidence: accept a match that stands out from the runner-up peak
+PEAK_MARGIN = 0.1
+AUTO_CONFIDENCE_FLOOR = 0.5  # Peaks weaker than this are rejected however distinct
+
+# Worker threads for capturing several monitor thumbnails at once
+MAX_SCAN_WORKERS = 4
+
 
 class ScreenshotAnalyzer:
     """Handles screenshot capture and OpenCV template matching."""
@@ -26,44 +48,94 @@ class ScreenshotAnalyzer:
         Args:
             api_key: Optional API key (reserved for future AI features)
         """
-        pass
+        # Monitor layout from the last enumeration; refreshed on request
+        self._monitors_cache: Optional[List[Dict[str, int]]] = None
+        # Decoded grayscale templates by path: ((mtime_ns, size), (image, coarse image))
+        self._template_cache: Dict[
+            str, Tuple[Tuple[int, int], Tuple[np.ndarray, Optional[np.ndarray]]]
+        ] = {}
+        # Per-thread capture state: 'sct' (mss handle) and 'gray' (buffers by shape).
+        # mss handles must not be shared between threads, so each keeps its own.
+        self._local = threading.local()
+        # Captures monitor thumbnails in parallel when there is more than one; created on first use
+        self._scan_executor: Optional[ThreadPoolExecutor] = None
+        self._scan_executor_lock = threading.Lock()
+
+    def _get_sct(self, fresh: bool = False) -> MSSBase:
+        """
+        Return this thread's capture handle, opening it on first use.
+
+        Args:
+            fresh: Replace the handle with a new one; mss reads the monitor
+                layout once per handle, so this is how the layout is refreshed
 
-    def get_monitors(self) -> List[Dict[str, int]]:
+        Returns:
+            Open mss instance, kept for the thread's lifetime
+        """
+        sct = getattr(self._local, 'sct', None)
+        if sct is not None and fresh:
+            sct.close()
+            sct = None
+        if sct is None:
+            sct = self._local.sct = mss()
+        return sct
+
+    def get_monitors(self, refresh: bool = False) -> List[Dict[str, int]]:
         """
         Get list of all monitors.
 
+        The layout is enumerated once and cached; capturing monitor
+        thumbnails or passing refresh=True re-reads it.
+
+        Args:
+            refresh: Enumerate the monitors again instead of using the cache
+
         Returns:
             List of monitor dictionaries with 'left', 'top', 'width', 'height'
         """
-        with mss() as sct:
-            monitors: List[Dict[str, Any]] = sct.monitors[1:]  # Skip the first one (combined screen)
-            return monitors
+        if self._monitors_cache is None or refresh:
+            sct = self._get_sct(fresh=refresh)
+            self._monitors_cache = sct.monitors[1:]  # Skip the first one (combined screen)
+        return self._monitors_cache
 
     def capture_screenshot(
         self,
         region: Optional[Tuple[int, int, int, int]] = None,
-        monitor: Optional[int] = None
-    ) -> Image.Image:
+        monitor: Optional[int] = None,
+        raw: bool = False
+    ) -> Union[Image.Image, ScreenShot]:
         """
         Capture a screenshot.
 
         Args:
             region: Tuple (x, y, width, height) for specific region, or None for full screen
             monitor: Monitor number (1, 2, etc.) or None for all monitors
+            raw: Return the raw mss ScreenShot instead of a PIL Image (cheaper to save)
 
         Returns:
-            PIL Image object
+            PIL Image object, or mss ScreenShot when raw is True
         """
+        if raw:
+            sct = self._get_sct()
+            if region:
+                x, y, w, h = region
+                area: Dict[str, int] = {'left': x, 'top': y, 'width': w, 'height': h}
+            elif monitor is not None and monitor < len(sct.monitors):
+                area = sct.monitors[monitor]
+            else:
+                area = sct.monitors[0]
+            return sct.grab(area)
+
         if monitor is not None:
             # Capture specific monitor
-            with mss() as sct:
-                monitors = sct.monitors
-                if monitor < len(monitors):
-                    mon = monitors[monitor]
-                    screenshot = sct.grab(mon)
-                    return Image.frombytes('RGB', screenshot.size, screenshot.rgb)
-                else:
-                    logger.warning(f"Monitor {monitor} not found, using default")
+            sct = self._get_sct()
+            monitors = sct.monitors
+            if monitor < len(monitors):
+                mon = monitors[monitor]
+                screenshot = sct.grab(mon)
+                return Image.frombytes('RGB', screenshot.size, screenshot.rgb)
+            else:
+                logger.warning(f"Monitor {monitor} not found, using default")
 
         if region:
             screenshot = pyautogui.screenshot(region=region)
@@ -71,22 +143,295 @@ class ScreenshotAnalyzer:
             screenshot = pyautogui.screenshot()
         return screenshot
 
-    def save_screenshot(self, screenshot: Image.Image, filename: str) -> None:
+    def save_screenshot(self, screenshot: Union[Image.Image, ScreenShot], filename: str) -> None:
         """
         Save screenshot to file.
-        
+
+        Raw mss screenshots saved as PNG are encoded straight from the
+        capture buffer with mss.tools.to_png, skipping the PIL conversion.
+
         Args:
-            screenshot: PIL Image to save
+            screenshot: PIL Image or raw mss ScreenShot to save
             filename: Path to save the screenshot
         """
+        if isinstance(screenshot, ScreenShot):
+            if filename.lower().endswith('.png'):
+                to_png(screenshot.rgb, screenshot.size, output=filename)
+                logger.info(f"Screenshot saved to {filename}")
+                return
+            screenshot = Image.frombytes('RGB', screenshot.size, screenshot.rgb)
         screenshot.save(filename)
         logger.info(f"Screenshot saved to {filename}")
 
+    def _load_template(
+        self,
+        template_image_path: str
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Load a template image as grayscale, reusing the decoded copy.
+
+        Retry loops search for the same template many times, so the file is
+        decoded again only when its modification time or size changes.
+
+        Args:
+            template_image_path: Path to the template image
+
+        Returns:
+            Tuple (template, coarse template); the coarse template is the
+            pyramid-reduced copy, or None if the template is too small for it
+        """
+        try:
+            stat = os.stat(template_image_path)
+        except OSError:
+            raise ValueError(f"Could not load template image: {template_image_path}")
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._template_cache.get(template_image_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        template = cv2.imread(template_image_path, cv2.IMREAD_GRAYSCALE)
+        if template is None:
+            raise ValueError(f"Could not load template image: {template_image_path}")
+
+        coarse: Optional[np.ndarray] = None
+        if min(template.shape) >= PYRAMID_MIN_TEMPLATE_SIZE:
+            coarse = template
+            for _ in range(PYRAMID_LEVELS):
+                coarse = cv2.pyrDown(coarse)
+
+        self._template_cache[template_image_path] = (stamp, (template, coarse))
+        return template, coarse
+
+    def _grab_gray(self, sct: MSSBase, area: Dict[str, int]) -> np.ndarray:
+        """
+        Grab an area of the screen as a grayscale image.
+
+        The raw BGRA capture buffer is viewed as an array without copying and
+        converted to gray in one pass, skipping the RGB and PIL round trip.
+        The result is written into a per-thread buffer that the next grab of
+        the same size on this thread overwrites.
+
+        Args:
+            sct: Open mss instance
+            area: Monitor dictionary with 'left', 'top', 'width', 'height'
+
+        Returns:
+            Grayscale screenshot of the area
+        """
+        shot = sct.grab(area)
+        frame = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+        buffers = getattr(self._local, 'gray', None)
+        if buffers is None:
+            buffers = self._local.gray = {}
+        gray = buffers.get(frame.shape[:2])
+        if gray is None:
+            gray = buffers[frame.shape[:2]] = np.empty(frame.shape[:2], dtype=np.uint8)
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY, dst=gray)
+
+    @staticmethod
+    def _match_template(
+        screen: np.ndarray,
+        template: np.ndarray,
+        coarse: Optional[np.ndarray],
+        confidence: float
+    ) -> Tuple[float, Tuple[int, int]]:
+        """
+        Find the best match of a template in a grayscale screenshot.
+
+        With a coarse template, the screenshot is reduced by the same pyramid
+        levels and matched first; the strongest distinct coarse peaks are then
+        matched at full resolution in a small window around each. When no coarse
+        peak comes within PYRAMID_SCORE_SLACK of the threshold, the coarse score
+        is returned as a miss. When some do but none refines to a match, the
+        whole screenshot is matched at full resolution before giving up.
+
+        Args:
+            screen: Grayscale screenshot
+            template: Grayscale template
+            coarse: Pyramid-reduced template, or None for a full-resolution search
+            confidence: Confidence threshold (0-1) the caller will apply
+
+        Returns:
+            Tuple (score, (x, y)) of the best match's top-left corner
+        """
+        screen_h, screen_w = screen.shape
+        template_h, template_w = template.shape
+
+        if coarse is None:
+            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+
+        small = screen
+        for _ in range(PYRAMID_LEVELS):
+            small = cv2.pyrDown(small)
+        coarse_result = cv2.matchTemplate(small, coarse, cv2.TM_CCOEFF_NORMED)
+        coarse_h, coarse_w = coarse.shape
+        scale = 1 << PYRAMID_LEVELS
+
+        _, coarse_val, _, (first_x, first_y) = cv2.minMaxLoc(coarse_result)
+        if coarse_val < confidence - PYRAMID_SCORE_SLACK:
+            # Nothing on screen comes close: report the coarse score as a miss
+            # without paying for a full-resolution pass
+            return coarse_val, (first_x * scale, first_y * scale)
+
+        # Non-max suppression: take the strongest peak, blank out everything a
+        # template width/height around it, repeat, so each candidate is a
+        # separate instance rather than a neighbouring pixel of the same one
+        candidates: List[Tuple[int, int]] = []
+        for _ in range(PYRAMID_CANDIDATES):
+            _, peak, _, (cx, cy) = cv2.minMaxLoc(coarse_result)
+            if peak < confidence - PYRAMID_SCORE_SLACK:
+                break
+            candidates.append((cx, cy))
+            coarse_result[max(0, cy - coarse_h + 1):cy + coarse_h, max(0, cx - coarse_w + 1):cx + coarse_w] = -1.0
+
+        best: Optional[Tuple[float, Tuple[int, int]]] = None
+        for cx, cy in candidates:
+            x0 = max(0, cx * scale - PYRAMID_MARGIN)
+            y0 = max(0, cy * scale - PYRAMID_MARGIN)
+            x1 = min(screen_w, cx * scale + template_w + PYRAMID_MARGIN)
+            y1 = min(screen_h, cy * scale + template_h + PYRAMID_MARGIN)
+            if x1 - x0 < template_w or y1 - y0 < template_h:
+                continue
+
+            result = cv2.matchTemplate(screen[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if best is None or max_val > best[0]:
+                best = (max_val, (x0 + max_loc[0], y0 + max_loc[1]))
+
+        if best is not None and best[0] >= confidence:
+            return best
+
+        # A coarse peak came close but none refined to a match: check the
+        # whole screenshot at full resolution before calling it a miss
+        result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, max_loc
+
+    def capture_session(self) -> ContextManager[MSSBase]:
+        """
+        Get the calling thread's screen capture handle for a series of searches.
+
+        Use it as a context manager on the searching thread and pass it to
+        find_image_on_screen. The handle is persistent, so leaving the block
+        does not close it.
+
+        Returns:
+            Context manager yielding this thread's mss instance
+        """
+        return nullcontext(self._get_sct())
+
+    @staticmethod
+    def _match_distinct_peak(
+        screen: np.ndarray,
+        template: np.ndarray
+    ) -> Tuple[float, Tuple[int, int], bool]:
+        """
+        Find the best match and check that it stands out from the runner-up.
+
+        The whole screenshot is scored at full resolution, since the coarse
+        pass would hide the runner-up. Positions overlapping the best match
+        are masked out before the second-best score is read.
+
+        Args:
+            screen: Grayscale screenshot
+            template: Grayscale template
+
+        Returns:
+            Tuple (score, (x, y), accepted) of the best match's top-left corner
+        """
+        result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+        _, top1, _, (x, y) = cv2.minMaxLoc(result)
+
+        template_h, template_w = template.shape
+        result[max(0, y - template_h + 1):y + template_h, max(0, x - template_w + 1):x + template_w] = -1.0
+        _, top2, _, _ = cv2.minMaxLoc(result)
+
+        accepted = top1 >= AUTO_CONFIDENCE_FLOOR and top1 - top2 >= PEAK_MARGIN
+        return top1, (x, y), accepted
+
+    def _find_match(
+        self,
+        screen: np.ndarray,
+        template: np.ndarray,
+        coarse: Optional[np.ndarray],
+        confidence: float,
+        auto_confidence: bool
+    ) -> Tuple[float, Tuple[int, int], bool]:
+        """
+        Score a screenshot with the configured acceptance rule.
+
+        Args:
+            screen: Grayscale screenshot
+            template: Grayscale template
+            coarse: Pyramid-reduced template, or None for a full-resolution search
+            confidence: Confidence threshold (0-1)
+            auto_confidence: Use the runner-up margin instead of the threshold
+
+        Returns:
+            Tuple (score, (x, y), accepted) of the best match's top-left corner
+        """
+        if auto_confidence:
+            return self._match_distinct_peak(screen, template)
+        max_val, max_loc = self._match_template(screen, template, coarse, confidence)
+        return max_val, max_loc, max_val >= confidence
+
+    def _scan_monitor(
+        self,
+        sct: MSSBase,
+        mon: Dict[str, int],
+        template: np.ndarray,
+        coarse: Optional[np.ndarray],
+        confidence: float,
+        auto_confidence: bool
+    ) -> Optional[Tuple[int, int, float]]:
+        """
+        Search one monitor.
+
+        Args:
+            sct: Open mss instance owned by the calling thread
+            mon: Monitor dictionary with 'left', 'top', 'width', 'height'
+            template: Grayscale template
+            coarse: Pyramid-reduced template, or None for a full-resolution search
+            confidence: Confidence threshold (0-1)
+            auto_confidence: Use the runner-up margin instead of the threshold
+
+        Returns:
+            Tuple (x, y, confidence) of the match center in absolute coordinates, or None
+        """
+        screenshot_gray = self._grab_gray(sct, mon)
+        max_val, max_loc, found = self._find_match(
+            screenshot_gray, template, coarse, confidence, auto_confidence
+        )
+        if not found:
+            return None
+        template_h, template_w = template.shape
+        # Add monitor offset to get absolute coordinates
+        return (
+            mon['left'] + max_loc[0] + template_w // 2,
+            mon['top'] + max_loc[1] + template_h // 2,
+            max_val
+        )
+
+    def _get_scan_executor(self) -> ThreadPoolExecutor:
+        """Return the shared thumbnail capture pool, creating it on first use."""
+        with self._scan_executor_lock:
+            if self._scan_executor is None:
+                self._scan_executor = ThreadPoolExecutor(
+                    max_workers=MAX_SCAN_WORKERS, thread_name_prefix="monitor-scan"
+                )
+            return self._scan_executor
+
     def find_image_on_screen(
         self,
         template_image_path: str,
         confidence: float = 0.8,
-        monitor: Optional[int] = None
+        monitor: Optional[int] = None,
+        sct: Optional[MSSBase] = None,
+        auto_confidence: bool = False
     ) -> Optional[Tuple[int, int, float]]:
         """
         Find a template image on the current screen using OpenCV.
@@ -95,55 +440,43 @@ class ScreenshotAnalyzer:
             template_image_path: Path to the template image to search for
             confidence: Confidence threshold (0-1)
             monitor: Monitor number (1, 2, etc.) or None for all monitors
+            sct: Capture handle from capture_session, or None to use this thread's handle
+            auto_confidence: Ignore the threshold and accept the best match when it
+                beats the runner-up peak by PEAK_MARGIN
 
         Returns:
             Tuple (x, y, confidence) of the center of the found image, or None
         """
-        # Load template
-        template = cv2.imread(template_image_path, cv2.IMREAD_GRAYSCALE)
-        if template is None:
-            raise ValueError(f"Could not load template image: {template_image_path}")
+        # Load template (decoded once per file version)
+        template, coarse = self._load_template(template_image_path)
+        if sct is None:
+            sct = self._get_sct()
 
         if monitor is None:
             # Search all monitors individually and return the best match
+            # Sequential on purpose: matchTemplate already spreads each call across
+            # all cores, so per-monitor threads would only oversubscribe them
             best_match: Optional[Tuple[int, int, float]] = None
-            best_confidence: float = 0
-
-            with mss() as sct:
-                monitors = sct.monitors[1:]  # Skip combined screen
-
-                for idx, mon in enumerate(monitors, 1):
-                    # Capture this monitor
-                    screenshot = sct.grab(mon)
-                    screenshot_img = Image.frombytes('RGB', screenshot.size, screenshot.rgb)
-                    screenshot_np = np.array(screenshot_img)
-                    screenshot_gray = cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2GRAY)
-
-                    # Perform template matching
-                    result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED)
-                    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-                    if max_val >= confidence and max_val > best_confidence:
-                        # Get center of the found template
-                        template_h, template_w = template.shape
-                        # Add monitor offset to get absolute coordinates
-                        center_x = mon['left'] + max_loc[0] + template_w // 2
-                        center_y = mon['top'] + max_loc[1] + template_h // 2
-                        best_match = (center_x, center_y, max_val)
-                        best_confidence = max_val
-
+            for mon in sct.monitors[1:]:  # Skip combined screen
+                match = self._scan_monitor(sct, mon, template, coarse, confidence, auto_confidence)
+                if match and (best_match is None or match[2] > best_match[2]):
+                    best_match = match
             return best_match
         else:
-            # Search specific monitor using pyautogui approach (works with relative coordinates)
-            screenshot = self.capture_screenshot(monitor=monitor)
-            screenshot_np = np.array(screenshot)
-            screenshot_gray = cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2GRAY)
+            # Search specific monitor (returns coordinates relative to that monitor)
+            if monitor < len(sct.monitors):
+                screenshot_gray = self._grab_gray(sct, sct.monitors[monitor])
+            else:
+                logger.warning(f"Monitor {monitor} not found, using default")
+                # Primary monitor, which is what pyautogui.screenshot() captured here
+                screenshot_gray = self._grab_gray(sct, sct.monitors[1])
 
             # Perform template matching
-            result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+            max_val, max_loc, found = self._find_match(
+                screenshot_gray, template, coarse, confidence, auto_confidence
+            )
 
-            if max_val >= confidence:
+            if found:
                 # Get center of the found template
                 template_h, template_w = template.shape
                 center_x = max_loc[0] + template_w // 2
@@ -152,30 +485,66 @@ class ScreenshotAnalyzer:
             else:
                 return None
 
-    def get_monitor_thumbnails(self, max_width: int = 200) -> List[Image.Image]:
+    def _monitor_thumbnail(
+        self,
+        mon: Dict[str, int],
+        max_width: int,
+        resample: Image.Resampling
+    ) -> Image.Image:
         """
-        Capture thumbnails of all monitors.
+        Capture one monitor as a thumbnail, using the calling thread's capture handle.
 
         Args:
+            mon: Monitor dictionary with 'left', 'top', 'width', 'height'
             max_width: Maximum width for thumbnail (height scaled proportionally)
+            resample: Resampling filter for the final resize
 
         Returns:
-            List of PIL Image thumbnails
+            PIL Image thumbnail
+        """
+        shot = self._get_sct().grab(mon)
+
+        # Nearest-neighbour decimate the raw BGRA buffer with a stride slice,
+        # which also reorders it to RGB, instead of converting and resizing
+        # the full-resolution frame
+        frame = np.frombuffer(shot.bgra, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        stride = max(1, shot.width // max_width)
+        thumbnail = Image.fromarray(np.ascontiguousarray(frame[::stride, ::stride, 2::-1]))
+
+        # Finish with a cheap resize of the already small image
+        width, height = thumbnail.size
+        if width > max_width:
+            new_height = max(1, int(height * max_width / width))
+            thumbnail = thumbnail.resize((max_width, new_height), resample)
+        return thumbnail
+
+    def get_monitor_thumbnails(
+        self,
+        max_width: int = 200,
+        resample: Image.Resampling = Image.Resampling.BILINEAR
+    ) -> List[Image.Image]:
         """
-        thumbnails: List[Image.Image] = []
-        monitors = self.get_monitors()
+        Capture thumbnails of all monitors.
 
-        for i, mon in enumerate(monitors):
-            # Capture the monitor
-            screenshot = self.capture_screenshot(monitor=i+1)
+        Args:
+            max_width: Maximum width for thumbnail (height scaled proportionally)
+            resample: Resampling filter; bilinear is much cheaper than Lanczos
+                and looks the same at thumbnail size
 
-            # Calculate thumbnail size maintaining aspect ratio
-            width, height = screenshot.size
-            scale = max_width / width
-            new_height = int(height * scale)
+        Returns:
+            List of PIL Image thumbnails
+        """
+        # Thumbnails are the explicit refresh point for the cached layout
+        sct = self._get_sct(fresh=True)
+        self._monitors_cache = sct.monitors[1:]  # Skip the first one (combined screen)
 
-            # Resize to thumbnail
-            thumbnail = screenshot.resize((max_width, new_height), Image.Resampling.LANCZOS)
-            thumbnails.append(thumbnail)
+        if len(self._monitors_cache) == 1:
+            return [self._monitor_thumbnail(self._monitors_cache[0], max_width, resample)]
 
-        return thumbnails
+        # Each worker captures with its own thread's mss handle
+        executor = self._get_scan_executor()
+        futures = [
+            executor.submit(self._monitor_thumbnail, mon, max_width, resample)
+            for mon in self._monitors_cache
+        ]
+        return [future.result() for future in futures]